@@ -62,6 +62,11 @@ def add_standard_args(parser):
     # Interactive testing mode
     parser.add_argument("--interactive", action="store_true", help="enable interactive testing mode")
 
+    # Headless rendering mode
+    parser.add_argument(
+        "--headless", action="store_true", help="render views offscreen without a display, for batch rendering"
+    )
+
     parser.add_argument(
         "--auto-quit", action="store_true", help="automatically quit the application after starting, used for testing"
     )
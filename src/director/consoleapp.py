@@ -5,7 +5,7 @@ import traceback
 import qtpy.QtCore as QtCore
 import qtpy.QtWidgets as QtWidgets
 
-from director import applogic, argutils, viewbehaviors
+from director import applogic, argutils, viewbehaviors, vtk_widget
 from director import objectmodel as om
 from director import visualization as vis
 from director.timercallback import TimerCallback
@@ -18,7 +18,12 @@ class ConsoleApp(object):
     _quitTimer = None
     _testingArgs = None
 
-    def __init__(self):
+    def __init__(self, headless=None):
+        if headless is None:
+            headless = ConsoleApp.getTestingArgs().headless
+        if headless:
+            ConsoleApp.enableHeadless()
+
         # ensure QApplication exists
         self.qapp = self.applicationInstance()
         om.init()
@@ -76,6 +81,23 @@ class ConsoleApp(object):
             app = QtWidgets.QApplication([])
         return app
 
+    @staticmethod
+    def enableHeadless():
+        """
+        Create views with offscreen render windows, so the app runs without a
+        display, for example for batch rendering and video export on CI and
+        render servers.  The object model, showPolyData and screenshot APIs
+        work the same way.  Call this before the QApplication is created so
+        Qt also uses its offscreen platform, unless QT_QPA_PLATFORM is set.
+        """
+        if QtWidgets.QApplication.instance() is None:
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        vtk_widget.setHeadlessEnabled(True)
+
+    @staticmethod
+    def isHeadless():
+        return vtk_widget.isHeadlessEnabled()
+
     @staticmethod
     def processEvents():
         ConsoleApp.applicationInstance().processEvents()
@@ -213,11 +235,9 @@ class ConsoleApp(object):
 
 
 def main():
-    # Ensure QApplication exists
-    ConsoleApp.applicationInstance()
-
     app = ConsoleApp()
-    app.showPythonConsole()
+    if not app.isHeadless():
+        app.showPythonConsole()
     view = app.createView()
     view.show()
     view.raise_()
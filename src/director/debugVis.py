@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 
 import director.vtkAll as vtk
@@ -49,32 +51,37 @@ class DebugData(object):
             polyData = applyTubeFilter(polyData, radius)
         self.addPolyData(polyData, color)
 
+    def addLines(self, p1s, p2s, radius=0.0, colors=[1, 1, 1]):
+        """Add N line segments from p1s[i] to p2s[i] as a single input.
+
+        colors is a single RGB color or an (N, 3) array of colors.
+        """
+        p1s = np.asarray(p1s, dtype=np.float64).reshape(-1, 3)
+        p2s = np.asarray(p2s, dtype=np.float64).reshape(-1, 3)
+        if len(p1s) != len(p2s):
+            raise ValueError("p1s and p2s must have the same length")
+        numberOfLines = len(p1s)
+        if not numberOfLines:
+            return
+
+        points = np.stack([p1s, p2s], axis=1)
+        polyData = _instancePolyData(points, "lines", np.array([0, 2]), np.array([0, 1]))
+        _addInstanceColors(polyData, colors, numberOfLines, 2)
+        if radius > 0.0:
+            polyData = applyTubeFilter(polyData, radius)
+        self.addPolyData(polyData, color=None)
+
     def addPolyLine(self, points, isClosed=False, radius=0.0, color=[1, 1, 1]):
         """Add a polyline from a list of points."""
         points = np.array(points, dtype=np.float64)
-        vtkPoints = vnp.getVtkPointsFromNumpy(points)
-
-        # Create polyline cell
-        polyLine = vtk.vtkPolyLine()
-        numPoints = vtkPoints.GetNumberOfPoints()
-        polyLine.GetPointIds().SetNumberOfIds(numPoints)
-        for i in range(numPoints):
-            polyLine.GetPointIds().SetId(i, i)
-
-        # Create polyData
-        polyData = vtk.vtkPolyData()
-        polyData.SetPoints(vtkPoints)
-        polyData.Allocate(1, 1)
-        polyData.InsertNextCell(polyLine.GetCellType(), polyLine.GetPointIds())
-
-        # Close the polyline if requested
+        polyData = vnp.numpyToPolyData(points, createVertexCells=False, copy=True)
+
+        # Create polyline cell, repeating the first point to close the loop if requested
+        numPoints = len(points)
+        ids = np.arange(numPoints)
         if isClosed and numPoints > 2:
-            polyLineClosed = vtk.vtkPolyLine()
-            polyLineClosed.GetPointIds().SetNumberOfIds(numPoints + 1)
-            for i in range(numPoints):
-                polyLineClosed.GetPointIds().SetId(i, i)
-            polyLineClosed.GetPointIds().SetId(numPoints, 0)  # Close the loop
-            polyData.InsertNextCell(polyLineClosed.GetCellType(), polyLineClosed.GetPointIds())
+            ids = np.append(ids, 0)
+        vnp.setPolyDataCells(polyData, "polylines", offsets=[0, len(ids)], connectivity=ids)
 
         if radius > 0:
             polyData = applyTubeFilter(polyData, radius)
@@ -97,6 +104,30 @@ class DebugData(object):
             polyData = applyTubeFilter(polyData, tubeRadius)
         self.addPolyData(polyData, color=None)
 
+    def addFrames(self, frames, scale, tubeRadius=0.0):
+        """Add an axes triad for each frame as a single input.
+
+        frames is a list of vtkTransform or an (N, 4, 4) array of homogeneous
+        transforms.
+        """
+        matrices = _asMatrixArray(frames)
+        if not len(matrices):
+            return
+        origins = matrices[:, :3, 3]
+        axes = np.swapaxes(matrices[:, :3, :3], 1, 2) * scale
+        points = np.empty((len(matrices), 6, 3))
+        points[:, 0::2] = origins[:, None, :]
+        points[:, 1::2] = origins[:, None, :] + axes
+
+        polyData = _instancePolyData(points, "lines", np.array([0, 2, 4, 6]), np.arange(6))
+        colors = np.array(
+            [[255, 0, 0], [255, 0, 0], [0, 255, 0], [0, 255, 0], [0, 0, 255], [0, 0, 255]], dtype=np.uint8
+        )
+        vnp.addNumpyToVtk(polyData, np.tile(colors, (len(matrices), 1)), "RGB255")
+        if tubeRadius:
+            polyData = applyTubeFilter(polyData, tubeRadius)
+        self.addPolyData(polyData, color=None)
+
     def addCircle(self, origin, normal, radius, color=[1, 1, 1], fill=False):
         self.addCone(origin, normal, radius, height=0, color=color, fill=fill)
 
@@ -131,7 +162,10 @@ class DebugData(object):
         if headLength is None:
             headLength = headRadius
         normal = np.array(end) - np.array(start)
-        normal = normal / np.linalg.norm(normal)
+        length = np.linalg.norm(normal)
+        if not length:
+            return
+        normal = normal / length
         if startHead:
             start = np.array(start) + headLength * normal
         if endHead:
@@ -142,6 +176,60 @@ class DebugData(object):
         if endHead:
             self.addCone(origin=end, normal=normal, radius=headRadius, height=headLength, color=color, fill=True)
 
+    def addArrows(
+        self,
+        starts,
+        ends,
+        headRadius=0.05,
+        headLength=None,
+        tubeRadius=0.01,
+        colors=[1, 1, 1],
+        startHead=False,
+        endHead=True,
+    ):
+        """Add N arrows from starts[i] to ends[i], see addArrow().
+
+        The shafts are added with addLines() and the heads are instanced
+        from a single cone template.  Zero length arrows have no direction
+        and are skipped.
+        """
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends must have the same length")
+        normals = ends - starts
+        lengths = np.linalg.norm(normals, axis=1)
+        valid = lengths > 0
+        if not valid.all():
+            starts, ends, normals, lengths = starts[valid], ends[valid], normals[valid], lengths[valid]
+            if np.ndim(colors) == 2:
+                colors = np.asarray(colors)[valid]
+        if not len(starts):
+            return
+        if headLength is None:
+            headLength = headRadius
+        normals /= lengths[:, None]
+        if startHead:
+            starts = starts + headLength * normals
+        if endHead:
+            ends = ends - headLength * normals
+        self.addLines(starts, ends, radius=tubeRadius, colors=colors)
+
+        heads = []
+        if startHead:
+            heads.append((starts, -normals))
+        if endHead:
+            heads.append((ends, normals))
+        for origins, directions in heads:
+            templatePoints, offsets, connectivity = _coneTemplate(32)
+            # The cone template points along +x with its center at the origin
+            basis = _orthonormalBasis(directions) * np.array([headLength, headRadius, headRadius])[None, None, :]
+            centers = origins + directions * headLength * 0.5
+            points = np.einsum("nij,pj->npi", basis, templatePoints) + centers[:, None, :]
+            polyData = _instancePolyData(points, "polys", offsets, connectivity)
+            _addInstanceColors(polyData, colors, len(origins), len(templatePoints))
+            self.addPolyData(polyData, color=None)
+
     def addSphere(self, center, radius=0.05, color=[1, 1, 1], resolution=24):
         sphere = vtk.vtkSphereSource()
         sphere.SetCenter(center)
@@ -151,6 +239,28 @@ class DebugData(object):
         sphere.Update()
         self.addPolyData(sphere.GetOutput(), color)
 
+    def addSpheres(self, centers, radii=0.05, colors=[1, 1, 1], resolution=24):
+        """Add N spheres as a single input.
+
+        radii is a single radius or N radii, and colors is a single RGB color
+        or an (N, 3) array of colors.  The spheres are instanced from one
+        template so no VTK source runs per sphere.
+        """
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+        numberOfSpheres = len(centers)
+        if not numberOfSpheres:
+            return
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (numberOfSpheres,))
+
+        templatePoints, offsets, connectivity = _sphereTemplate(resolution)
+        points = centers[:, None, :] + radii[:, None, None] * templatePoints[None, :, :]
+        polyData = _instancePolyData(points, "polys", offsets, connectivity)
+        normals = vnp.getVtkFromNumpy(np.ascontiguousarray(np.tile(templatePoints, (numberOfSpheres, 1))))
+        normals.SetName("Normals")
+        polyData.GetPointData().SetNormals(normals)
+        _addInstanceColors(polyData, colors, numberOfSpheres, len(templatePoints))
+        self.addPolyData(polyData, color=None)
+
     def addCube(self, dimensions, center, color=[1, 1, 1], subdivisions=0):
         bmin = np.array(center) - np.array(dimensions) / 2.0
         bmax = np.array(center) + np.array(dimensions) / 2.0
@@ -239,17 +349,9 @@ class DebugData(object):
         self.addPolyData(transformFilter.GetOutput(), color)
 
     def addPolygon(self, points, color=[1, 1, 1]):
-        points = vnp.getVtkPointsFromNumpy(np.array(points, dtype=np.float64))
-        polygon = vtk.vtkPolygon()
-        polygon.GetPointIds().SetNumberOfIds(points.GetNumberOfPoints())
-
-        for i in range(points.GetNumberOfPoints()):
-            polygon.GetPointIds().SetId(i, i)
-
-        polyData = vtk.vtkPolyData()
-        polyData.SetPoints(points)
-        polyData.Allocate(1, 1)
-        polyData.InsertNextCell(polygon.GetCellType(), polygon.GetPointIds())
+        points = np.array(points, dtype=np.float64)
+        polyData = vnp.numpyToPolyData(points, createVertexCells=False, copy=True)
+        vnp.setPolyDataCells(polyData, "polys", cells=np.arange(len(points)).reshape(1, -1))
         self.addPolyData(polyData, color)
 
     def getPolyData(self):
@@ -258,6 +360,69 @@ class DebugData(object):
         return shallowCopy(self.append.GetOutput())
 
 
+def _instancePolyData(points, cellType, offsets, connectivity):
+    """Build one polydata from (N, P, 3) instance points sharing the cells of a P point template."""
+    numberOfInstances, pointsPerInstance = points.shape[:2]
+    allOffsets, allConnectivity = vnp.tileCells(offsets, connectivity, numberOfInstances, pointsPerInstance)
+    polyData = vnp.numpyToPolyData(points.reshape(-1, 3), createVertexCells=False, copy=True)
+    vnp.setPolyDataCells(polyData, cellType, offsets=allOffsets, connectivity=allConnectivity)
+    return polyData
+
+
+def _addInstanceColors(polyData, colors, numberOfInstances, pointsPerInstance):
+    """Add an RGB255 array from one color or one color per instance."""
+    colors = np.broadcast_to(np.asarray(colors, dtype=np.float64).reshape(-1, 3), (numberOfInstances, 3))
+    colorArray = np.repeat(np.round(colors * 255).astype(np.uint8), pointsPerInstance, axis=0)
+    vnp.addNumpyToVtk(polyData, colorArray, "RGB255")
+
+
+def _asMatrixArray(frames):
+    """Return an (N, 4, 4) array from a list of vtkTransform or an array of matrices."""
+    if isinstance(frames, np.ndarray):
+        return frames.reshape(-1, 4, 4)
+    return np.array([transformUtils.getNumpyFromTransform(frame) for frame in frames]).reshape(-1, 4, 4)
+
+
+def _orthonormalBasis(directions):
+    """Return (N, 3, 3) rotations whose first columns are the unit directions."""
+    helper = np.zeros_like(directions)
+    useX = np.abs(directions[:, 2]) > 0.9
+    helper[useX, 0] = 1.0
+    helper[~useX, 2] = 1.0
+    yaxis = np.cross(directions, helper)
+    yaxis /= np.linalg.norm(yaxis, axis=1)[:, None]
+    zaxis = np.cross(directions, yaxis)
+    return np.stack([directions, yaxis, zaxis], axis=2)
+
+
+def _templateFromSource(source):
+    source.Update()
+    polyData = source.GetOutput()
+    points = vnp.getNumpyFromVtk(polyData, "Points").astype(np.float64)
+    offsets, connectivity = vnp.getNumpyFromVtkCellArray(polyData.GetPolys())
+    return points, offsets.copy(), connectivity.copy()
+
+
+@functools.lru_cache(maxsize=8)
+def _sphereTemplate(resolution):
+    """Return the points, offsets and connectivity of a unit sphere."""
+    sphere = vtk.vtkSphereSource()
+    sphere.SetThetaResolution(resolution)
+    sphere.SetPhiResolution(resolution)
+    sphere.SetRadius(1.0)
+    return _templateFromSource(sphere)
+
+
+@functools.lru_cache(maxsize=8)
+def _coneTemplate(resolution):
+    """Return the points, offsets and connectivity of a unit cone along +x."""
+    cone = vtk.vtkConeSource()
+    cone.SetRadius(1.0)
+    cone.SetHeight(1.0)
+    cone.SetResolution(resolution)
+    return _templateFromSource(cone)
+
+
 def applyTubeFilter(polyData, radius, numberOfSides=24):
     tube = vtk.vtkTubeFilter()
     tube.SetRadius(radius)
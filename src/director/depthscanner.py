@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from qtpy import QtCore
 
@@ -13,93 +15,152 @@ from director.vtk_widget import VTKWidget
 
 def _vtk_matrix_to_numpy(vtk_matrix):
     """Convert a vtkMatrix4x4 to a numpy 4x4 array."""
-    m = np.zeros((4, 4), dtype=np.float32)
-    for i in range(4):
-        for j in range(4):
-            m[i, j] = vtk_matrix.GetElement(i, j)
-    return m
+    return np.array(vtk_matrix.GetData()).reshape(4, 4)
 
 
-def depth_buffer_to_depth_image(depth_buffer, color_buffer, camera):
-    """
-    Convert OpenGL depth buffer to depth image and point cloud.
+def get_depth_projection_matrix(camera, width, height):
+    """Return the camera projection matrix that maps depth to the [0, 1] z-buffer range."""
+    return _vtk_matrix_to_numpy(camera.GetProjectionTransformMatrix(width / height, 0, 1))
 
-    This is a pure Python/numpy implementation of the C++ vtkDepthImageUtils::DepthBufferToDepthImage.
 
-    Args:
-        depth_buffer: vtkImageData containing the OpenGL depth buffer (z values in [0, 1])
-        color_buffer: vtkImageData containing the RGB color buffer
-        camera: vtkCamera used to render the scene
+def _is_perspective_projection(projection_matrix):
+    return np.array_equal(projection_matrix[3], [0.0, 0.0, -1.0, 0.0])
 
-    Returns:
-        depth_image: numpy array of depth values in camera space (positive distance from camera)
-        points: numpy array of 3D points in camera space, shape (N, 3)
-        colors: numpy array of RGB colors, shape (N, 3), dtype uint8
+
+class DepthRayGrid:
+    """
+    Cache of per-pixel values used to convert a depth buffer to camera space.
+
+    For a perspective projection the camera space point of a pixel is its ray
+    direction scaled by the pixel depth.  The ray directions depend only on
+    the view size and the x/y rows of the projection matrix (view angle,
+    aspect ratio and window center), so they are computed once and reused
+    until one of those changes.  Clipping range changes only affect the
+    per-frame depth values.
     """
-    # Get image dimensions
-    dims = depth_buffer.GetDimensions()
-    width, height = dims[0], dims[1]
-    aspect_ratio = width / height
 
-    # Extract depth and color data as numpy arrays
-    depth_data = vnp.getNumpyImageFromVtk(depth_buffer, flip=False).astype(np.float32)
-    color_data = vnp.getNumpyImageFromVtk(color_buffer, flip=False)
+    def __init__(self):
+        self.build_count = 0
+        self._ndc = None
+        self._rays = None
+
+    def get_ndc(self, width, height):
+        """Return the normalized device x/y coordinates of each pixel as a (2, N) array."""
+        cached = self._ndc
+        if cached is not None and cached[0] == (width, height):
+            return cached[1]
+        xx, yy = np.meshgrid(np.arange(width, dtype=np.float64), np.arange(height, dtype=np.float64))
+        ndc = np.stack([2.0 * xx.ravel() / width - 1.0, 2.0 * yy.ravel() / height - 1.0])
+        self._ndc = ((width, height), ndc)
+        return ndc
+
+    def get_rays(self, width, height, projection_matrix):
+        """
+        Return the camera space x/y of each pixel ray at unit depth as a (2, N)
+        array, for a perspective projection_matrix.
+        """
+        intrinsics = projection_matrix[:2, :3]
+        cached = self._rays
+        # VTK recomputes these rows from the clipping range, compare with a
+        # tolerance so clipping range changes do not invalidate the cache
+        if cached is not None and cached[0] == (width, height) and np.allclose(cached[1], intrinsics, rtol=1e-12):
+            return cached[2]
+        ndc = self.get_ndc(width, height)
+        # x_clip = ndc * w_clip with w_clip = depth, solve the x/y rows for the
+        # camera x/y at depth 1, the translation column is applied per frame
+        rays = np.linalg.solve(projection_matrix[:2, :2], ndc + projection_matrix[:2, 2:3])
+        self._rays = ((width, height), intrinsics.copy(), rays)
+        self.build_count += 1
+        return rays
+
+    def clear(self):
+        self._ndc = None
+        self._rays = None
+
+
+_default_ray_grid = DepthRayGrid()
+
+
+def depth_arrays_to_depth_image(depth_data, color_data, projection_matrix, ray_grid=None):
+    """
+    Convert depth buffer and color buffer arrays to a depth image and point cloud.
 
-    # Get camera projection matrix and compute its inverse
-    projection_matrix = _vtk_matrix_to_numpy(camera.GetProjectionTransformMatrix(aspect_ratio, 0, 1))
-    viewport_to_camera = np.linalg.inv(projection_matrix)
+    This is the numpy part of depth_buffer_to_depth_image.  It does not touch
+    any VTK objects, so it can run on a worker thread.
 
-    # Create coordinate grids for all pixels
-    x_coords = np.arange(width, dtype=np.float32)
-    y_coords = np.arange(height, dtype=np.float32)
-    xx, yy = np.meshgrid(x_coords, y_coords)
+    Args:
+        depth_data: (height, width) array of OpenGL depth buffer values in [0, 1]
+        color_data: (height, width, 3) array of RGB colors
+        projection_matrix: 4x4 projection matrix from get_depth_projection_matrix
+        ray_grid: DepthRayGrid used to cache per-pixel rays, defaults to a
+            module level grid
 
-    # Flatten arrays for vectorized processing
-    xx_flat = xx.ravel()
-    yy_flat = yy.ravel()
+    Returns:
+        Same as depth_buffer_to_depth_image
+    """
+    ray_grid = ray_grid or _default_ray_grid
+    height, width = depth_data.shape[:2]
     z_flat = depth_data.ravel()
 
     # Create mask for valid depth values (z != 1.0 indicates not background)
     valid_mask = z_flat != 1.0
 
-    # Convert screen coordinates to normalized device coordinates [-1, 1]
-    ndc_x = 2.0 * xx_flat / width - 1.0
-    ndc_y = 2.0 * yy_flat / height - 1.0
-
-    # Build homogeneous coordinates in NDC space
-    ones = np.ones_like(z_flat)
-    pts_ndc = np.stack([ndc_x, ndc_y, z_flat, ones], axis=0)  # Shape: (4, N)
-
-    # Transform from NDC to camera space
-    pts_camera = viewport_to_camera @ pts_ndc  # Shape: (4, N)
-
-    # Perspective divide (homogeneous to Cartesian)
-    w = pts_camera[3, :]
-    pts_camera = pts_camera[:3, :] / w
-
-    # Compute depth as -z in camera space (camera looks along -z axis)
-    depth_values = -pts_camera[2, :]
+    if _is_perspective_projection(projection_matrix):
+        # Invert the z row of the projection, z_ndc * depth = P22 * -depth + P23
+        with np.errstate(divide="ignore", invalid="ignore"):
+            depth_values = projection_matrix[2, 3] / (z_flat + projection_matrix[2, 2])
+        rays = ray_grid.get_rays(width, height, projection_matrix)
+        offset = np.linalg.solve(projection_matrix[:2, :2], -projection_matrix[:2, 3])
+        valid_depth = depth_values[valid_mask]
+        pts_camera = np.empty((3, len(valid_depth)))
+        np.multiply(rays[:, valid_mask], valid_depth, out=pts_camera[:2])
+        pts_camera[:2] += offset[:, None]
+        pts_camera[2] = -valid_depth
+    else:
+        # General inverse projection, used for parallel projection
+        ndc = ray_grid.get_ndc(width, height)
+        pts_ndc = np.vstack([ndc[:, valid_mask], z_flat[valid_mask], np.ones(np.count_nonzero(valid_mask))])
+        pts_camera = np.linalg.inv(projection_matrix) @ pts_ndc
+        pts_camera = pts_camera[:3] / pts_camera[3]
+        depth_values = np.empty(len(z_flat))
+        depth_values[valid_mask] = -pts_camera[2]
 
     # Set invalid depths to NaN
-    depth_image = depth_values.copy()
+    depth_image = depth_values.astype(np.float32)
     depth_image[~valid_mask] = np.nan
     depth_image = depth_image.reshape(height, width)
 
-    # Extract valid points and colors
-    valid_points = pts_camera[:, valid_mask].T  # Shape: (N_valid, 3)
-    valid_colors = color_data.reshape(-1, 3)[valid_mask]  # Shape: (N_valid, 3)
+    valid_colors = color_data.reshape(-1, 3)[valid_mask]
 
-    return depth_image, valid_points.astype(np.float32), valid_colors
+    return depth_image, pts_camera.T.astype(np.float32), valid_colors
 
 
-def computeDepthImageAndPointCloud(depthBuffer, colorBuffer, camera):
+def depth_buffer_to_depth_image(depth_buffer, color_buffer, camera, ray_grid=None):
     """
-    Input args are an OpenGL depth buffer and color buffer as vtkImageData objects,
-    and the vtkCamera instance that was used to render the scene.  The function returns
-    returns a depth image and a point cloud as vtkImageData and vtkPolyData.
+    Convert OpenGL depth buffer to depth image and point cloud.
+
+    This is a pure Python/numpy implementation of the C++ vtkDepthImageUtils::DepthBufferToDepthImage.
+
+    Args:
+        depth_buffer: vtkImageData containing the OpenGL depth buffer (z values in [0, 1])
+        color_buffer: vtkImageData containing the RGB color buffer
+        camera: vtkCamera used to render the scene
+        ray_grid: optional DepthRayGrid, see depth_arrays_to_depth_image
+
+    Returns:
+        depth_image: numpy array of depth values in camera space (positive distance from camera)
+        points: numpy array of 3D points in camera space, shape (N, 3)
+        colors: numpy array of RGB colors, shape (N, 3), dtype uint8
     """
-    depth_image_np, points_np, colors_np = depth_buffer_to_depth_image(depthBuffer, colorBuffer, camera)
+    width, height = depth_buffer.GetDimensions()[:2]
+    depth_data = vnp.getNumpyImageFromVtk(depth_buffer, flip=False)
+    color_data = vnp.getNumpyImageFromVtk(color_buffer, flip=False)
+    projection_matrix = get_depth_projection_matrix(camera, width, height)
+    return depth_arrays_to_depth_image(depth_data, color_data, projection_matrix, ray_grid)
 
+
+def depthImageAndPointCloudToVtk(depth_image_np, points_np, colors_np):
+    """Convert the arrays returned by depth_buffer_to_depth_image to vtkImageData and vtkPolyData."""
     # Convert depth image to vtkImageData
     depthImage = vnp.numpyToImageData(depth_image_np, flip=False, vtktype=vtk.VTK_FLOAT)
 
@@ -112,6 +173,15 @@ def computeDepthImageAndPointCloud(depthBuffer, colorBuffer, camera):
     return depthImage, polyData
 
 
+def computeDepthImageAndPointCloud(depthBuffer, colorBuffer, camera):
+    """
+    Input args are an OpenGL depth buffer and color buffer as vtkImageData objects,
+    and the vtkCamera instance that was used to render the scene.  The function returns
+    returns a depth image and a point cloud as vtkImageData and vtkPolyData.
+    """
+    return depthImageAndPointCloudToVtk(*depth_buffer_to_depth_image(depthBuffer, colorBuffer, camera))
+
+
 class DepthScanner:
     def __init__(self, view):
         self.view = view
@@ -147,6 +217,15 @@ class DepthScanner:
         self.updateOnRender = True
         self._updateFunc = None
 
+        # Convert buffers to a point cloud on a worker thread and publish the
+        # result from resultTimer on the main thread
+        self.useWorkerThread = True
+        self.rayGrid = DepthRayGrid()
+        self._executor = None
+        self._future = None
+        self._pendingRequest = None
+        self.resultTimer = TimerCallback(targetFps=60, callback=self._pollConversion)
+
     def getDepthBufferImage(self):
         return self.windowToDepthBuffer.GetOutput()
 
@@ -212,9 +291,76 @@ class DepthScanner:
         self.updateBufferImages()
         self._block = False
 
-        depthImage, polyData = computeDepthImageAndPointCloud(
-            self.getDepthBufferImage(), self.getColorBufferImage(), self.view.camera()
-        )
+        request = self._captureBuffers()
+        if self.useWorkerThread:
+            self._submitConversion(request)
+        else:
+            self._applyConversion(self._convertBuffers(*request))
+
+    def _captureBuffers(self):
+        """Copy the buffer images and projection matrix for conversion off the main thread."""
+        depthBuffer = self.getDepthBufferImage()
+        width, height = depthBuffer.GetDimensions()[:2]
+        depthData = np.array(vnp.getNumpyImageFromVtk(depthBuffer, flip=False))
+        colorData = np.array(vnp.getNumpyImageFromVtk(self.getColorBufferImage(), flip=False))
+        projectionMatrix = get_depth_projection_matrix(self.view.camera(), width, height)
+        return depthData, colorData, projectionMatrix
+
+    def _convertBuffers(self, depthData, colorData, projectionMatrix):
+        return depth_arrays_to_depth_image(depthData, colorData, projectionMatrix, self.rayGrid)
+
+    def _submitConversion(self, request):
+        # Only the most recent frame waits behind a conversion in progress
+        if self._future is not None:
+            self._pendingRequest = request
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DepthScanner")
+        self._future = self._executor.submit(self._convertBuffers, *request)
+        if not self.resultTimer.isActive():
+            self.resultTimer.start()
+
+    def _pollConversion(self):
+        if self._future is None:
+            return False
+        if not self._future.done():
+            return
+        future, self._future = self._future, None
+        if self._pendingRequest is not None:
+            request, self._pendingRequest = self._pendingRequest, None
+            self._submitConversion(request)
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Error: Depth scanner conversion failed: {e}")
+        else:
+            self._applyConversion(result)
+        if self._future is None:
+            return False
+
+    def waitForConversion(self):
+        """Block until queued conversions finish and their results are applied."""
+        while self._future is not None:
+            self._future.result()
+            self._pollConversion()
+        self.resultTimer.stop()
+
+    def shutdown(self):
+        """Stop updating and release the conversion worker thread."""
+        self.updateOnRender = False
+        self.singleShotTimer.stop()
+        self.resultTimer.stop()
+        if self.renderObserver:
+            self.view.renderWindow().RemoveObserver(self.renderObserver)
+            self.renderObserver = None
+        self._future = None
+        self._pendingRequest = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _applyConversion(self, result):
+        depthImage, polyData = depthImageAndPointCloudToVtk(*result)
 
         self.depthScaleFilter.SetInputData(depthImage)
         self.depthScaleFilter.Update()
@@ -379,7 +525,9 @@ def main(globalsDict=None):
 
     depthScanner = DepthScanner(view)
     depthScanner.update()
+    depthScanner.waitForConversion()
     depthScanner.addViewsToDock(app.app)
+    app.app.applicationInstance().aboutToQuit.connect(depthScanner.shutdown)
 
     # add some test data
     def addTestData():
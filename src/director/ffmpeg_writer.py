@@ -1,9 +1,15 @@
 """FFMpegWriter class for encoding video from numpy RGB frames."""
 
+import queue
 import subprocess
+import threading
+import time
+from dataclasses import dataclass
 
 import numpy as np
 
+BACKPRESSURE_POLICIES = ("block", "drop", "adaptive")
+
 
 class FFMpegWriter:
     """Writer for encoding video files using ffmpeg from numpy RGB frames."""
@@ -115,10 +121,9 @@ class FFMpegWriter:
         if not frame.flags["C_CONTIGUOUS"]:
             frame = np.ascontiguousarray(frame)
 
-        # Write frame to stdin
+        # Write frame to stdin straight from the array memory
         try:
-            self.process.stdin.write(frame.tobytes())
-            self.process.stdin.flush()
+            self._write_all(memoryview(frame).cast("B"))
         except BrokenPipeError:
             # Process may have terminated due to error
             stderr_output = self.process.stderr.read().decode("utf-8", errors="ignore")
@@ -126,6 +131,11 @@ class FFMpegWriter:
         except Exception as e:
             raise RuntimeError(f"Error writing frame to ffmpeg: {e}")
 
+    def _write_all(self, data):
+        # stdin is unbuffered, so a write may accept only part of the data
+        while data:
+            data = data[self.process.stdin.write(data) :]
+
     def close(self):
         """Close the writer and finalize the video file."""
         if self._closed:
@@ -161,3 +171,168 @@ class FFMpegWriter:
         """Context manager exit - ensures close is called."""
         self.close()
         return False
+
+
+@dataclass
+class FrameWriterStats:
+    """Counters reported by AsyncFrameWriter.get_stats()."""
+
+    frames_submitted: int = 0
+    frames_written: int = 0
+    frames_dropped: int = 0
+    queue_depth: int = 0
+    mean_latency: float = 0.0
+    max_latency: float = 0.0
+
+
+class AsyncFrameWriter:
+    """
+    Write frames to another writer, such as FFMpegWriter, on a background thread.
+
+    Frames are copied into buffers from a fixed size pool and queued for the
+    writer thread, so a slow encoder delays the writer thread instead of the
+    caller.  The buffer is returned to the pool once it has been written.
+    When all buffers are in use the policy decides what happens:
+
+        block: wait for a free buffer, no frames are dropped
+        drop: drop the frame immediately
+        adaptive: wait up to adaptive_timeout seconds, then drop the frame
+
+    Frames can be captured straight into a pool buffer with acquire_buffer()
+    and submit(), or copied from an existing array with write_frame().
+    """
+
+    def __init__(self, writer, width, height, queue_size=8, policy="adaptive", adaptive_timeout=None):
+        """
+        Args:
+            writer: Object with write_frame(frame) and close() methods
+            width: Frame width in pixels
+            height: Frame height in pixels
+            queue_size: Number of frame buffers in the pool
+            policy: Backpressure policy, one of BACKPRESSURE_POLICIES
+            adaptive_timeout: Wait time for the adaptive policy, defaults to
+                one frame interval at the writer framerate
+        """
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        self.writer = writer
+        self.width = width
+        self.height = height
+        self.policy = policy
+        if adaptive_timeout is None:
+            adaptive_timeout = 1.0 / getattr(writer, "framerate", 30.0)
+        self.adaptive_timeout = adaptive_timeout
+        self.error = None
+        self._closed = False
+        self._stats = FrameWriterStats()
+        self._total_latency = 0.0
+        self._stats_lock = threading.Lock()
+        self._free_buffers = queue.Queue()
+        for _ in range(queue_size):
+            self._free_buffers.put(np.empty((height, width, 3), dtype=np.uint8))
+        self._pending = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="AsyncFrameWriter", daemon=True)
+        self._thread.start()
+
+    def _check_state(self):
+        if self._closed:
+            raise RuntimeError("AsyncFrameWriter is closed. Cannot write more frames.")
+        if self.error is not None:
+            raise RuntimeError(f"Error writing frame: {self.error}")
+
+    def acquire_buffer(self, block=False):
+        """
+        Return a free (height, width, 3) uint8 buffer to capture a frame into,
+        or None if the frame should be dropped under the backpressure policy.
+        With block=True wait for a free buffer whatever the policy, for
+        callers that must not drop frames.  The buffer must be passed to
+        submit() or release_buffer().
+        """
+        self._check_state()
+        if block:
+            return self._free_buffers.get()
+        try:
+            if self.policy == "drop":
+                return self._free_buffers.get_nowait()
+            if self.policy == "adaptive":
+                return self._free_buffers.get(timeout=self.adaptive_timeout)
+            return self._free_buffers.get()
+        except queue.Empty:
+            with self._stats_lock:
+                self._stats.frames_dropped += 1
+            return None
+
+    def release_buffer(self, buffer):
+        """Return an acquired buffer to the pool without writing it."""
+        self._free_buffers.put(buffer)
+
+    def submit(self, buffer):
+        """Queue an acquired buffer to be written."""
+        self._check_state()
+        with self._stats_lock:
+            self._stats.frames_submitted += 1
+        self._pending.put((buffer, time.perf_counter()))
+
+    def write_frame(self, frame: np.ndarray):
+        """
+        Copy frame into a pool buffer and queue it.  Returns False if the
+        frame was dropped.
+        """
+        if frame.shape != (self.height, self.width, 3):
+            raise ValueError(f"Frame shape {frame.shape} does not match expected ({self.height}, {self.width}, 3)")
+        buffer = self.acquire_buffer()
+        if buffer is None:
+            return False
+        np.copyto(buffer, frame, casting="unsafe")
+        self.submit(buffer)
+        return True
+
+    def get_stats(self):
+        """Return a FrameWriterStats snapshot."""
+        with self._stats_lock:
+            stats = FrameWriterStats(**vars(self._stats))
+        stats.queue_depth = self._pending.qsize()
+        return stats
+
+    def _run(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            buffer, submit_time = item
+            try:
+                if self.error is None:
+                    self.writer.write_frame(buffer)
+            except Exception as e:
+                self.error = e
+            finally:
+                self._free_buffers.put(buffer)
+            latency = time.perf_counter() - submit_time
+            with self._stats_lock:
+                if self.error is None:
+                    self._stats.frames_written += 1
+                    self._total_latency += latency
+                    self._stats.mean_latency = self._total_latency / self._stats.frames_written
+                    self._stats.max_latency = max(self._stats.max_latency, latency)
+                else:
+                    self._stats.frames_dropped += 1
+
+    def close(self):
+        """Write the queued frames, then close the wrapped writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._pending.put(None)
+        self._thread.join()
+        self.writer.close()
+        if self.error is not None:
+            raise RuntimeError(f"Error writing frame: {self.error}")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - ensures close is called."""
+        self.close()
+        return False
@@ -1,48 +1,171 @@
+import time
+
 import numpy as np
 
 import director.objectmodel as om
 from director import vtkAll as vtk
+from director import vtkNumpy as vnp
+from director.timercallback import TimerCallback
 
 
 class FrameTraceVisualizer:
-    def __init__(self, frame):
+    """Draw the path of a FrameItem as a polyline.
+
+    Positions are kept in a fixed size ring buffer so appending a point is
+    O(1) regardless of how long the trace has been running.  The polyline
+    cell is a view into a doubled index array, so the ring never has to be
+    reordered or the cell rebuilt id by id.
+
+    Optional decimation skips positions closer than min_distance to the last
+    traced point, and merges points that continue the last segment within
+    min_angle degrees.  With fade_time > 0 the trace fades out over that many
+    seconds and expired points are dropped.
+    """
+
+    FADE_FPS = 30
+
+    def __init__(self, frame, max_points=10000, min_distance=0.0, min_angle=0.0, fade_time=0.0):
         self.frame = frame
+        self.min_distance = min_distance
+        self.min_angle = min_angle
+        self.fade_time = fade_time
         self.last_position = np.array(frame.transform.GetPosition())
+        self.polyData = None
+        self._start_time = time.monotonic()
+        self._fade_lut = None
+        self._color_callback_id = None
+        self._fade_timer = TimerCallback(targetFps=self.FADE_FPS, callback=self._on_fade_tick)
+        self._allocate(max_points)
         self.callback_id = frame.connectFrameModified(self.on_frame_modified)
 
+    @property
+    def max_points(self):
+        return len(self._points)
+
     def remove(self):
+        self._fade_timer.stop()
         self.frame.disconnectFrameModified(self.callback_id)
-        om.removeFromObjectModel(self._item())
+        item = self._item()
+        if item and self._color_callback_id is not None:
+            item.properties.disconnectPropertyChanged(self._color_callback_id)
+        om.removeFromObjectModel(item)
+
+    def get_points(self):
+        """Return a copy of the traced points, oldest first."""
+        return self._ordered(self._points)
+
+    def get_number_of_points(self):
+        return self._count
+
+    def set_max_points(self, max_points):
+        """Resize the ring buffer, keeping the most recent points."""
+        if max_points == self.max_points:
+            return
+        points = self._ordered(self._points)[-max_points:]
+        times = self._ordered(self._times)[-max_points:]
+        self._allocate(max_points)
+        self._count = len(points)
+        self._head = self._count % max_points
+        self._points[: self._count] = points
+        self._times[: self._count] = times
+        item = self._item()
+        if item:
+            self._reset_polydata()
+            item.setPolyData(self.polyData)
+            self._update_fade(item)
+
+    def set_decimation(self, min_distance, min_angle):
+        self.min_distance = min_distance
+        self.min_angle = min_angle
+
+    def set_fade_time(self, fade_time):
+        self.fade_time = fade_time
+        item = self._item()
+        if item:
+            self._update_fade(item)
+            self._update_item()
+
+    def _allocate(self, max_points):
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2, got %d" % max_points)
+        self._points = np.zeros((max_points, 3))
+        self._times = np.zeros(max_points)
+        self._ring_ids = np.tile(np.arange(max_points, dtype=vnp._idTypeDtype()), 2)
+        self._offsets = np.zeros(2, dtype=vnp._idTypeDtype())
+        self._head = 0
+        self._count = 0
+
+    def _ordered(self, buffer):
+        start = (self._head - self._count) % len(buffer)
+        return buffer[self._ring_ids[start : start + self._count]]
+
+    def _index(self, age):
+        """Return the ring index of the point age steps back from the newest."""
+        return (self._head - 1 - age) % len(self._points)
 
     def _reset(self):
-        self.points = vtk.vtkPoints()
-        self.points.SetDataTypeToDouble()
-        self.points.InsertNextPoint(self.last_position)
-        self.cells = vtk.vtkCellArray()
-        self.polyData = vtk.vtkPolyData()
-        self.polyData.SetPoints(self.points)
-        self.polyData.SetLines(self.cells)
+        self._head = 0
+        self._count = 0
+        self._append(self.last_position)
+        self._reset_polydata()
+
+    def _reset_polydata(self):
+        self.polyData = vnp.numpyToPolyData(self._points, {"trace_time": self._times}, createVertexCells=False)
         self._update_polyline()
 
     def _update_polyline(self):
-        """Rebuild the polyline cell with all current points."""
-        numberOfPoints = self.points.GetNumberOfPoints()
-        if numberOfPoints < 1:
-            return
+        """Point the polyline cell at the valid span of the ring buffer."""
+        start = (self._head - self._count) % len(self._points)
+        self._offsets[1] = self._count
+        self.cells = vnp.setPolyDataCells(
+            self.polyData, "polylines", offsets=self._offsets, connectivity=self._ring_ids[start : start + self._count]
+        )
 
-        polyline = vtk.vtkPolyLine()
-        polyline.GetPointIds().SetNumberOfIds(numberOfPoints)
-        for i in range(numberOfPoints):
-            polyline.GetPointIds().SetId(i, i)
+    def _now(self):
+        return time.monotonic() - self._start_time
 
-        self.cells.Reset()
-        self.cells.InsertNextCell(polyline)
+    def _append(self, point):
+        self._points[self._head] = point
+        self._times[self._head] = self._now()
+        self._head = (self._head + 1) % len(self._points)
+        self._count = min(self._count + 1, len(self._points))
+
+    def _replace_last(self, point):
+        last = self._index(0)
+        self._points[last] = point
+        self._times[last] = self._now()
 
     def _add_point(self, point):
-        self.points.InsertNextPoint(point)
-        self._update_polyline()
-        self.points.Modified()
-        self.cells.Modified()
+        last = self._points[self._index(0)]
+        if self.min_distance > 0 and np.linalg.norm(point - last) < self.min_distance:
+            return False
+
+        if self.min_angle > 0 and self._count >= 2:
+            previous_direction = last - self._points[self._index(1)]
+            direction = point - last
+            norms = np.linalg.norm(previous_direction) * np.linalg.norm(direction)
+            if norms > 0:
+                cos_angle = np.clip(np.dot(previous_direction, direction) / norms, -1.0, 1.0)
+                if np.degrees(np.arccos(cos_angle)) < self.min_angle:
+                    self._replace_last(point)
+                    return True
+
+        self._append(point)
+        return True
+
+    def _drop_expired(self):
+        """Drop points older than the fade time from the tail of the ring."""
+        cutoff = self._now() - self.fade_time
+        dropped = False
+        while self._count > 1 and self._times[self._index(self._count - 1)] < cutoff:
+            self._count -= 1
+            dropped = True
+        return dropped
+
+    def _mark_modified(self):
+        self.polyData.GetPoints().GetData().Modified()
+        self.polyData.GetPoints().Modified()
+        self.polyData.GetPointData().GetArray("trace_time").Modified()
         self.polyData.Modified()
 
     def _name(self):
@@ -52,6 +175,63 @@ class FrameTraceVisualizer:
     def _item(self):
         return self.frame.findChild(self._name())
 
+    def _update_item(self):
+        item = self._item()
+        if not item:
+            return
+        self._update_polyline()
+        self._mark_modified()
+        item._renderAllViews()
+
+    def _update_fade(self, item):
+        if self.fade_time <= 0:
+            self._fade_timer.stop()
+            if self._color_callback_id is not None:
+                item.properties.disconnectPropertyChanged(self._color_callback_id)
+                self._color_callback_id = None
+            item.colorBy(None)
+            return
+
+        if self._color_callback_id is None:
+            self._color_callback_id = item.properties.connectPropertyChanged(self._on_item_property_changed)
+        self._fade_lut = self._create_fade_lut(item.getProperty("Color"))
+        self._update_fade_range()
+        item.colorBy("trace_time", lut=self._fade_lut)
+        if not self._fade_timer.isActive():
+            self._fade_timer.start()
+
+    def _create_fade_lut(self, color):
+        numberOfColors = 256
+        table = np.empty((numberOfColors, 4), dtype=np.uint8)
+        table[:, :3] = np.round(np.asarray(color) * 255)
+        table[:, 3] = np.linspace(0, 255, numberOfColors)
+        lut = vtk.vtkLookupTable()
+        lut.SetNumberOfTableValues(numberOfColors)
+        lut.SetTable(vnp.getVtkFromNumpy(table))
+        return lut
+
+    def _update_fade_range(self):
+        now = self._now()
+        self._fade_lut.SetTableRange(now - self.fade_time, now)
+
+    def _on_item_property_changed(self, propertySet, propertyName):
+        if propertyName == "Color" and self.fade_time > 0:
+            self._update_fade(self._item())
+
+    def _on_fade_tick(self):
+        item = self._item()
+        if not item or self.fade_time <= 0:
+            return False
+        self._update_fade_range()
+        if self._drop_expired():
+            self._update_polyline()
+            self._mark_modified()
+        item._renderAllViews()
+        # Once only the newest point is left the frame is stationary, so stop
+        # ticking until it moves again.
+        if self._count <= 1:
+            return False
+
     def on_frame_modified(self, frame):
         position = np.array(frame.transform.GetPosition())
         if np.allclose(position, self.last_position):
@@ -62,8 +242,16 @@ class FrameTraceVisualizer:
             self._reset()
             from director import visualization as vis
 
-            item = vis.showPolyData(self.polyData, self._name(), parent=self.frame)
+            view = self.frame.views[0] if self.frame.views else None
+            item = vis.showPolyData(self.polyData, self._name(), view=view, parent=self.frame)
+            self._color_callback_id = None
+            self._update_fade(item)
 
-        self._add_point(position)
         self.last_position = position
+        if not self._add_point(position):
+            return
+        self._update_polyline()
+        self._mark_modified()
+        if self.fade_time > 0 and not self._fade_timer.isActive():
+            self._fade_timer.start()
         item._renderAllViews()
@@ -64,7 +64,7 @@ def readPlyFile(filename):
     pts[:, 1] = vertex_data["y"]
     pts[:, 2] = vertex_data["z"]
 
-    return vnp.numpyToPolyData(pts)
+    return vnp.numpyToPolyData(pts, copy=True)
 
 
 def readMultiBlock(filename):
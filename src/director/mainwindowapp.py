@@ -763,13 +763,21 @@ class MainWindowAppFactory(object):
         consoleapp.ConsoleApp.registerStartupCallback(restore, priority=100)
 
 
-def construct(**kwargs):
+def construct(headless=None, **kwargs):
     """
     Construct a MainWindowApp using the component factory.
 
     Args:
+        headless: Render views offscreen without a display, see
+            ConsoleApp.enableHeadless.  Defaults to the --headless command
+            line argument.
         **kwargs: Additional fields to pass to component factory
     """
+    if headless is None:
+        headless = consoleapp.ConsoleApp.getTestingArgs().headless
+    if headless:
+        consoleapp.ConsoleApp.enableHeadless()
+
     fact = ComponentFactory()
     fact.register(MainWindowAppFactory)
 
@@ -242,13 +242,16 @@ def draw_tile(x, y, zoom):
         else:
             obj.actor.GetProperty().LightingOff()
 
-    def init_texture():
+    def load_texture():
         download_url(url, filename)
         if os.path.isfile(filename):
-            img = ioUtils.readImage(filename)
-        else:
-            img = get_placeholder_image(x, y, zoom)
-        obj.textures[filename] = img
+            return ioUtils.readImage(filename)
+        return get_placeholder_image(x, y, zoom)
+
+    def on_texture_loaded(future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        obj.textures[filename] = future.result()
         set_texture()
         obj._renderAllViews()
 
@@ -257,7 +260,8 @@ def draw_tile(x, y, zoom):
     else:
         obj.actor.SetTexture(None)
         obj.actor.GetProperty().LightingOn()
-        fields.task_runner.callOnThread(init_texture)
+        task_runner = fields.task_runner
+        task_runner.addDoneCallback(task_runner.callOnThread(load_texture), on_texture_loaded)
 
     return obj
 
@@ -218,7 +218,7 @@ class MeasurementPanel:
 
     def makeSphere(self, position, radius=1.0):
         d = DebugData()
-        d.addSphere(position, radius=radius)
+        d.addSpheres([position], radii=radius)
         return d.getPolyData()
 
     def _createPermanentLine(self, p1, p2, index):
@@ -0,0 +1,238 @@
+"""Parallel mesh file loading with a persistent on-disk geometry cache.
+
+Mesh files are decoded into numpy arrays (points, point data and cells) which
+are stored in an uncompressed .npz file named by a hash of the mesh file
+contents.  Loading a mesh that is already in the cache only reads the .npz
+file, and larger batches of cache misses are decoded in parallel on worker
+processes.
+
+Hashing a file reads all of it, so the hash of each file is remembered for
+the life of the process together with the file's (mtime, size), and is only
+computed again when those change.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from vtk.util import numpy_support
+
+from director import filterUtils, ioUtils
+from director import vtkAll as vtk
+from director import vtkNumpy as vnp
+
+# Bump when the processing in decode_mesh_file or the stored arrays change
+CACHE_VERSION = 2
+
+# Default number of decode worker processes.  Each spawned worker imports VTK,
+# so batches smaller than MIN_PARALLEL_FILES are decoded in the calling process.
+DEFAULT_MAX_WORKERS = 4
+MIN_PARALLEL_FILES = 8
+
+# Point data attributes restored by arrays_to_polydata, by SetAttribute index
+_POINT_ATTRIBUTES = {
+    "scalars": vtk.vtkDataSetAttributes.SCALARS,
+    "normals": vtk.vtkDataSetAttributes.NORMALS,
+    "tcoords": vtk.vtkDataSetAttributes.TCOORDS,
+}
+
+_CELL_TYPES = {
+    "verts": "GetVerts",
+    "lines": "GetLines",
+    "polys": "GetPolys",
+    "strips": "GetStrips",
+}
+
+# Maps an absolute path to ((mtime_ns, size), hash_mesh_file result)
+_file_hashes = {}
+
+
+def get_default_cache_dir():
+    """Return the cache directory, overridable with DIRECTOR_MESH_CACHE_DIR."""
+    return os.environ.get("DIRECTOR_MESH_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "director", "meshes"
+    )
+
+
+def hash_mesh_file(path):
+    """Return the cache key for a mesh file, based on its contents and extension."""
+    digest = hashlib.sha1(f"v{CACHE_VERSION}{os.path.splitext(path)[1].lower()}".encode())
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_file_stat_key(path):
+    """Return (mtime_ns, size) of a file, a cheap check for whether it changed."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_mesh_file_key(path):
+    """Return hash_mesh_file(path), hashing the file again only when its mtime or size changed."""
+    path = os.path.abspath(path)
+    stat_key = get_file_stat_key(path)
+    entry = _file_hashes.get(path)
+    if entry is None or entry[0] != stat_key:
+        entry = (stat_key, hash_mesh_file(path))
+        _file_hashes[path] = entry
+    return entry[1]
+
+
+def _compact_ids(ids):
+    return ids.astype(np.int32) if len(ids) and ids.max() < np.iinfo(np.int32).max else np.asarray(ids)
+
+
+def polydata_to_arrays(polyData):
+    """
+    Return a dict of numpy arrays describing the points, point data arrays
+    and cells of a polydata.  Cell data and field data are not stored.
+    """
+    arrays = {"points": np.array(vnp.getNumpyFromVtk(polyData, "Points"))}
+    pointData = polyData.GetPointData()
+    names = []
+    attributes = []
+    for i in range(pointData.GetNumberOfArrays()):
+        array = pointData.GetArray(i)
+        if array is None:
+            continue
+        attribute = ""
+        for attributeName, attributeType in _POINT_ATTRIBUTES.items():
+            if pointData.GetAttribute(attributeType) is array:
+                attribute = attributeName
+        arrays[f"point_data_{len(names)}"] = np.array(numpy_support.vtk_to_numpy(array))
+        names.append(array.GetName() or "")
+        attributes.append(attribute)
+    if names:
+        arrays["point_data_names"] = np.array(names)
+        arrays["point_data_attributes"] = np.array(attributes)
+    for cell_type, getter in _CELL_TYPES.items():
+        cells = getattr(polyData, getter)()
+        if cells.GetNumberOfCells():
+            offsets, connectivity = vnp.getNumpyFromVtkCellArray(cells)
+            arrays[f"{cell_type}_offsets"] = _compact_ids(offsets)
+            arrays[f"{cell_type}_connectivity"] = _compact_ids(connectivity)
+    return arrays
+
+
+def arrays_to_polydata(arrays):
+    """Build a polydata from arrays returned by polydata_to_arrays."""
+    polyData = vnp.numpyToPolyData(arrays["points"], createVertexCells=False)
+    for cell_type in _CELL_TYPES:
+        if f"{cell_type}_offsets" in arrays:
+            vnp.setPolyDataCells(
+                polyData,
+                cell_type,
+                offsets=arrays[f"{cell_type}_offsets"],
+                connectivity=arrays[f"{cell_type}_connectivity"],
+            )
+    pointData = polyData.GetPointData()
+    names = arrays.get("point_data_names", [])
+    attributes = arrays.get("point_data_attributes", [])
+    for i, (name, attribute) in enumerate(zip(names, attributes)):
+        array = vnp.getVtkFromNumpy(np.ascontiguousarray(arrays[f"point_data_{i}"]))
+        if name:
+            array.SetName(str(name))
+        if attribute:
+            pointData.SetAttribute(array, _POINT_ATTRIBUTES[str(attribute)])
+        else:
+            pointData.AddArray(array)
+    return polyData
+
+
+def decode_mesh_file(path):
+    """Read a mesh file, compute normals if it has none, and return its arrays."""
+    polyData = ioUtils.readPolyData(path)
+    if not polyData.GetPointData().GetNormals():
+        polyData = filterUtils.computeNormals(polyData)
+    return polydata_to_arrays(polyData)
+
+
+def _read_cache_file(cache_file):
+    try:
+        with np.load(cache_file, allow_pickle=False) as npz:
+            return dict(npz)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # A truncated or corrupt cache file is treated as a miss and rewritten
+        print(f"Warning: Failed to read mesh cache file {cache_file}: {e}")
+        return None
+
+
+def _write_cache_file(cache_file, arrays):
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+    except OSError as e:
+        print(f"Warning: Failed to write mesh cache file {cache_file}: {e}")
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Failed to write mesh cache file {cache_file}: {e}")
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def _decode_mesh_files(paths, num_workers):
+    if num_workers is None:
+        if len(paths) < MIN_PARALLEL_FILES:
+            num_workers = 0
+        else:
+            num_workers = min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    num_workers = min(num_workers, len(paths))
+    if num_workers > 1:
+        try:
+            # Forking a process with running threads (Qt, render and task
+            # pools) can deadlock the child, so workers are spawned
+            mp_context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=num_workers, mp_context=mp_context) as executor:
+                return list(executor.map(decode_mesh_file, paths))
+        except Exception as e:
+            print(f"Warning: Parallel mesh loading failed, loading serially: {e}")
+    return [decode_mesh_file(path) for path in paths]
+
+
+def load_mesh_files(paths, cache_dir=None, num_workers=None, use_disk_cache=True):
+    """
+    Load mesh files as polydata, using the disk cache where possible.
+
+    Args:
+        paths: Mesh file paths
+        cache_dir: Cache directory, defaults to get_default_cache_dir()
+        num_workers: Worker processes for decoding cache misses.  0 or 1
+            decodes in the calling process.  The default decodes fewer than
+            MIN_PARALLEL_FILES misses in the calling process, and otherwise
+            uses up to DEFAULT_MAX_WORKERS processes.
+        use_disk_cache: If False, always decode the files and skip the cache
+
+    Returns:
+        dict: Mapping from path to vtkPolyData
+    """
+    paths = list(dict.fromkeys(paths))
+    cache_dir = cache_dir or get_default_cache_dir()
+    arrays = {}
+    cache_files = {}
+    if use_disk_cache:
+        for path in paths:
+            cache_files[path] = os.path.join(cache_dir, get_mesh_file_key(path) + ".npz")
+            cached = _read_cache_file(cache_files[path])
+            if cached is not None:
+                arrays[path] = cached
+
+    misses = [path for path in paths if path not in arrays]
+    if misses:
+        for path, mesh_arrays in zip(misses, _decode_mesh_files(misses, num_workers)):
+            arrays[path] = mesh_arrays
+            if use_disk_cache:
+                _write_cache_file(cache_files[path], mesh_arrays)
+
+    return {path: arrays_to_polydata(arrays[path]) for path in paths}
@@ -5,9 +5,14 @@ kinematics, and visualize the model geometry in Director using PolyDataItem obje
 """
 
 import copy
+import hashlib
 import math
 import os
+import threading
+import weakref
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -16,9 +21,79 @@ import numpy as np
 from scipy.spatial.transform import Rotation
 
 import director.vtkAll as vtk
-from director import filterUtils, ioUtils, transformUtils
+from director import filterUtils, mesh_cache, transformUtils
 from director import objectmodel as om
 from director import visualization as vis
+from director import vtkNumpy as vnp
+from director.shallowCopy import shallowCopy
+
+# Parsed XML roots keyed by absolute path, with the (mtime, size) they were parsed at
+_xml_tree_cache: dict[str, tuple[tuple[int, int], ET.Element]] = {}
+
+
+def parse_xml_cached(xml_path: str) -> ET.Element:
+    """
+    Parse an XML file and return its root element.
+
+    Roots are cached by path and reused until the file's modification time
+    or size changes, so reloading a model only re-parses edited files.  The
+    returned elements are shared and must not be modified.
+    """
+    xml_path = os.path.abspath(xml_path)
+    stat = os.stat(xml_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _xml_tree_cache.get(xml_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    root = ET.parse(xml_path).getroot()
+    _xml_tree_cache[xml_path] = (stamp, root)
+    return root
+
+
+def walk_xml_includes(xml_path: str):
+    """
+    Yield (path, root) for an MJCF XML file and every file it includes.
+
+    Files are visited depth first in include order, each file once, parsing
+    through parse_xml_cached.  root is None for files that failed to parse.
+    """
+    visited = set()
+
+    def _walk(current_xml_path: str):
+        # Normalize the path to handle absolute paths and resolve symlinks
+        current_xml_path = os.path.abspath(os.path.normpath(current_xml_path))
+
+        # Avoid infinite loops from circular includes
+        if current_xml_path in visited:
+            return
+        visited.add(current_xml_path)
+
+        try:
+            root = parse_xml_cached(current_xml_path)
+        except ET.ParseError as e:
+            print(f"Warning: Failed to parse XML file {current_xml_path}: {e}")
+            root = None
+        except Exception as e:
+            print(f"Warning: Error processing XML file {current_xml_path}: {e}")
+            root = None
+        yield current_xml_path, root
+        if root is None:
+            return
+
+        xml_dir = os.path.dirname(current_xml_path)
+        for include_elem in root.findall(".//include"):
+            file_attr = include_elem.get("file")
+            if not file_attr:
+                continue
+
+            # Resolve relative to the current XML file's directory
+            include_path = os.path.normpath(os.path.join(xml_dir, file_attr))
+            if os.path.exists(include_path):
+                yield from _walk(include_path)
+            else:
+                print(f"Warning: Include file not found: {include_path} (referenced from {current_xml_path})")
+
+    yield from _walk(xml_path)
 
 
 class MuJoCoMeshResolver:
@@ -45,79 +120,35 @@ class MuJoCoMeshResolver:
         self.euler_seq = "xyz"  # Default MuJoCo euler sequence
 
     def add_xml_path(self, xml_path: str):
-        for path in self.find_all_xml_includes(xml_path):
-            self._parse_xml(path)
+        for path, root in walk_xml_includes(xml_path):
+            if root is not None:
+                self._parse_xml_root(path, root)
 
     def find_all_xml_includes(self, xml_path: str):
         """
         Find all XML files included (directly or indirectly) from the given XML file.
 
-        Recursively parses the XML file and all included files to build a complete
-        list of all XML paths that are part of the model.
-
         Args:
             xml_path: Path to the root MJCF XML file
 
         Returns:
             List of all XML file paths (the root file plus all includes)
         """
-        visited = set()
-        all_xml_paths = []
-
-        def _find_includes_recursive(current_xml_path: str):
-            """Recursive helper to find all includes."""
-            # Normalize the path to handle absolute paths and resolve symlinks
-            current_xml_path = os.path.abspath(os.path.normpath(current_xml_path))
-
-            # Avoid infinite loops from circular includes
-            if current_xml_path in visited:
-                return
-
-            # Mark as visited and add to results
-            visited.add(current_xml_path)
-            all_xml_paths.append(current_xml_path)
-
-            # Parse the XML file
-            try:
-                xml_dir = os.path.dirname(current_xml_path)
-                tree = ET.parse(current_xml_path)
-                root = tree.getroot()
-
-                # Find all <include> elements
-                for include_elem in root.findall(".//include"):
-                    file_attr = include_elem.get("file")
-                    if not file_attr:
-                        continue
-
-                    # Resolve the include path
-                    if os.path.isabs(file_attr):
-                        include_path = os.path.normpath(file_attr)
-                    else:
-                        # Resolve relative to the current XML file's directory
-                        include_path = os.path.join(xml_dir, file_attr)
-                        include_path = os.path.normpath(include_path)
-
-                    # Recursively process the included file
-                    if os.path.exists(include_path):
-                        _find_includes_recursive(include_path)
-                    else:
-                        print(f"Warning: Include file not found: {include_path} (referenced from {current_xml_path})")
-            except ET.ParseError as e:
-                print(f"Warning: Failed to parse XML file {current_xml_path}: {e}")
-            except Exception as e:
-                print(f"Warning: Error processing XML file {current_xml_path}: {e}")
-
-        # Start recursion from the root XML file
-        _find_includes_recursive(xml_path)
-
-        return all_xml_paths
+        return [path for path, _ in walk_xml_includes(xml_path)]
 
     def _parse_xml(self, xml_path: str):
         """Parse the MJCF XML file to extract mesh definitions and geom elements."""
+        try:
+            root = parse_xml_cached(xml_path)
+        except Exception as e:
+            print(f"Warning: Failed to parse XML for mesh resolution: {e}")
+            return
+        self._parse_xml_root(xml_path, root)
+
+    def _parse_xml_root(self, xml_path: str, root):
+        """Extract mesh definitions and geom elements from a parsed MJCF XML file."""
         try:
             xml_dir = os.path.dirname(xml_path)
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
 
             # Find the <compiler> tag and check for meshdir and angle attributes
             compiler = root.find("compiler")
@@ -451,40 +482,330 @@ def forward_kinematics(model, data, qpos):
     return compute_body_poses(model, data), compute_site_poses(model, data)
 
 
-def compute_body_poses(model, data):
-    body_poses = {}
+_name_tables = weakref.WeakKeyDictionary()
 
-    for body_id in range(model.nbody):
-        body_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_BODY, body_id)
-        body_name = body_name or f"body_{body_id}"
 
-        pos = data.xpos[body_id]
-        rot_matrix = data.xmat[body_id].reshape(3, 3)
-        transform_matrix = np.eye(4)
-        transform_matrix[:3, :3] = rot_matrix
-        transform_matrix[:3, 3] = pos
+def _get_name_table(model, obj_type, count, prefix):
+    tables = _name_tables.setdefault(model, {})
+    names = tables.get(obj_type)
+    if names is None:
+        names = tuple(mujoco.mj_id2name(model, obj_type, i) or f"{prefix}_{i}" for i in range(count))
+        tables[obj_type] = names
+    return names
+
+
+def get_body_name_table(model):
+    """Return the body names indexed by body id, computed once per model.
+
+    Unnamed bodies are named body_<id>.
+    """
+    return _get_name_table(model, mujoco.mjtObj.mjOBJ_BODY, model.nbody, "body")
+
+
+def get_site_name_table(model):
+    """Return the site names indexed by site id, computed once per model.
+
+    Unnamed sites are named site_<id>.
+    """
+    return _get_name_table(model, mujoco.mjtObj.mjOBJ_SITE, model.nsite, "site")
+
+
+def _poses_from_xpos_xmat(xpos, xmat, out=None):
+    poses = np.empty((len(xpos), 4, 4)) if out is None else out
+    poses[:, :3, :3] = xmat.reshape(-1, 3, 3)
+    poses[:, :3, 3] = xpos
+    poses[:, 3, :3] = 0.0
+    poses[:, 3, 3] = 1.0
+    return poses
+
+
+def compute_body_pose_array(model, data, out=None):
+    """
+    Return the world poses of all bodies as an (nbody, 4, 4) array.
+
+    Args:
+        model: MuJoCo model object
+        data: MuJoCo data object after forward kinematics
+        out: Optional (nbody, 4, 4) array to fill instead of allocating one
+    """
+    return _poses_from_xpos_xmat(data.xpos, data.xmat, out)
+
+
+def compute_site_pose_array(model, data, out=None):
+    """
+    Return the world poses of all sites as an (nsite, 4, 4) array.
+
+    Args:
+        model: MuJoCo model object
+        data: MuJoCo data object after forward kinematics
+        out: Optional (nsite, 4, 4) array to fill instead of allocating one
+    """
+    return _poses_from_xpos_xmat(data.site_xpos, data.site_xmat, out)
 
-        body_poses[body_name] = transform_matrix
 
-    return body_poses
+def compute_body_poses(model, data):
+    """Return a dict mapping body name to a 4x4 pose, a view over compute_body_pose_array()."""
+    return dict(zip(get_body_name_table(model), compute_body_pose_array(model, data)))
 
 
 def compute_site_poses(model, data):
-    site_poses = {}
+    """Return a dict mapping site name to a 4x4 pose, a view over compute_site_pose_array()."""
+    return dict(zip(get_site_name_table(model), compute_site_pose_array(model, data)))
 
-    for site_id in range(model.nsite):
-        site_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_SITE, site_id)
-        site_name = site_name or f"site_{site_id}"
 
-        pos = data.site_xpos[site_id]
-        rot_matrix = data.site_xmat[site_id].reshape(3, 3)
-        transform_matrix = np.eye(4)
-        transform_matrix[:3, :3] = rot_matrix
-        transform_matrix[:3, 3] = pos
+class KinematicsPlan:
+    """
+    Precompiled forward kinematics for a fixed list of joints.
 
-        site_poses[site_name] = transform_matrix
+    Joint names are resolved to qpos slices once, so building a qpos vector
+    from joint values does not call mj_name2id.  compute() runs
+    mj_kinematics instead of the full mj_forward, adding mj_comPos only when
+    compute_com is set, and applies world_T_base to all poses with a single
+    batched matmul.
+    """
 
-    return site_poses
+    _qpos_widths = {mujoco.mjtJoint.mjJNT_FREE: 7, mujoco.mjtJoint.mjJNT_BALL: 4}
+
+    def __init__(self, model, data, joint_names=None, compute_com=False):
+        """
+        Args:
+            model: MuJoCo model object
+            data: MuJoCo data object used for the kinematics
+            joint_names: Joints to map, defaults to every named joint
+            compute_com: If True also run mj_comPos to update the center of mass quantities
+        """
+        self.model = model
+        self.data = data
+        self.compute_com = compute_com
+        self.joint_slices = {}
+        if joint_names is None:
+            joint_names = [mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_JOINT, i) for i in range(model.njnt)]
+        for joint_name in joint_names:
+            if not joint_name:
+                continue
+            joint_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_JOINT, joint_name)
+            if joint_id < 0:
+                raise ValueError(f"Joint '{joint_name}' not found in model")
+            qpos_addr = int(model.jnt_qposadr[joint_id])
+            width = self._qpos_widths.get(int(model.jnt_type[joint_id]), 1)
+            self.joint_slices[joint_name] = slice(qpos_addr, qpos_addr + width)
+
+        self.joint_names = tuple(self.joint_slices)
+        self.scalar_joint_names = tuple(name for name, sl in self.joint_slices.items() if sl.stop - sl.start == 1)
+        self.scalar_qpos_addrs = np.array(
+            [self.joint_slices[name].start for name in self.scalar_joint_names], dtype=int
+        )
+
+    def qpos_from_dict(self, q_dict, qpos=None):
+        """
+        Fill a qpos vector from a dict of joint values.
+
+        Free joints take 7 values (pos[3] + quat[4]) and ball joints take 4
+        (quaternion).  Joints missing from q_dict keep the value in qpos, which
+        defaults to zeros.
+        """
+        qpos = np.zeros(self.model.nq) if qpos is None else qpos
+        for joint_name, joint_value in q_dict.items():
+            qpos_slice = self.joint_slices.get(joint_name)
+            if qpos_slice is None:
+                print(f"Warning: Joint '{joint_name}' not found in model")
+                continue
+            width = qpos_slice.stop - qpos_slice.start
+            if width == 1:
+                qpos[qpos_slice.start] = float(joint_value)
+            elif isinstance(joint_value, (list, tuple, np.ndarray)) and len(joint_value) == width:
+                qpos[qpos_slice] = joint_value
+            elif width == 7:
+                print(f"Warning: Free joint '{joint_name}' requires 7 values (pos[3] + quat[4])")
+            else:
+                print(f"Warning: Ball joint '{joint_name}' requires 4 values (quaternion)")
+        return qpos
+
+    def qpos_from_values(self, values, qpos=None):
+        """Fill a qpos vector from values ordered like scalar_joint_names."""
+        qpos = np.zeros(self.model.nq) if qpos is None else qpos
+        qpos[self.scalar_qpos_addrs] = values
+        return qpos
+
+    def compute(self, qpos, world_T_base=None, body_out=None, site_out=None):
+        """
+        Run kinematics for qpos and return (body_poses, site_poses) as
+        (nbody, 4, 4) and (nsite, 4, 4) arrays in the world frame.  The
+        results are written into body_out and site_out when given.
+        """
+        if len(qpos) != self.model.nq:
+            raise ValueError(f"qpos length ({len(qpos)}) must match model.nq ({self.model.nq})")
+        self.data.qpos[:] = qpos
+        mujoco.mj_kinematics(self.model, self.data)
+        if self.compute_com:
+            mujoco.mj_comPos(self.model, self.data)
+
+        body_poses = compute_body_pose_array(self.model, self.data, out=body_out)
+        site_poses = compute_site_pose_array(self.model, self.data, out=site_out)
+        if world_T_base is not None and not np.array_equal(world_T_base, np.eye(4)):
+            np.matmul(world_T_base, body_poses, out=body_poses)
+            np.matmul(world_T_base, site_poses, out=site_poses)
+        return body_poses, site_poses
+
+
+def compute_trajectory_pose_arrays(model, qpos_trajectory, world_T_base=None, chunk_size=1024, num_workers=0):
+    """
+    Compute body and site poses for every sample of a trajectory.
+
+    The trajectory is processed in chunks of chunk_size samples.  With
+    num_workers > 0 the chunks run on a thread pool, each worker thread using
+    its own MjData.  world_T_base is either a single 4x4 transform or one per
+    sample, and is applied to each chunk with a batched matmul.
+
+    Args:
+        model: MuJoCo model object
+        qpos_trajectory: (T, nq) array of joint positions
+        world_T_base: Optional (4, 4) or (T, 4, 4) base transform
+        chunk_size: Number of samples per chunk
+        num_workers: Number of worker threads, 0 computes in the calling thread
+
+    Returns:
+        tuple: (T, nbody, 4, 4) body poses and (T, nsite, 4, 4) site poses
+    """
+    qpos_trajectory = np.asarray(qpos_trajectory, dtype=float)
+    if qpos_trajectory.ndim != 2 or qpos_trajectory.shape[1] != model.nq:
+        raise ValueError(f"qpos_trajectory must have shape (T, {model.nq}), got {qpos_trajectory.shape}")
+    num_samples = len(qpos_trajectory)
+    if world_T_base is not None:
+        world_T_base = np.asarray(world_T_base, dtype=float)
+        if world_T_base.shape not in [(4, 4), (num_samples, 4, 4)]:
+            raise ValueError(f"world_T_base must have shape (4, 4) or ({num_samples}, 4, 4), got {world_T_base.shape}")
+        if world_T_base.ndim == 2 and np.array_equal(world_T_base, np.eye(4)):
+            world_T_base = None
+
+    body_poses = np.empty((num_samples, model.nbody, 4, 4))
+    site_poses = np.empty((num_samples, model.nsite, 4, 4))
+    worker_state = threading.local()
+
+    def compute_chunk(start):
+        plan = getattr(worker_state, "plan", None)
+        if plan is None:
+            plan = worker_state.plan = KinematicsPlan(model, mujoco.MjData(model))
+        stop = min(start + chunk_size, num_samples)
+        for i in range(start, stop):
+            plan.compute(qpos_trajectory[i], body_out=body_poses[i], site_out=site_poses[i])
+        if world_T_base is not None:
+            base = world_T_base if world_T_base.ndim == 2 else world_T_base[start:stop, None]
+            np.matmul(base, body_poses[start:stop], out=body_poses[start:stop])
+            np.matmul(base, site_poses[start:stop], out=site_poses[start:stop])
+
+    chunk_starts = range(0, num_samples, chunk_size)
+    if num_workers:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            list(executor.map(compute_chunk, chunk_starts))
+    else:
+        for start in chunk_starts:
+            compute_chunk(start)
+    return body_poses, site_poses
+
+
+class TrajectoryPoseCache:
+    """
+    LRU cache of forward kinematics results for a sampled trajectory.
+
+    Poses are keyed by sample index, so revisiting a sample while scrubbing
+    a time slider does not run forward kinematics again.  precompute() fills
+    the cache for a range of samples in bulk.
+    """
+
+    def __init__(self, robot_model, qpos_trajectory, world_T_base=None, max_size=10000, chunk_size=1024):
+        """
+        Args:
+            robot_model: MujocoRobotModel used to compute and show poses
+            qpos_trajectory: (T, nq) array of joint positions
+            world_T_base: Optional (4, 4) or (T, 4, 4) base transform
+            max_size: Maximum number of cached samples
+            chunk_size: Number of samples per chunk when precomputing
+        """
+        self.robot_model = robot_model
+        self.qpos_trajectory = np.asarray(qpos_trajectory, dtype=float)
+        self.world_T_base = None if world_T_base is None else np.asarray(world_T_base, dtype=float)
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.fk_count = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, index):
+        return index in self._cache
+
+    def clear(self):
+        self._cache.clear()
+
+    def _world_T_base(self, start, stop):
+        if self.world_T_base is None or self.world_T_base.ndim == 2:
+            return self.world_T_base
+        return self.world_T_base[start:stop]
+
+    def _insert(self, index, poses):
+        self._cache[index] = poses
+        self._cache.move_to_end(index)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def precompute(self, start=0, stop=None, num_workers=0):
+        """Compute and cache the poses for samples in [start, stop)."""
+        stop = len(self.qpos_trajectory) if stop is None else min(stop, len(self.qpos_trajectory))
+        # Only the last max_size samples would survive in the cache
+        start = max(start, stop - self.max_size)
+        if start >= stop:
+            return
+        body_poses, site_poses = compute_trajectory_pose_arrays(
+            self.robot_model.model,
+            self.qpos_trajectory[start:stop],
+            self._world_T_base(start, stop),
+            chunk_size=self.chunk_size,
+            num_workers=num_workers,
+        )
+        self.fk_count += stop - start
+        # Cache copies, a view would keep the whole (T, nbody, 4, 4) block
+        # alive and max_size would not bound the memory held
+        for offset in range(stop - start):
+            self._insert(start + offset, (body_poses[offset].copy(), site_poses[offset].copy()))
+
+    def get(self, index):
+        """Return (body_poses, site_poses) arrays for a sample index."""
+        index = int(index)
+        poses = self._cache.get(index)
+        if poses is not None:
+            self._cache.move_to_end(index)
+            return poses
+        if not 0 <= index < len(self.qpos_trajectory):
+            raise IndexError(f"Sample index {index} out of range")
+        world_T_base = self._world_T_base(index, index + 1)
+        if world_T_base is not None and world_T_base.ndim == 3:
+            world_T_base = world_T_base[0]
+        poses = self.robot_model.kinematics_plan.compute(self.qpos_trajectory[index], world_T_base)
+        self.fk_count += 1
+        self._insert(index, poses)
+        return poses
+
+    def show(self, index, name_or_folder=None):
+        """Show the cached poses for a sample index on the robot model."""
+        body_poses, site_poses = self.get(index)
+        return self.robot_model.show_pose_arrays(body_poses, site_poses, name_or_folder)
+
+    def connect_time_slider(self, time_slider, timestamps, name_or_folder=None):
+        """
+        Show the sample at or before the slider time whenever a TimestampSlider
+        changes.  timestamps holds the absolute time of each sample.
+        """
+        timestamps = np.asarray(timestamps)
+        if len(timestamps) != len(self.qpos_trajectory):
+            raise ValueError("timestamps must have one entry per trajectory sample")
+
+        def on_time_changed(timestamp_s):
+            index = np.searchsorted(timestamps, timestamp_s, side="right") - 1
+            self.show(min(max(index, 0), len(timestamps) - 1), name_or_folder)
+
+        return time_slider.connect_on_time_changed(on_time_changed)
 
 
 def get_geom_pose_in_body(model, geom_id):
@@ -542,22 +863,13 @@ def mj_mesh_to_vtk_polydata(model, mesh_id):
 
         # MuJoCo uses (vertex_count, 3) array for vertices
         # Convert to vtkPolyData using vtkNumpy
-        polyData = vnp.numpyToPolyData(vertices)
+        # mesh_vert belongs to the MjModel, copy it instead of aliasing it
+        polyData = vnp.numpyToPolyData(vertices, createVertexCells=False, copy=True)
 
         # Add faces if available
-        if face_count > 0 and len(faces.shape) == 2:
+        if face_count > 0 and len(faces.shape) == 2 and faces.shape[1] == 3:
             # MuJoCo faces are (n, 3) arrays with vertex indices
-            # Convert to VTK cell array format
-            cells = vtk.vtkCellArray()
-            for face in faces:
-                # Handle both int and uint types
-                if len(face) == 3:
-                    triangle = vtk.vtkTriangle()
-                    triangle.GetPointIds().SetId(0, int(face[0]))
-                    triangle.GetPointIds().SetId(1, int(face[1]))
-                    triangle.GetPointIds().SetId(2, int(face[2]))
-                    cells.InsertNextCell(triangle)
-            polyData.SetPolys(cells)
+            vnp.setPolyDataCells(polyData, "polys", cells=faces)
 
         return polyData
     except Exception as e:
@@ -626,8 +938,45 @@ def create_primitive_geom(model, geom_id):
         return None
 
 
-# Global cache for mesh file PolyData
-_mesh_file_cache: dict[str, vtk.vtkPolyData] = {}
+# Global cache for mesh file PolyData, maps a path to ((mtime_ns, size), polyData)
+_mesh_file_cache: dict[str, tuple] = {}
+
+
+def _get_cached_mesh_file(mesh_file):
+    """Return the cached polydata for a mesh file, or None if it is not cached or the file changed."""
+    entry = _mesh_file_cache.get(mesh_file)
+    if entry is not None and entry[0] == mesh_cache.get_file_stat_key(mesh_file):
+        return entry[1]
+    return None
+
+
+def _load_mesh_files(mesh_files, num_workers):
+    for mesh_file, polyData in mesh_cache.load_mesh_files(mesh_files, num_workers=num_workers).items():
+        _mesh_file_cache[mesh_file] = (mesh_cache.get_file_stat_key(mesh_file), polyData)
+
+
+def preload_geom_meshes(model, geom_ids, mesh_resolver, num_workers=None):
+    """
+    Load the mesh files of the given geoms into the mesh file cache.
+
+    Files that are not cached yet are loaded together through
+    mesh_cache.load_mesh_files, which reads them from the on-disk geometry
+    cache or decodes them in parallel on worker processes.
+    """
+    mesh_files = []
+    for geom_id in geom_ids:
+        if model.geom_type[geom_id] != mujoco.mjtGeom.mjGEOM_MESH:
+            continue
+        mesh_id = model.geom_dataid[geom_id]
+        if mesh_id < 0 or mesh_id >= model.nmesh:
+            continue
+        mesh_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_MESH, mesh_id)
+        mesh_file = mesh_resolver.resolve_mesh_file(mesh_name) if mesh_name else None
+        if mesh_file and os.path.exists(mesh_file) and _get_cached_mesh_file(mesh_file) is None:
+            mesh_files.append(mesh_file)
+
+    if mesh_files:
+        _load_mesh_files(mesh_files, num_workers)
 
 
 def load_geom_mesh(model, geom_id, mesh_resolver):
@@ -646,7 +995,7 @@ def load_geom_mesh(model, geom_id, mesh_resolver):
     Returns:
         vtkPolyData: Mesh geometry, or None if geom cannot be loaded
     """
-    geom_type = model.geom_type[geom_id]
+    geom_type = int(model.geom_type[geom_id])
 
     # Handle primitive geoms
     if geom_type in [
@@ -674,23 +1023,15 @@ def load_geom_mesh(model, geom_id, mesh_resolver):
     if mesh_resolver and mesh_name:
         mesh_file = mesh_resolver.resolve_mesh_file(mesh_name)
         if mesh_file:
-            # Check cache first
-            if mesh_file in _mesh_file_cache:
-                return _mesh_file_cache[mesh_file]
-
             # Load mesh file
             if os.path.exists(mesh_file):
-                print("loading mesh file", mesh_file)
-                polyData = ioUtils.readPolyData(mesh_file)
-                if not polyData.GetNumberOfPoints():
-                    print(f"Error: Mesh file {mesh_file} has no points")
-
-                # print("Loaded", polyData.GetNumberOfPoints(), "points")
-                # print("Loaded", polyData.GetNumberOfCells(), "cells")
-                if not polyData.GetPointData().GetNormals():
-                    polyData = filterUtils.computeNormals(polyData)
-                # Cache the result
-                _mesh_file_cache[mesh_file] = polyData
+                # Check cache first, a changed file is loaded again
+                polyData = _get_cached_mesh_file(mesh_file)
+                if polyData is None:
+                    _load_mesh_files([mesh_file], num_workers=0)
+                    polyData = _mesh_file_cache[mesh_file][1]
+                    if not polyData.GetNumberOfPoints():
+                        print(f"Error: Mesh file {mesh_file} has no points")
                 return polyData
             else:
                 print(f"Error: Mesh file not found '{mesh_file}' for mesh '{mesh_name}'")
@@ -706,6 +1047,275 @@ def load_geom_mesh(model, geom_id, mesh_resolver):
     return None
 
 
+def get_geom_rgba(model, geom_id, geom_name, mesh_resolver):
+    """
+    Get the rgba color of a geom.
+
+    Priority order (per MuJoCo documentation):
+    1. Geom's material attribute
+    2. Mesh's material attribute (if geom references a mesh)
+    3. Geom's rgba attribute
+    4. Fall back to model.geom_rgba
+    """
+    geom_type = model.geom_type[geom_id]
+    geom_rgba = None
+    geom_elem = mesh_resolver.geom_name_to_element.get(geom_name)
+
+    # First: Check if geom has a material attribute
+    if geom_elem is not None:
+        material_name = geom_elem.get("material")
+
+        if material_name == "groundplane":
+            material_name = None  # Todo, add a handler for this builtin material
+        if material_name:
+            # Look up material rgba from mesh_resolver
+            geom_rgba = mesh_resolver.get_material_rgba(material_name)
+            if geom_rgba is None:
+                print(f"Warning: Material '{material_name}' not found for geom '{geom_name}'")
+
+    # Second: If no geom material, check mesh's material (if geom references a mesh)
+    if geom_rgba is None and geom_type == mujoco.mjtGeom.mjGEOM_MESH:
+        mesh_id = model.geom_dataid[geom_id]
+        if mesh_id >= 0 and mesh_id < model.nmesh:
+            mesh_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_MESH, mesh_id)
+            if mesh_name:
+                mesh_material_name = mesh_resolver.mesh_name_to_material.get(mesh_name)
+                if mesh_material_name:
+                    geom_rgba = mesh_resolver.get_material_rgba(mesh_material_name)
+                    if geom_rgba is None:
+                        print(
+                            f"Warning: Material '{mesh_material_name}' from mesh '{mesh_name}' not found for geom '{geom_name}'"
+                        )
+
+    # Third: If no material found, check for rgba attribute on geom
+    if geom_rgba is None and geom_elem is not None:
+        rgba_str = geom_elem.get("rgba")
+        if rgba_str:
+            rgba_values = [float(x) for x in rgba_str.split()]
+            if len(rgba_values) == 4:
+                geom_rgba = rgba_values
+
+    # Fourth: Fall back to MuJoCo model's geom_rgba if no XML attribute found
+    if geom_rgba is None:
+        geom_rgba = model.geom_rgba[geom_id]
+    return geom_rgba
+
+
+def merge_geom_polydata(geoms):
+    """
+    Append geom polydatas into one polydata.
+
+    vtkAppendPolyData keeps only the point arrays that every input has.
+    Normals are computed for inputs without them so they always survive the
+    merge, other point arrays, such as the texture coordinates of primitive
+    geoms, are dropped unless every geom has them.
+
+    Args:
+        geoms: List of (geom_id, polyData, rgba) tuples, with each polyData
+            already transformed into the body frame
+
+    Returns:
+        vtkPolyData: Merged polydata with "geom_id" and uint8 rgba "geom_color" cell arrays
+    """
+    parts = []
+    for geom_id, polyData, rgba in geoms:
+        if not polyData.GetPointData().GetNormals():
+            polyData = filterUtils.computeNormals(polyData)
+        polyData = shallowCopy(polyData)
+        numberOfCells = polyData.GetNumberOfCells()
+        vnp.addNumpyToVtk(polyData, np.full(numberOfCells, geom_id, dtype=np.int32), "geom_id", arrayType="cells")
+        colors = np.tile(np.round(np.asarray(rgba, dtype=float) * 255).astype(np.uint8), (numberOfCells, 1))
+        vnp.addNumpyToVtk(polyData, colors, "geom_color", arrayType="cells")
+        parts.append(polyData)
+    return filterUtils.appendPolyData(parts)
+
+
+class MergedGeomsItem(vis.PolyDataItem):
+    """
+    PolyDataItem for the merged geoms of one body, see merge_geom_polydata.
+
+    Cells are colored by the "geom_color" array when Color By is Solid Color,
+    and the "geom_id" cell array maps picked cells back to geoms.  Geoms are
+    hidden by flagging their cells in the ghost array, so toggling visibility
+    does not rebuild the polydata.  set_geom_names() adds a "Show Geom"
+    property per geom so geoms can also be toggled in the properties panel.
+    """
+
+    GEOM_VISIBLE_PROPERTY_PREFIX = "Show Geom "
+
+    def __init__(self, name, polyData, view):
+        self._geom_property_names = {}
+        self._property_geom_ids = {}
+        vis.PolyDataItem.__init__(self, name, polyData, view)
+        self._setup_geom_arrays()
+
+    def setPolyData(self, polyData):
+        vis.PolyDataItem.setPolyData(self, polyData)
+        self._setup_geom_arrays()
+
+    def set_geom_names(self, geom_names):
+        """Add a visibility property for each geom, geom_names maps geom id to name."""
+        self._geom_property_names = {}
+        for geom_id in self.get_geom_ids():
+            property_name = self.GEOM_VISIBLE_PROPERTY_PREFIX + geom_names.get(geom_id, f"geom_{geom_id}")
+            self._geom_property_names[geom_id] = property_name
+            self._property_geom_ids[property_name] = geom_id
+            self.addProperty(property_name, self.get_geom_visible(geom_id))
+
+    def _onPropertyChanged(self, propertySet, propertyName):
+        vis.PolyDataItem._onPropertyChanged(self, propertySet, propertyName)
+        geom_id = self._property_geom_ids.get(propertyName)
+        if geom_id is not None:
+            self._set_geom_cells_visible(geom_id, self.getProperty(propertyName))
+
+    def _setup_geom_arrays(self):
+        self._cell_geom_ids = vnp.getNumpyFromVtk(self.polyData, "geom_id", arrayType="cells")
+        self._cell_colors = vnp.getNumpyFromVtk(self.polyData, "geom_color", arrayType="cells")
+        if not self.polyData.GetCellGhostArray():
+            self.polyData.AllocateCellGhostArray()
+        self._cell_ghosts = vnp.getNumpyFromVtk(
+            self.polyData, vtk.vtkDataSetAttributes.GhostArrayName(), arrayType="cells"
+        )
+
+    def get_geom_ids(self):
+        """Return the geom ids in this item, in cell order."""
+        geom_ids, first_cells = np.unique(self._cell_geom_ids, return_index=True)
+        return [int(geom_id) for geom_id in geom_ids[np.argsort(first_cells)]]
+
+    def get_geom_id(self, cell_id):
+        """Return the geom id of a cell, for example a picked cell."""
+        return int(self._cell_geom_ids[cell_id])
+
+    def set_geom_visible(self, geom_id, visible):
+        property_name = self._geom_property_names.get(geom_id)
+        if property_name is not None:
+            self.setProperty(property_name, bool(visible))
+        else:
+            self._set_geom_cells_visible(geom_id, visible)
+
+    def _set_geom_cells_visible(self, geom_id, visible):
+        mask = self._cell_geom_ids == geom_id
+        if visible:
+            self._cell_ghosts[mask] &= ~np.uint8(vtk.vtkDataSetAttributes.HIDDENCELL)
+        else:
+            self._cell_ghosts[mask] |= np.uint8(vtk.vtkDataSetAttributes.HIDDENCELL)
+        self._mark_cells_modified(self.polyData.GetCellGhostArray())
+
+    def get_geom_visible(self, geom_id):
+        mask = self._cell_geom_ids == geom_id
+        return not np.all(self._cell_ghosts[mask] & vtk.vtkDataSetAttributes.HIDDENCELL)
+
+    def set_geom_color(self, geom_id, rgba):
+        """Set the rgba color, components in [0, 1], of one geom."""
+        self._cell_colors[self._cell_geom_ids == geom_id] = np.round(np.asarray(rgba, dtype=float) * 255)
+        self._mark_cells_modified(self.polyData.GetCellData().GetArray("geom_color"))
+
+    def get_geom_color(self, geom_id):
+        index = np.flatnonzero(self._cell_geom_ids == geom_id)[0]
+        return self._cell_colors[index] / 255.0
+
+    def _mark_cells_modified(self, array):
+        array.Modified()
+        self.polyData.Modified()
+        self._renderAllViews()
+
+    def colorBy(self, arrayName, scalarRange=None, lut=None):
+        if arrayName:
+            self.mapper.SetScalarModeToDefault()
+            self.mapper.SetColorModeToDefault()
+            return vis.PolyDataItem.colorBy(self, arrayName, scalarRange, lut)
+
+        # Solid Color shows the color of each geom
+        self.polyData.GetPointData().SetActiveScalars(None)
+        self.mapper.SetScalarModeToUseCellFieldData()
+        self.mapper.SelectColorArray("geom_color")
+        self.mapper.SetColorModeToDirectScalars()
+        self.mapper.ScalarVisibilityOn()
+        if self.getProperty("Visible"):
+            self._renderAllViews()
+
+
+# Body frame geom polydata, shared by every model instance showing the same geometry.
+# Entries are dropped once no item holds the polydata, for example after the
+# models showing it are removed.
+_geom_polydata_cache = weakref.WeakValueDictionary()
+
+
+def _geom_geometry_key(model, geom_id, mesh_resolver, geom_pose_in_body):
+    """Return a key identifying the body frame geometry of a geom by content."""
+    geom_type = int(model.geom_type[geom_id])
+    pose_key = None if geom_pose_in_body is None else np.asarray(geom_pose_in_body, dtype=float).tobytes()
+    if geom_type != mujoco.mjtGeom.mjGEOM_MESH:
+        return ("primitive", geom_type, model.geom_size[geom_id].tobytes(), pose_key)
+
+    mesh_id = int(model.geom_dataid[geom_id])
+    mesh_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_MESH, mesh_id)
+    mesh_file = mesh_resolver.resolve_mesh_file(mesh_name) if mesh_resolver and mesh_name else None
+    if mesh_file and os.path.exists(mesh_file):
+        # An edited mesh file gets a new key, so reloaded models see the change
+        return ("file", mesh_file, mesh_cache.get_file_stat_key(mesh_file), pose_key)
+
+    # Meshes without a file are keyed by their compiled vertex and face data
+    digest = hashlib.sha1()
+    vert_start, face_start = model.mesh_vertadr[mesh_id], model.mesh_faceadr[mesh_id]
+    digest.update(model.mesh_vert[vert_start : vert_start + model.mesh_vertnum[mesh_id]].tobytes())
+    digest.update(model.mesh_face[face_start : face_start + model.mesh_facenum[mesh_id]].tobytes())
+    return ("mjmesh", digest.hexdigest(), pose_key)
+
+
+def get_shared_geom_polydata(model, geom_id, mesh_resolver, geom_pose_in_body=None):
+    """
+    Return the geometry of a geom in its body frame.
+
+    Geoms with the same geometry and pose in body, including the geoms of
+    other instances of the same model, share one polydata.  Each item still
+    has its own mapper, since GPU resources are created per mapper and
+    render window, and sharing a mapper between views would rebuild them on
+    every render.
+    """
+    key = _geom_geometry_key(model, geom_id, mesh_resolver, geom_pose_in_body)
+    polyData = _geom_polydata_cache.get(key)
+    if polyData is None:
+        polyData = load_geom_mesh(model, geom_id, mesh_resolver)
+        assert polyData is not None
+        if geom_pose_in_body is not None:
+            polyData = filterUtils.transformPolyData(polyData, mj_matrix_to_vtk_transform(geom_pose_in_body))
+        _geom_polydata_cache[key] = polyData
+    return polyData
+
+
+class GeomItem(vis.PolyDataItem):
+    """
+    PolyDataItem for one geom, showing a polydata from get_shared_geom_polydata.
+
+    The polydata may be shared with other model instances.  The mapper and
+    the actor, holding the transform, color and opacity, belong to the item.
+    """
+
+    def colorBy(self, arrayName, scalarRange=None, lut=None):
+        # Select the array on the mapper, setting the active scalars of the
+        # shared polydata would recolor every other item showing it.
+        array = self.polyData.GetPointData().GetArray(arrayName) if arrayName else None
+        if not array:
+            if arrayName:
+                print("colorBy(%s): array not found" % arrayName)
+            self.mapper.ScalarVisibilityOff()
+            return
+
+        if not lut:
+            lut = self._getDefaultColorMap(array, scalarRange)
+
+        self.mapper.SetScalarModeToUsePointFieldData()
+        self.mapper.SelectColorArray(arrayName)
+        self.mapper.ScalarVisibilityOn()
+        self.mapper.SetUseLookupTableScalarRange(True)
+        self.mapper.SetLookupTable(lut)
+        self.mapper.SetInterpolateScalarsBeforeMapping(not self._isPointCloud())
+
+        if self.getProperty("Visible"):
+            self._renderAllViews()
+
+
 @dataclass
 class ShowOptions:
     """Options for controlling how MuJoCo models are visualized."""
@@ -717,6 +1327,8 @@ class ShowOptions:
     ignore_scene_bodies: bool = False
     ignore_body_names: list[str] = field(default_factory=list)
     ignore_geom_names: list[str] = field(default_factory=list)
+    # Merge the geoms of each body into one MergedGeomsItem per group folder
+    merge_body_geoms: bool = False
     finalize_callback = None
 
 
@@ -765,12 +1377,19 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
         body_info = model.body(body_id)
         return body_info.mocapid.size > 0 and body_info.mocapid[0] >= 0
 
+    # Load all mesh files up front so cache misses are decoded in parallel
+    geom_ids = [
+        geom_id
+        for geom_id in range(model.ngeom)
+        if int(model.geom_group[geom_id]) not in show_options.ignore_group_ids
+        and model.geom_group[geom_id] <= show_options.max_group_id
+    ]
+    preload_geom_meshes(model, geom_ids, mesh_resolver)
+
     for body_id in range(model.nbody):
         is_scene_body = get_is_scene_body(body_id)
         is_mocap_body = get_is_mocap_body(body_id)
-        body_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_BODY, body_id)
-        if not body_name:
-            body_name = f"body_{body_id}"
+        body_name = get_body_name(model, body_id)
 
         if is_scene_body and show_options.ignore_scene_bodies:
             continue
@@ -784,6 +1403,8 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
         frame_obj.setPropertyAttribute("Edit", "readOnly", True)
 
         # Process geoms for this body
+        merged_geoms = {}
+        merged_geom_names = {}
         if body_id in body_to_geom:
             for geom_id in body_to_geom[body_id]:
                 geom_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_GEOM, geom_id)
@@ -828,69 +1449,22 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
                 else:
                     geom_pose_in_body = get_geom_pose_in_body(model, geom_id)
 
-                # Load geometry for this geom (mesh or primitive)
-                geom_polydata = load_geom_mesh(model, geom_id, mesh_resolver)
-                assert geom_polydata is not None
-
-                if geom_pose_in_body is not None:
-                    geom_polydata = filterUtils.transformPolyData(
-                        geom_polydata, mj_matrix_to_vtk_transform(geom_pose_in_body)
-                    )
-
-                # Get geom color and alpha from MuJoCo
-                # Priority order (per MuJoCo documentation):
-                # 1. Geom's material attribute
-                # 2. Mesh's material attribute (if geom references a mesh)
-                # 3. Geom's rgba attribute
-                # 4. Fall back to model.geom_rgba
-                geom_rgba = None
-                geom_elem = mesh_resolver.geom_name_to_element.get(geom_name)
-
-                # First: Check if geom has a material attribute
-                if geom_elem is not None:
-                    material_name = geom_elem.get("material")
-
-                    if material_name == "groundplane":
-                        material_name = None  # Todo, add a handler for this builtin material
-                    if material_name:
-                        # Look up material rgba from mesh_resolver
-                        geom_rgba = mesh_resolver.get_material_rgba(material_name)
-                        if geom_rgba is None:
-                            print(f"Warning: Material '{material_name}' not found for geom '{geom_name}'")
-
-                # Second: If no geom material, check mesh's material (if geom references a mesh)
-                if geom_rgba is None and geom_type == mujoco.mjtGeom.mjGEOM_MESH:
-                    mesh_id = model.geom_dataid[geom_id]
-                    if mesh_id >= 0 and mesh_id < model.nmesh:
-                        mesh_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_MESH, mesh_id)
-                        if mesh_name:
-                            mesh_material_name = mesh_resolver.mesh_name_to_material.get(mesh_name)
-                            if mesh_material_name:
-                                geom_rgba = mesh_resolver.get_material_rgba(mesh_material_name)
-                                if geom_rgba is None:
-                                    print(
-                                        f"Warning: Material '{mesh_material_name}' from mesh '{mesh_name}' not found for geom '{geom_name}'"
-                                    )
-
-                # Third: If no material found, check for rgba attribute on geom
-                if geom_rgba is None and geom_elem is not None:
-                    rgba_str = geom_elem.get("rgba")
-                    if rgba_str:
-                        rgba_values = [float(x) for x in rgba_str.split()]
-                        if len(rgba_values) == 4:
-                            geom_rgba = rgba_values
+                # Load geometry for this geom (mesh or primitive), shared with other model instances
+                geom_polydata = get_shared_geom_polydata(model, geom_id, mesh_resolver, geom_pose_in_body)
 
-                # Fourth: Fall back to MuJoCo model's geom_rgba if no XML attribute found
-                if geom_rgba is None:
-                    geom_rgba = model.geom_rgba[geom_id]
+                geom_rgba = get_geom_rgba(model, geom_id, geom_name, mesh_resolver)
+                if show_options.merge_body_geoms:
+                    merged_geoms.setdefault(group_key, []).append((geom_id, geom_polydata, geom_rgba))
+                    merged_geom_names[geom_id] = geom_name
+                    continue
 
                 # Convert to Python list for compatibility
                 geom_color = [float(geom_rgba[i]) for i in range(3)]  # RGB components [0-1]
                 geom_alpha = float(geom_rgba[3])  # Alpha component [0-1]
 
-                # Create PolyDataItem for the geometry, adding it to the group folder
+                # Create GeomItem for the geometry, adding it to the group folder
                 obj = vis.showPolyData(
-                    geom_polydata, geom_name, parent=group_folder, color=geom_color, alpha=geom_alpha
+                    geom_polydata, geom_name, parent=group_folder, color=geom_color, alpha=geom_alpha, cls=GeomItem
                 )
 
                 obj.body_name = get_body_name(model, body_id)
@@ -905,6 +1479,21 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
 
                 geom_items[geom_id] = obj
 
+        # Merge the geoms of this body into one item per group folder
+        for group_key, geoms in merged_geoms.items():
+            obj = vis.showPolyData(
+                merge_geom_polydata(geoms), body_name, parent=group_folders[group_key], cls=MergedGeomsItem
+            )
+            obj.body_name = body_name
+            obj.set_geom_names(merged_geom_names)
+            prop = obj.actor.GetProperty()
+            prop.SetSpecular(0.4)
+            prop.SetSpecularPower(40)
+            child_frame = vis.addChildFrame(obj)
+            child_frame.setPropertyAttribute("Edit", "readOnly", True)
+            for geom_id in obj.get_geom_ids():
+                geom_items[geom_id] = obj
+
     # Set visibility to false for Scene, mocap, and Group 3 folders
     for folder_key, folder_obj in group_folders.items():
         if folder_key in ["Scene", "mocap", "group_2", "group_3", "group_4", "group_5"]:
@@ -920,9 +1509,7 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
 
 
 def get_body_name(model, body_id):
-    body_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_BODY, body_id)
-    body_name = body_name or f"body_{body_id}"
-    return body_name
+    return get_body_name_table(model)[body_id]
 
 
 class KinematicsUpdater:
@@ -931,6 +1518,7 @@ class KinematicsUpdater:
         self.dof_names = model.get_1dof_joint_names()
         self.pending_q_dict = {}
         self.pending_world_T_base = None
+        self.pending_snapshot = None
         self.body_poses = {}
         self.site_poses = {}
         self.reset()
@@ -938,6 +1526,7 @@ class KinematicsUpdater:
     def reset(self):
         self.pending_q_dict = {}
         self.pending_world_T_base = None
+        self.pending_snapshot = None
         self.q_dict = dict[Any, Any](zip(self.dof_names, np.zeros(len(self.dof_names))))
         self.world_T_base = np.eye(4)
         self.body_poses = {}
@@ -951,7 +1540,23 @@ class KinematicsUpdater:
         self.pending_world_T_base = world_T_base
         return self
 
+    def push_snapshot(self, snapshot):
+        """
+        Show the body and site poses of a mujoco_sim.SimSnapshot on the next
+        commit.  The snapshot poses are used directly, without running kinematics.
+        """
+        self.pending_snapshot = snapshot
+        return self
+
     def commit(self, name_or_folder=None):
+        if self.pending_snapshot is not None:
+            snapshot = self.pending_snapshot
+            self.pending_snapshot = None
+            joint_slices = self.model.kinematics_plan.joint_slices
+            self.q_dict.update((name, float(snapshot.qpos[joint_slices[name].start])) for name in self.dof_names)
+            self.body_poses, self.site_poses = self.model.show_pose_arrays(
+                snapshot.body_pose_array(), snapshot.site_pose_array(), name_or_folder
+            )
         if self.pending_q_dict or self.pending_world_T_base is not None:
             self.q_dict.update(self.pending_q_dict)
             if self.pending_world_T_base is not None:
@@ -989,6 +1594,7 @@ class MujocoRobotModel:
         self.mesh_resolver = MuJoCoMeshResolver()
         self.mesh_resolver.add_xml_path(self.xml_path)
         self.body_to_geom = build_body_to_geom_mapping(self.model)
+        self.kinematics_plan = KinematicsPlan(self.model, self.data)
         self._create_joint_properties_item()
 
         self.default_show_options = ShowOptions()
@@ -1015,12 +1621,7 @@ class MujocoRobotModel:
         Returns:
             List of body names
         """
-        body_names = []
-        for body_id in range(self.model.nbody):
-            body_name = mujoco.mj_id2name(self.model, mujoco.mjtObj.mjOBJ_BODY, body_id)
-            body_name = body_name or f"body_{body_id}"
-            body_names.append(body_name)
-        return body_names
+        return list(get_body_name_table(self.model))
 
     def get_joint_names(self) -> list[str]:
         """
@@ -1045,7 +1646,7 @@ class MujocoRobotModel:
         """
         joint_names = []
         for joint_id in range(self.model.njnt):
-            joint_type = self.model.jnt_type[joint_id]
+            joint_type = int(self.model.jnt_type[joint_id])
             # Only include hinge and slide joints (1 DOF)
             if joint_type in [mujoco.mjtJoint.mjJNT_HINGE, mujoco.mjtJoint.mjJNT_SLIDE]:
                 joint_name = mujoco.mj_id2name(self.model, mujoco.mjtObj.mjOBJ_JOINT, joint_id)
@@ -1062,7 +1663,7 @@ class MujocoRobotModel:
         """
         ranges = {}
         for joint_id in range(self.model.njnt):
-            joint_type = self.model.jnt_type[joint_id]
+            joint_type = int(self.model.jnt_type[joint_id])
             # Only include hinge and slide joints (1 DOF)
             if joint_type in [mujoco.mjtJoint.mjJNT_HINGE, mujoco.mjtJoint.mjJNT_SLIDE]:
                 joint_name = mujoco.mj_id2name(self.model, mujoco.mjtObj.mjOBJ_JOINT, joint_id)
@@ -1090,6 +1691,7 @@ class MujocoRobotModel:
         return folder
 
     def _populate_model_folder(self, model_folder, show_options: ShowOptions = None):
+        model_folder.body_frame_targets = None
         show_options = show_options or self.get_default_show_options()
         visualize_mujoco_model(model_folder, self.model, self.body_to_geom, self.mesh_resolver, show_options)
 
@@ -1113,67 +1715,41 @@ class MujocoRobotModel:
         """
         model_folder = self.get_model_folder(name_or_folder)
 
-        q = np.zeros(self.model.nq)
-
-        # Fill in specified joint positions
-        for joint_name, joint_value in q_dict.items():
-            joint_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_JOINT, joint_name)
-            if joint_id < 0:
-                print(f"Warning: Joint '{joint_name}' not found in model")
-                continue
-
-            # Get qpos address for this joint
-            qpos_addr = self.model.jnt_qposadr[joint_id]
-            joint_type = self.model.jnt_type[joint_id]
-
-            # Handle different joint types
-            if joint_type == mujoco.mjtJoint.mjJNT_FREE:
-                # Free joint has 7 DOF (3 pos + 4 quat)
-                if isinstance(joint_value, (list, tuple, np.ndarray)) and len(joint_value) == 7:
-                    q[qpos_addr : qpos_addr + 7] = joint_value
-                else:
-                    print(f"Warning: Free joint '{joint_name}' requires 7 values (pos[3] + quat[4])")
-            elif joint_type == mujoco.mjtJoint.mjJNT_BALL:
-                # Ball joint has 4 DOF (quaternion)
-                if isinstance(joint_value, (list, tuple, np.ndarray)) and len(joint_value) == 4:
-                    q[qpos_addr : qpos_addr + 4] = joint_value
-                else:
-                    print(f"Warning: Ball joint '{joint_name}' requires 4 values (quaternion)")
-            else:
-                # Hinge or slide joint has 1 DOF
-                q[qpos_addr] = float(joint_value)
-
         # Handle world_T_base transform
-        if world_T_base is None:
-            world_T_base = np.eye(4)
-        else:
-            # Validate shape
-            if world_T_base.shape != (4, 4):
-                raise ValueError(f"world_T_base must be a 4x4 matrix, got shape {world_T_base.shape}")
-
-        # Perform forward kinematics (returns base_T_body transforms)
-        base_T_body_poses, base_T_site_poses = forward_kinematics(self.model, self.data, q)
+        if world_T_base is not None and world_T_base.shape != (4, 4):
+            raise ValueError(f"world_T_base must be a 4x4 matrix, got shape {world_T_base.shape}")
 
-        if np.array_equal(world_T_base, np.eye(4)):
-            body_poses = base_T_body_poses
-            site_poses = base_T_site_poses
-        else:
-            body_poses = {}
-            for body_name, base_T_body in base_T_body_poses.items():
-                world_T_body = world_T_base @ base_T_body
-                body_poses[body_name] = world_T_body
+        q = self.kinematics_plan.qpos_from_dict(q_dict)
+        body_pose_array, site_pose_array = self.kinematics_plan.compute(q, world_T_base)
+        return self.show_pose_arrays(body_pose_array, site_pose_array, model_folder)
 
-            site_poses = {}
-            for site_name, base_T_site in base_T_site_poses.items():
-                world_T_site = world_T_base @ base_T_site
-                site_poses[site_name] = world_T_site
+    def show_pose_arrays(self, body_pose_array, site_pose_array, name_or_folder=None):
+        """
+        Update the model with precomputed (nbody, 4, 4) body poses and
+        (nsite, 4, 4) site poses, as returned by compute_trajectory_poses.
+        """
+        model_folder = self.get_model_folder(name_or_folder)
+        body_poses = dict(zip(get_body_name_table(self.model), body_pose_array))
+        site_poses = dict(zip(get_site_name_table(self.model), site_pose_array))
 
         # Apply body poses to geom items
-        self._update_body_frames(body_poses, model_folder)
+        self._update_body_frames(body_pose_array, model_folder)
         model_folder.site_poses = site_poses
         model_folder.body_poses = body_poses
         return body_poses, site_poses
 
+    def compute_trajectory_poses(self, qpos_trajectory, world_T_base=None, chunk_size=1024, num_workers=0):
+        """
+        Compute body and site pose arrays for a (T, nq) trajectory.
+
+        See compute_trajectory_pose_arrays for the arguments.
+        """
+        return compute_trajectory_pose_arrays(self.model, qpos_trajectory, world_T_base, chunk_size, num_workers)
+
+    def create_pose_cache(self, qpos_trajectory, world_T_base=None, max_size=10000):
+        """Create a TrajectoryPoseCache for a (T, nq) trajectory."""
+        return TrajectoryPoseCache(self, qpos_trajectory, world_T_base, max_size=max_size)
+
     def get_site_names(self) -> list[str]:
         return [mujoco.mj_id2name(self.model, mujoco.mjtObj.mjOBJ_SITE, i) for i in range(self.model.nsite)]
 
@@ -1192,24 +1768,59 @@ class MujocoRobotModel:
         body_T_site[:3, 3] = pos
         return body_T_site
 
-    def _update_body_frames(self, body_poses, model_folder):
-        vtk_frames = {body_name: mj_matrix_to_vtk_transform(body_pose) for body_name, body_pose in body_poses.items()}
-        # update geom frames
-        for geom_item in model_folder.geom_items.values():
-            # if the item has been removed then skip it
-            # todo, don't store these items in a dict, look them up as needed
-            if not geom_item._tree:
-                continue
-            world_T_body = vtk_frames[geom_item.body_name]
-            geom_item.getChildFrame().copyFrame(world_T_body)
-
-        # update body frames
+    def _get_body_frame_targets(self, model_folder):
+        """
+        Return (body_id, frame_item) pairs for the geom child frames and body
+        frames of a model folder.  The pairs and a reusable vtkTransform per
+        body are resolved once and cached on the folder until an item is removed.
+        """
+        targets = getattr(model_folder, "body_frame_targets", None)
+        if targets is not None and all(frame._tree for _, frame in targets):
+            return targets
+
+        body_ids = {body_name: body_id for body_id, body_name in enumerate(get_body_name_table(self.model))}
+        targets = []
+        for geom_item in dict.fromkeys(model_folder.geom_items.values()):
+            child_frame = geom_item.getChildFrame() if geom_item._tree else None
+            if child_frame:
+                targets.append((body_ids[geom_item.body_name], child_frame))
         body_frame_folder = model_folder.findChild("Body Frames")
         if body_frame_folder:
-            for body_name, world_T_body in vtk_frames.items():
-                frame_obj = body_frame_folder.findChild(body_name)
-                if frame_obj:
-                    frame_obj.copyFrame(world_T_body)
+            for frame_obj in body_frame_folder.children():
+                body_id = body_ids.get(frame_obj.getProperty("Name"))
+                if body_id is not None:
+                    targets.append((body_id, frame_obj))
+
+        model_folder.body_frame_targets = targets
+        model_folder.body_transforms = [vtk.vtkTransform() for _ in range(self.model.nbody)]
+        model_folder.last_body_pose_array = None
+        return targets
+
+    def _update_body_frames(self, body_pose_array, model_folder):
+        targets = self._get_body_frame_targets(model_folder)
+        last_body_pose_array = model_folder.last_body_pose_array
+        if last_body_pose_array is None:
+            changed = np.ones(len(body_pose_array), dtype=bool)
+        else:
+            changed = np.any(body_pose_array != last_body_pose_array, axis=(1, 2))
+        model_folder.last_body_pose_array = np.array(body_pose_array)
+
+        transforms = model_folder.body_transforms
+        for body_id in np.flatnonzero(changed):
+            transforms[body_id].SetMatrix(body_pose_array[body_id].ravel())
+
+        # Update the frames without rendering, then request one render per view
+        views = {}
+        for body_id, frame_obj in targets:
+            if changed[body_id]:
+                frame_obj.copyFrame(transforms[body_id], render=False)
+                if frame_obj.isShown():
+                    views.update(dict.fromkeys(frame_obj.views))
+        for view in views:
+            if hasattr(view, "render"):
+                view.render()
+            elif hasattr(view, "vtk_widget"):
+                view.vtk_widget.render()
 
     def _create_joint_properties_item(self):
         """Create an ObjectModelItem with properties for each 1 DOF joint."""
@@ -0,0 +1,222 @@
+"""Background thread MuJoCo simulation with double-buffered state snapshots.
+
+MujocoSimRunner steps an MjData on a worker thread at a target real-time
+factor and publishes a SimSnapshot after each batch of steps.  The GUI thread
+reads the latest snapshot at its own rate, for example through
+connect_kinematics_updater, so physics and rendering rates are independent.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+import mujoco
+import numpy as np
+
+from director.mujoco_model import _poses_from_xpos_xmat
+from director.timercallback import TimerCallback
+
+
+@dataclass
+class SimSnapshot:
+    """State of a simulation at one instant, copied out of MjData."""
+
+    sequence: int
+    time: float
+    qpos: np.ndarray
+    qvel: np.ndarray
+    xpos: np.ndarray
+    xmat: np.ndarray
+    site_xpos: np.ndarray
+    site_xmat: np.ndarray
+    contact_pos: np.ndarray
+    contact_frame: np.ndarray
+    contact_geom: np.ndarray
+    contact_dist: np.ndarray
+
+    @classmethod
+    def allocate(cls, model):
+        return cls(
+            sequence=-1,
+            time=0.0,
+            qpos=np.zeros(model.nq),
+            qvel=np.zeros(model.nv),
+            xpos=np.zeros((model.nbody, 3)),
+            xmat=np.zeros((model.nbody, 9)),
+            site_xpos=np.zeros((model.nsite, 3)),
+            site_xmat=np.zeros((model.nsite, 9)),
+            contact_pos=np.zeros((0, 3)),
+            contact_frame=np.zeros((0, 9)),
+            contact_geom=np.zeros((0, 2), dtype=int),
+            contact_dist=np.zeros(0),
+        )
+
+    def copy_from(self, data, sequence):
+        """Fill this snapshot from data, reusing the fixed size arrays."""
+        self.sequence = sequence
+        self.time = data.time
+        self.qpos[:] = data.qpos
+        self.qvel[:] = data.qvel
+        self.xpos[:] = data.xpos
+        self.xmat[:] = data.xmat
+        self.site_xpos[:] = data.site_xpos
+        self.site_xmat[:] = data.site_xmat
+        contact = data.contact
+        self.contact_pos = np.array(contact.pos)
+        self.contact_frame = np.array(contact.frame)
+        self.contact_geom = np.array(contact.geom)
+        self.contact_dist = np.array(contact.dist)
+
+    def copy(self):
+        return SimSnapshot(
+            **{name: np.copy(value) if isinstance(value, np.ndarray) else value for name, value in vars(self).items()}
+        )
+
+    def body_pose_array(self):
+        """Return the body poses as an (nbody, 4, 4) array."""
+        return _poses_from_xpos_xmat(self.xpos, self.xmat)
+
+    def site_pose_array(self):
+        """Return the site poses as an (nsite, 4, 4) array."""
+        return _poses_from_xpos_xmat(self.site_xpos, self.site_xmat)
+
+
+class MujocoSimRunner:
+    """
+    Step a MuJoCo simulation on a background thread.
+
+    The thread advances data so that simulation time tracks wall clock time
+    scaled by real_time_factor, or steps as fast as possible when
+    real_time_factor is None.  After each batch of steps the state is copied
+    into the back buffer of a double buffer and the buffers are swapped, so
+    readers always see a complete snapshot and never block the simulation
+    for longer than a buffer swap.
+
+    control_callback(model, data), if given, is called on the simulation
+    thread before every mj_step.
+    """
+
+    def __init__(self, model, data=None, real_time_factor=1.0, control_callback=None, max_steps_per_batch=100):
+        self.model = model
+        self.data = data if data is not None else mujoco.MjData(model)
+        self.real_time_factor = real_time_factor
+        self.control_callback = control_callback
+        self.max_steps_per_batch = max_steps_per_batch
+        self.error = None
+        self._step_count = 0
+        self._buffers = [SimSnapshot.allocate(model), SimSnapshot.allocate(model)]
+        self._front = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._viewer_timers = []
+
+    def start(self):
+        """Start stepping on the background thread."""
+        if self.is_running():
+            return
+        self.error = None
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="MujocoSimRunner", daemon=True)
+        self._thread.start()
+        for timer in self._viewer_timers:
+            timer.start()
+
+    def stop(self):
+        """Stop the background thread and wait for it to exit."""
+        for timer in self._viewer_timers:
+            timer.stop()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_step_count(self):
+        return self._step_count
+
+    def set_real_time_factor(self, real_time_factor):
+        """Set the real-time factor, None steps as fast as possible."""
+        self.real_time_factor = real_time_factor
+
+    def get_latest_snapshot(self, newer_than=None):
+        """
+        Return a copy of the most recently published snapshot.
+
+        Returns None if nothing has been published yet, or if newer_than is
+        given and the latest snapshot sequence is not greater than it.
+        """
+        with self._lock:
+            snapshot = self._buffers[self._front]
+            if snapshot.sequence < 0 or (newer_than is not None and snapshot.sequence <= newer_than):
+                return None
+            return snapshot.copy()
+
+    def connect_kinematics_updater(self, kinematics_updater, name_or_folder=None, target_fps=60):
+        """
+        Show the latest snapshot through a KinematicsUpdater at target_fps on
+        the GUI thread.  Returns the TimerCallback driving the updates.
+        """
+        last_sequence = [None]
+
+        def on_tick():
+            snapshot = self.get_latest_snapshot(newer_than=last_sequence[0])
+            if snapshot is not None:
+                last_sequence[0] = snapshot.sequence
+                kinematics_updater.push_snapshot(snapshot).commit(name_or_folder)
+
+        timer = TimerCallback(targetFps=target_fps, callback=on_tick)
+        self._viewer_timers.append(timer)
+        if self.is_running():
+            timer.start()
+        return timer
+
+    def _publish(self):
+        back = 1 - self._front
+        self._buffers[back].copy_from(self.data, self._step_count)
+        with self._lock:
+            self._front = back
+
+    def _run(self):
+        try:
+            # Run position dependent quantities once so the first snapshot is valid
+            mujoco.mj_forward(self.model, self.data)
+            self._publish()
+            self._step_loop()
+        except Exception as e:
+            self.error = e
+            print(f"Error: MuJoCo simulation thread stopped: {e}")
+
+    def _step_loop(self):
+        timestep = self.model.opt.timestep
+        real_time_factor = self.real_time_factor
+        wall_start = time.perf_counter()
+        sim_start = self.data.time
+
+        while not self._stop_event.is_set():
+            # Restart the clock when the real-time factor changes
+            if self.real_time_factor != real_time_factor:
+                real_time_factor = self.real_time_factor
+                wall_start = time.perf_counter()
+                sim_start = self.data.time
+
+            if real_time_factor:
+                target_time = sim_start + (time.perf_counter() - wall_start) * real_time_factor
+                num_steps = min(int((target_time - self.data.time) / timestep), self.max_steps_per_batch)
+            else:
+                num_steps = self.max_steps_per_batch
+
+            for _ in range(num_steps):
+                if self.control_callback:
+                    self.control_callback(self.model, self.data)
+                mujoco.mj_step(self.model, self.data)
+                self._step_count += 1
+
+            if num_steps > 0:
+                self._publish()
+            if real_time_factor:
+                # Sleep until the next step is due
+                next_step_wall_time = wall_start + (self.data.time + timestep - sim_start) / real_time_factor
+                self._stop_event.wait(max(0.0, next_step_wall_time - time.perf_counter()))
@@ -6,6 +6,7 @@ The :class:`ObjectModelItem` is the base class for all items in the tree.
 """
 
 from collections import defaultdict
+from contextlib import ExitStack, contextmanager
 
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtCore import QSortFilterProxyModel
@@ -65,10 +66,14 @@ class ObjectModelItem:
 
     def __setstate__(self, state):
         self._tree = None
+        self._batchDepth = 0
+        self._renderPending = False
         self.properties = state["properties"]
 
     def __init__(self, name, properties=None, icon=None):
         self._tree = None
+        self._batchDepth = 0
+        self._renderPending = False
         self.actionDelegates = []
         self.callbacks = callbacks.CallbackRegistry([self.REMOVED_FROM_OBJECT_MODEL])
         self.properties = properties or PropertySet()
@@ -116,6 +121,34 @@ class ObjectModelItem:
     def connectPropertyValueChanged(self, propertyName, func):
         return self.properties.connectPropertyValueChanged(propertyName, func)
 
+    @contextmanager
+    def batchUpdate(self):
+        """Coalesce property change notifications and renders.
+
+        Property changed callbacks are dispatched once per changed property
+        when the context exits, and the renders they request collapse into
+        a single render.
+        """
+        self._batchDepth += 1
+        try:
+            with self.properties.batchUpdate():
+                yield self
+        finally:
+            self._batchDepth -= 1
+            if not self._batchDepth and self._renderPending:
+                self._renderPending = False
+                self._renderAllViews()
+
+    def _deferRender(self):
+        """Return True, and remember the request, if a render should wait for batchUpdate() to exit."""
+        if self._batchDepth:
+            self._renderPending = True
+            return True
+        return False
+
+    def _renderAllViews(self):
+        pass
+
     def _onPropertyChanged(self, propertySet, propertyName):
         if self._tree is not None:
             self._tree._onPropertyValueChanged(self, propertyName)
@@ -132,6 +165,19 @@ class ObjectModelItem:
     def hasActor(self, actor):
         return False
 
+    def getDataSets(self):
+        """Return the datasets indexed for lookup with findObjectByDataSet()."""
+        return []
+
+    def getActors(self):
+        """Return the actors indexed for lookup with findObjectByActor()."""
+        return []
+
+    def _updateObjectIndex(self):
+        """Refresh the tree's actor and dataset index after they change."""
+        if self._tree is not None:
+            self._tree._indexObject(self)
+
     def getActionNames(self):
         actions = []
         if not self.getPropertyAttribute("Name", "readOnly"):
@@ -228,6 +274,9 @@ class ObjectModelTree:
         self._itemToObject = {}
         self._itemToName = {}
         self._nameToItems = defaultdict(set)
+        self._actorToObjects = {}
+        self._dataSetToObjects = {}
+        self._objectIndexKeys = {}
         self._blockSignals = False
         self.actions = []
         self.callbacks = callbacks.CallbackRegistry(
@@ -341,6 +390,41 @@ class ObjectModelTree:
                 return None
         return obj
 
+    def findObjectByActor(self, actor):
+        objects = self._actorToObjects.get(actor)
+        if objects:
+            return objects[0]
+
+    def findObjectByDataSet(self, dataSet):
+        objects = self._dataSetToObjects.get(id(dataSet))
+        if objects:
+            return objects[0]
+
+    def _indexObject(self, obj):
+        # The keys are remembered per object because its actors and datasets
+        # may already have changed when it is unindexed.  Actors are keyed by
+        # the actor.  Datasets are keyed by id(), because the vtkDataSet
+        # subclasses of the VTK data model define __eq__ and are unhashable,
+        # and the remembered datasets keep those ids from being reused.
+        self._unindexObject(obj)
+        actors = [actor for actor in obj.getActors() if actor is not None]
+        dataSets = [dataSet for dataSet in obj.getDataSets() if dataSet is not None]
+        for actor in actors:
+            self._actorToObjects.setdefault(actor, []).append(obj)
+        for dataSet in dataSets:
+            self._dataSetToObjects.setdefault(id(dataSet), []).append(obj)
+        self._objectIndexKeys[obj] = (actors, dataSets)
+
+    def _unindexObject(self, obj):
+        actors, dataSets = self._objectIndexKeys.pop(obj, ((), ()))
+        dataSetIds = [id(dataSet) for dataSet in dataSets]
+        for index, keys in ((self._actorToObjects, actors), (self._dataSetToObjects, dataSetIds)):
+            for key in keys:
+                objects = index[key]
+                objects.remove(obj)
+                if not objects:
+                    del index[key]
+
     def findChildByName(self, parent, name):
         parentItem = self._getItemForObject(parent) if parent else None
         for item in self._nameToItems[name]:
@@ -412,6 +496,7 @@ class ObjectModelTree:
         obj.callbacks.process(obj.REMOVED_FROM_OBJECT_MODEL, self, obj)
         obj.onRemoveFromObjectModel()
         obj._tree = None
+        self._unindexObject(obj)
 
         name = self._itemToName.pop(item)
         self._nameToItems[name].remove(item)
@@ -445,6 +530,7 @@ class ObjectModelTree:
         self._itemToObject[item] = obj
         self._itemToName[item] = objName
         self._nameToItems[objName].add(item)
+        self._indexObject(obj)
 
         if parentItem is None:
             self.itemModel.appendRow([item, visItem])
@@ -470,6 +556,18 @@ class ObjectModelTree:
         self.addToObjectModel(obj, parentObj)
         return obj
 
+    @contextmanager
+    def batchUpdate(self, objs=None):
+        """Batch property updates on several objects, see ObjectModelItem.batchUpdate().
+
+        objs defaults to every object currently in the tree.
+        """
+        objs = self.getObjects() if objs is None else list(objs)
+        with ExitStack() as stack:
+            for obj in objs:
+                stack.enter_context(obj.batchUpdate())
+            yield
+
     def getOrCreateContainer(self, name, parentObj=None, collapsed=False):
         if parentObj:
             containerObj = parentObj.findChild(name)
@@ -675,6 +773,14 @@ def findTopLevelObjectByName(name):
     return _t.findTopLevelObjectByName(name)
 
 
+def findObjectByActor(actor):
+    return _t.findObjectByActor(actor)
+
+
+def findObjectByDataSet(dataSet):
+    return _t.findObjectByDataSet(dataSet)
+
+
 def removeFromObjectModel(obj):
     _t.removeFromObjectModel(obj)
 
@@ -699,6 +805,10 @@ def getOrCreateContainer(name, parentObj=None, collapsed=False):
     return _t.getOrCreateContainer(name, parentObj, collapsed)
 
 
+def batchUpdate(objs=None):
+    return _t.batchUpdate(objs)
+
+
 def isInitialized():
     """Check if the object model is initialized."""
     return _t.getTreeView() is not None
@@ -723,8 +833,10 @@ def addParentPropertySync(obj):
 
         def onPropertyChanged(propertySet, propertyName):
             if propertyName in parent._syncedProperties:
-                for obj in parent.children():
-                    obj.setProperty(propertyName, propertySet.getProperty(propertyName))
+                children = parent.children()
+                with batchUpdate(children):
+                    for obj in children:
+                        obj.setProperty(propertyName, propertySet.getProperty(propertyName))
 
         parent._syncedProperties = set()
         parent.properties.connectPropertyChanged(onPropertyChanged)
@@ -99,19 +99,18 @@ class PointPicker(QtCore.QObject):
         points = [p if p is not None else self.hoverPos for p in self.points]
 
         # draw points
-        for p in points:
-            if p is not None:
-                d.addSphere(p, radius=0.008)
+        d.addSpheres([p for p in points if p is not None], radii=0.008)
 
         if self.drawLines:
             # draw lines
-            for a, b in zip(points, points[1:]):
-                if b is not None:
-                    d.addLine(a, b)
+            segments = [(a, b) for a, b in zip(points, points[1:]) if b is not None]
 
             # connect end points
             if points[-1] is not None and self.drawClosedLoop:
-                d.addLine(points[0], points[-1])
+                segments.append((points[0], points[-1]))
+
+            if segments:
+                d.addLines(*zip(*segments))
 
         self.annotationObj = vis.updatePolyData(
             d.getPolyData(), self.annotationName, parent=self.annotationFolder, view=self.view
@@ -255,12 +254,10 @@ class ImagePointPicker(QtCore.QObject):
         # draw points
         radius = 5
         scale = (2 * self.view.camera().GetParallelScale()) / (self.view.renderer().GetSize()[1])
-        for p in points:
-            d.addSphere(p, radius=radius * scale)
+        d.addSpheres(points, radii=radius * scale)
 
         if self.drawLines and len(points) > 1:
-            for a, b in zip(points, points[1:]):
-                d.addLine(a, b)
+            d.addLines(points[:-1], points[1:])
 
             # connect end points
             # d.addLine(points[0], points[-1])
@@ -284,8 +281,7 @@ class ImagePointPicker(QtCore.QObject):
         center = np.array(center)
 
         d = DebugData()
-        d.addLine(center + [0, -3000, 0], center + [0, 3000, 0])
-        d.addLine(center + [-3000, 0, 0], center + [3000, 0, 0])
+        d.addLines([center + [0, -3000, 0], center + [-3000, 0, 0]], [center + [0, 3000, 0], center + [3000, 0, 0]])
         self.cursorObj = vis.updatePolyData(d.getPolyData(), "cursor", alpha=0.5, view=self.view)
         self.cursorObj.addToView(self.view)
         self.cursorObj.actor.SetUseBounds(False)
@@ -1,6 +1,7 @@
 import copy
 import re
 from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Any, Dict
 
 from director import callbacks
@@ -87,6 +88,8 @@ class PropertySet(object):
         self._properties = OrderedDict()
         self._attributes = {}
         self._alternateNames = {}
+        self._batchDepth = 0
+        self._pendingChanges = {}
 
     def propertyNames(self):
         return list(self._properties.keys())
@@ -178,8 +181,33 @@ class PropertySet(object):
             return
 
         self._properties[propertyName] = propertyValue
+        if self._batchDepth:
+            self._pendingChanges[propertyName] = None
+            return
         self.callbacks.process(self.PROPERTY_CHANGED_SIGNAL, self, propertyName)
 
+    @contextmanager
+    def batchUpdate(self):
+        """Defer property changed notifications until the context exits.
+
+        Values are stored immediately, but each changed property is notified
+        only once, in the order it first changed, when the outermost batch
+        exits.  Batches may be nested.
+        """
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if not self._batchDepth:
+                self._flushPendingChanges()
+
+    def _flushPendingChanges(self):
+        pendingChanges, self._pendingChanges = self._pendingChanges, {}
+        for propertyName in pendingChanges:
+            if propertyName in self._properties:
+                self.callbacks.process(self.PROPERTY_CHANGED_SIGNAL, self, propertyName)
+
     def getPropertyAttribute(self, propertyName, propertyAttribute):
         attributes = self._attributes[propertyName]
         return attributes[propertyAttribute]
@@ -0,0 +1,195 @@
+"""Central scheduling of view renders.
+
+VTKWidget.render() only marks the view dirty with the global RenderScheduler.
+The scheduler renders dirty views from a single timer, so any number of
+requests made during one frame, by property changes, timer callbacks, sliders
+or streaming updates, produce at most one render per view.  Each view's render
+rate is capped at its max fps, and when a frame budget is set, views with a
+lower priority wait for the next frame once the budget is used up.  While the
+user interacts with a view, VTKWidget marks it with set_view_interacting()
+and it renders with PRIORITY_INTERACTIVE.
+
+Views are held weakly, a deleted view is dropped along with its requests.
+"""
+
+import time
+import weakref
+from dataclasses import dataclass
+
+from qtpy import QtCore
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BACKGROUND = 2
+
+
+@dataclass
+class RenderSchedulerStats:
+    """Counters reported by RenderScheduler.get_stats()."""
+
+    requests: int = 0
+    renders: int = 0
+    coalesced: int = 0
+    rate_limited: int = 0
+    over_budget: int = 0
+
+
+class RenderScheduler:
+    """
+    Render dirty views at most once per frame.
+
+    Stats count render requests, renders, requests coalesced into an already
+    pending render, and renders postponed by a view's fps cap (rate_limited)
+    or by the frame budget (over_budget).
+    """
+
+    def __init__(self, max_fps=60.0, frame_budget=None):
+        """
+        Args:
+            max_fps: Default render rate cap for each view
+            frame_budget: Seconds of rendering per tick after which views that
+                are not interactive wait for the next tick, None for no limit
+        """
+        self.max_fps = max_fps
+        self.frame_budget = frame_budget
+        self._dirty = weakref.WeakKeyDictionary()
+        self._interacting = weakref.WeakSet()
+        self._last_render_time = weakref.WeakKeyDictionary()
+        self._view_max_fps = weakref.WeakKeyDictionary()
+        self._view_priority = weakref.WeakKeyDictionary()
+        self._stats = RenderSchedulerStats()
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timer)
+
+    def set_view_priority(self, view, priority):
+        """Set the priority of a view, one of the PRIORITY_ constants."""
+        self._view_priority[view] = priority
+
+    def get_view_priority(self, view):
+        if view in self._interacting:
+            return PRIORITY_INTERACTIVE
+        return self._view_priority.get(view, PRIORITY_NORMAL)
+
+    def set_view_interacting(self, view, interacting):
+        """Render view with PRIORITY_INTERACTIVE while the user interacts with it."""
+        if interacting:
+            self._interacting.add(view)
+        else:
+            self._interacting.discard(view)
+
+    def is_view_interacting(self, view):
+        return view in self._interacting
+
+    def set_view_max_fps(self, view, max_fps):
+        """Cap the render rate of a view, None uses the scheduler max_fps."""
+        if max_fps is None:
+            self._view_max_fps.pop(view, None)
+        else:
+            self._view_max_fps[view] = max_fps
+
+    def get_view_max_fps(self, view):
+        return self._view_max_fps.get(view, self.max_fps)
+
+    def request_render(self, view):
+        """Mark view as needing a render."""
+        self._stats.requests += 1
+        if view in self._dirty:
+            self._stats.coalesced += 1
+            return
+        self._dirty[view] = True
+        if self._get_due_time(view) > time.perf_counter():
+            self._stats.rate_limited += 1
+        self._schedule()
+
+    def is_render_pending(self, view):
+        return view in self._dirty
+
+    def begin_render(self, view):
+        """
+        Called by a view when it starts rendering, from the scheduler or from
+        VTKWidget.forceRender().  The render satisfies any pending request, and
+        requests made while it renders are kept for the next frame.
+        """
+        self._last_render_time[view] = time.perf_counter()
+        self._dirty.pop(view, None)
+
+    def discard(self, view):
+        """Drop a pending render request for view."""
+        self._dirty.pop(view, None)
+
+    def get_stats(self):
+        """Return a RenderSchedulerStats snapshot."""
+        return RenderSchedulerStats(**vars(self._stats))
+
+    def reset_stats(self):
+        self._stats = RenderSchedulerStats()
+
+    def flush(self):
+        """Render all dirty views now, ignoring fps caps and the frame budget."""
+        self._timer.stop()
+        for view in self._sorted_dirty_views():
+            self._render(view)
+
+    def _get_due_time(self, view):
+        last_render_time = self._last_render_time.get(view)
+        max_fps = self.get_view_max_fps(view)
+        if last_render_time is None or not max_fps:
+            return 0.0
+        return last_render_time + 1.0 / max_fps
+
+    def _sorted_dirty_views(self):
+        return sorted(self._dirty, key=self.get_view_priority)
+
+    def _schedule(self, min_wait=0.0):
+        if not self._dirty:
+            return
+        wait = min(self._get_due_time(view) for view in self._dirty) - time.perf_counter()
+        wait = max(wait, min_wait)
+        wait_milliseconds = max(0, int(wait * 1000.0 + 0.5))
+        if self._timer.isActive() and self._timer.remainingTime() <= wait_milliseconds:
+            return
+        self._timer.start(wait_milliseconds)
+
+    def _render(self, view):
+        self._dirty.pop(view, None)
+        try:
+            view.forceRender()
+        except RuntimeError:
+            # The Qt widget was deleted while its Python wrapper is still alive
+            return
+        self._stats.renders += 1
+
+    def _on_timer(self):
+        start_time = time.perf_counter()
+        over_budget = False
+        rendered = False
+        for view in self._sorted_dirty_views():
+            now = time.perf_counter()
+            if now < self._get_due_time(view):
+                continue
+            # At least one view renders each tick so none of them starve
+            if (
+                rendered
+                and self.frame_budget is not None
+                and now - start_time > self.frame_budget
+                and self.get_view_priority(view) != PRIORITY_INTERACTIVE
+            ):
+                self._stats.over_budget += 1
+                over_budget = True
+                continue
+            self._render(view)
+            rendered = True
+        # Views postponed by the frame budget wait for the next frame
+        self._schedule(min_wait=1.0 / self.max_fps if over_budget and self.max_fps else 0.0)
+
+
+_default_scheduler = None
+
+
+def get_render_scheduler():
+    """Return the global RenderScheduler used by VTKWidget.render()."""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = RenderScheduler()
+    return _default_scheduler
@@ -6,21 +6,24 @@ import subprocess
 import sys
 from pathlib import Path
 
+import numpy as np
 import qtpy.QtCore as QtCore
 import qtpy.QtGui as QtGui
 import qtpy.QtWidgets as QtWidgets
 
 from director import vtkAll as vtk
 from director import vtkNumpy as vnp
-from director.ffmpeg_writer import FFMpegWriter
+from director.ffmpeg_writer import AsyncFrameWriter, FFMpegWriter
 from director.timercallback import TimerCallback
+from director.video_spool import SpoolEncodeJob, SpoolWriter
 
 
-def capture_screenshot(view):
+def capture_screenshot(view, out=None):
     """Capture a screenshot from the view and return as numpy array.
 
     Args:
         view: VTKWidget instance to capture from
+        out: Optional (height, width, 3) uint8 array to copy the image into
 
     Returns:
         numpy array of shape (height, width, 3) with uint8 RGB data
@@ -36,12 +39,104 @@ def capture_screenshot(view):
 
     vtk_image = grabber.GetOutput()
     numpy_image = vnp.getNumpyImageFromVtk(vtk_image)
+    if out is not None:
+        np.copyto(out, numpy_image)
+        return out
     return numpy_image
 
 
+def get_export_frame_values(start, end, framerate, playback_rate=1.0):
+    """Return the slider values of the frames exported between start and end.
+
+    Frame i is at start + i * playback_rate / framerate, computed from the
+    frame index so that the timing does not depend on accumulated steps.
+    """
+    num_frames = int(np.floor((end - start) * framerate / playback_rate + 1e-9)) + 1
+    return start + np.arange(num_frames) * (playback_rate / framerate)
+
+
+def export_slider_playback(
+    view,
+    slider,
+    writer,
+    start=None,
+    end=None,
+    framerate=30.0,
+    playback_rate=1.0,
+    offscreen=False,
+    progress_callback=None,
+):
+    """Export slider playback to a video writer, as fast as frames can be rendered.
+
+    The slider is stepped through the frame values from
+    get_export_frame_values.  For each frame, pending Qt events are
+    processed so deferred scene updates run, the view is rendered
+    synchronously and then captured.  If writer has acquire_buffer (for
+    example AsyncFrameWriter), frames are captured straight into its buffers
+    and encoded while the next frame renders.  Export waits for a free
+    buffer whatever the writer's backpressure policy, so no frames are dropped.
+
+    Args:
+        view: VTKWidget instance to capture from
+        slider: ValueSlider to step
+        writer: Writer with write_frame(frame), sized to the render window
+        start: First slider value, defaults to slider.minValue
+        end: Last slider value, defaults to slider.maxValue
+        framerate: Output frame rate in fps
+        playback_rate: Slider value change per second of output video
+        offscreen: Render with offscreen rendering enabled, so the view does
+            not need to be visible
+        progress_callback: Called as progress_callback(frames_done, num_frames),
+            return False to stop the export
+
+    Returns:
+        Number of frames written
+    """
+    start = slider.minValue if start is None else start
+    end = slider.maxValue if end is None else end
+    values = get_export_frame_values(start, end, framerate, playback_rate)
+
+    render_window = view.renderWindow()
+    original_offscreen = render_window.GetOffScreenRendering()
+    original_value = slider.getValue()
+    slider.pause()
+    if offscreen:
+        render_window.SetOffScreenRendering(True)
+
+    frames_done = 0
+    try:
+        for value in values:
+            slider.setValue(value)
+            QtWidgets.QApplication.processEvents()
+            view.forceRender()
+
+            if hasattr(writer, "acquire_buffer"):
+                buffer = writer.acquire_buffer(block=True)
+                try:
+                    capture_screenshot(view, out=buffer)
+                except Exception:
+                    writer.release_buffer(buffer)
+                    raise
+                writer.submit(buffer)
+            else:
+                writer.write_frame(capture_screenshot(view))
+
+            frames_done += 1
+            if progress_callback and progress_callback(frames_done, len(values)) is False:
+                break
+    finally:
+        render_window.SetOffScreenRendering(original_offscreen)
+        slider.setValue(original_value)
+    return frames_done
+
+
 class ScreenRecorder:
     """Manages screen recording with FFMpegWriter and provides a toolbar widget."""
 
+    # Backpressure policy for each writer mode until one is chosen from the
+    # menu.  Spooling keeps up with capture, so it does not need to drop frames.
+    DEFAULT_BACKPRESSURE_POLICIES = {"stream": "adaptive", "spool": "block"}
+
     def __init__(self, main_window, view):
         """
         Initialize screen recorder.
@@ -54,6 +149,11 @@ class ScreenRecorder:
         self.main_window = main_window
         self.view = view
         self.framerate = 30.0
+        self.queue_size = 8
+        self.writer_mode = "stream"
+        self.backpressure_policy = self.DEFAULT_BACKPRESSURE_POLICIES[self.writer_mode]
+        self.backpressure_policy_chosen = False
+        self.encode_job = None
 
         self.writer = None
         self.is_recording = False
@@ -78,11 +178,23 @@ class ScreenRecorder:
         self.record_button.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.record_button.customContextMenuRequested.connect(self._show_context_menu)
 
-        # Store filename for dialog
+        # Store filename and final writer stats for dialog
         self.current_filename = None
+        self.last_stats = None
 
         self.capture_timer = TimerCallback(targetFps=self.framerate, callback=self._on_capture_timer)
 
+        # Writer queue stats shown next to the record button while recording
+        self.stats_label = QtWidgets.QLabel()
+        self.stats_label.setVisible(False)
+        self.stats_timer = TimerCallback(targetFps=2, callback=self._update_stats_label)
+        self.encode_timer = TimerCallback(targetFps=4, callback=self._on_encode_timer)
+        self.widget = QtWidgets.QWidget()
+        layout = QtWidgets.QHBoxLayout(self.widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.record_button)
+        layout.addWidget(self.stats_label)
+
         # Initialize context menu
         self._setup_context_menu()
 
@@ -173,6 +285,47 @@ class ScreenRecorder:
 
         self.capture_mode = "timer"
 
+        # Backpressure submenu, what to do when the encoder falls behind
+        backpressure_menu = self.context_menu.addMenu("When Encoder Falls Behind")
+        backpressure_group = QtGui.QActionGroup(backpressure_menu)
+        backpressure_group.setExclusive(True)
+        self.backpressure_actions = {}
+        for policy, text in [
+            ("block", "Wait (never drop frames)"),
+            ("drop", "Drop frames"),
+            ("adaptive", "Wait one frame, then drop"),
+        ]:
+            action = QtWidgets.QAction(text, backpressure_menu)
+            action.setCheckable(True)
+            action.setChecked(policy == self.backpressure_policy)
+            action.triggered.connect(lambda checked, policy=policy: self._choose_backpressure_policy(policy))
+            backpressure_group.addAction(action)
+            backpressure_menu.addAction(action)
+            self.backpressure_actions[policy] = action
+
+        # Offline export of the connected value slider
+        self.export_action = QtWidgets.QAction("Export Playback...", self.context_menu)
+        self.export_action.setEnabled(False)
+        self.export_action.triggered.connect(lambda: self.export_playback())
+        self.context_menu.addAction(self.export_action)
+
+        # Writer mode submenu
+        writer_mode_menu = self.context_menu.addMenu("Writer Mode")
+        writer_mode_group = QtGui.QActionGroup(writer_mode_menu)
+        writer_mode_group.setExclusive(True)
+        self.writer_mode_actions = {}
+        for mode, text in [
+            ("stream", "Stream to ffmpeg"),
+            ("spool", "Spool raw frames, encode after recording"),
+        ]:
+            action = QtWidgets.QAction(text, writer_mode_menu)
+            action.setCheckable(True)
+            action.setChecked(mode == self.writer_mode)
+            action.triggered.connect(lambda checked, mode=mode: self._set_writer_mode(mode))
+            writer_mode_group.addAction(action)
+            writer_mode_menu.addAction(action)
+            self.writer_mode_actions[mode] = action
+
     def _set_capture_mode(self, mode: str):
         """Set the capture mode ('timer' or 'playback')."""
         self.capture_mode = mode
@@ -183,6 +336,32 @@ class ScreenRecorder:
         elif mode == "playback":
             self.playback_action.setChecked(True)
 
+    def _set_backpressure_policy(self, policy: str):
+        """Set the backpressure policy ('block', 'drop' or 'adaptive')."""
+        self.backpressure_policy = policy
+        self.backpressure_actions[policy].setChecked(True)
+
+    def _choose_backpressure_policy(self, policy: str):
+        """Set the backpressure policy chosen from the menu, kept when the writer mode changes."""
+        self.backpressure_policy_chosen = True
+        self._set_backpressure_policy(policy)
+
+    def _set_writer_mode(self, mode: str):
+        """Set the writer mode ('stream' or 'spool')."""
+        self.writer_mode = mode
+        self.writer_mode_actions[mode].setChecked(True)
+        if not self.backpressure_policy_chosen:
+            self._set_backpressure_policy(self.DEFAULT_BACKPRESSURE_POLICIES[mode])
+
+    def _get_spool_dir(self, filename: str) -> str:
+        return os.path.splitext(filename)[0] + ".spool"
+
+    def _create_writer(self, width: int, height: int):
+        """Create the writer for the current writer mode."""
+        if self.writer_mode == "spool":
+            return SpoolWriter(self._get_spool_dir(self.current_filename), width, height, framerate=self.framerate)
+        return FFMpegWriter(filename=self.current_filename, width=width, height=height, framerate=self.framerate)
+
     def _show_context_menu(self, position):
         """Show the context menu at the given position."""
         self.context_menu.exec_(self.record_button.mapToGlobal(position))
@@ -290,9 +469,13 @@ class ScreenRecorder:
         self.current_filename = str(filename)
 
         try:
-            # Create FFMpegWriter
-            self.writer = FFMpegWriter(
-                filename=self.current_filename, width=width, height=height, framerate=self.framerate
+            # Create the writer, fed from a background thread
+            self.writer = AsyncFrameWriter(
+                self._create_writer(width, height),
+                width,
+                height,
+                queue_size=self.queue_size,
+                policy=self.backpressure_policy,
             )
         except Exception as e:
             # If creation failed, cleanup
@@ -325,6 +508,10 @@ class ScreenRecorder:
             self.capture_timer.targetFps = self.framerate
             self.capture_timer.start()
 
+        self._update_stats_label()
+        self.stats_label.setVisible(True)
+        self.stats_timer.start()
+
     def _stop_recording(self):
         """Stop the current recording."""
         if not self.is_recording or self.writer is None:
@@ -332,11 +519,16 @@ class ScreenRecorder:
 
         # Stop timer immediately
         self.capture_timer.stop()
+        self.stats_timer.stop()
+        self.stats_label.setVisible(False)
 
-        # Close the writer
+        # Close the writer, this waits for the queued frames to be encoded
+        self.last_stats = self.writer.get_stats()
+        encode_spool = self.writer_mode == "spool"
         try:
             self.writer.close()
         except Exception as e:
+            encode_spool = False
             error_dialog = QtWidgets.QMessageBox(self.main_window)
             error_dialog.setIcon(QtWidgets.QMessageBox.Critical)
             error_dialog.setWindowTitle("Recording Error")
@@ -360,14 +552,60 @@ class ScreenRecorder:
         # Re-enable context menu
         self.record_button.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
 
-        # Show completion dialog with filename (if it exists)
-        if self.current_filename:
+        # Show completion dialog with filename (if it exists), spooled
+        # recordings show it when the encode job finishes
+        if encode_spool:
+            self._start_encode_job(self.current_filename, self.last_stats)
+        elif self.current_filename:
             self._show_completion_dialog()
 
         self.current_filename = None
+        self.last_stats = None
         self.recording_width = None
         self.recording_height = None
 
+    def _start_encode_job(self, filename: str, stats):
+        """Encode the spool for filename on a background thread."""
+        self.encode_job = SpoolEncodeJob(self._get_spool_dir(filename), filename, remove_spool=True)
+        self.encode_job.stats = stats
+        self.encode_job.start()
+        self.record_button.setEnabled(False)
+        self.stats_label.setVisible(True)
+        self._on_encode_timer()
+        self.encode_timer.start()
+
+    def _on_encode_timer(self):
+        job = self.encode_job
+        if job.is_running():
+            self.stats_label.setText(f"Encoding {job.get_fraction_done():.0%}")
+            return
+
+        self.encode_timer.stop()
+        self.stats_label.setVisible(False)
+        self.record_button.setEnabled(True)
+        self.encode_job = None
+
+        if job.error is not None:
+            error_dialog = QtWidgets.QMessageBox(self.main_window)
+            error_dialog.setIcon(QtWidgets.QMessageBox.Critical)
+            error_dialog.setWindowTitle("Encoding Error")
+            error_dialog.setText(
+                f"Error encoding video file:\n{str(job.error)}\n\n"
+                f"The captured frames are kept in:\n{job.spool_dir}\n"
+                "Retry resumes from the last finished segment."
+            )
+            error_dialog.setStandardButtons(QtWidgets.QMessageBox.Retry | QtWidgets.QMessageBox.Close)
+            if error_dialog.exec() == QtWidgets.QMessageBox.Retry:
+                self._start_encode_job(job.filename, job.stats)
+            return False
+
+        self.current_filename = job.filename
+        self.last_stats = job.stats
+        self._show_completion_dialog()
+        self.current_filename = None
+        self.last_stats = None
+        return False
+
     def _show_completion_dialog(self):
         """Show dialog with recording filename.
 
@@ -389,6 +627,9 @@ class ScreenRecorder:
         filename_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
         layout.addWidget(filename_label)
 
+        if self.last_stats is not None:
+            layout.addWidget(QtWidgets.QLabel(self._format_stats(self.last_stats)))
+
         # Buttons
         button_layout = QtWidgets.QHBoxLayout()
 
@@ -470,8 +711,21 @@ class ScreenRecorder:
                 os.startfile(str(videos_dir))
 
     def get_widget(self):
-        """Get the record button widget for adding to toolbar."""
-        return self.record_button
+        """Get the record button and stats label widget for adding to toolbar."""
+        return self.widget
+
+    def _format_stats(self, stats):
+        return (
+            f"{stats.frames_written} frames written, {stats.frames_dropped} dropped, "
+            f"latency {stats.mean_latency * 1000:.0f} ms (max {stats.max_latency * 1000:.0f} ms)"
+        )
+
+    def _update_stats_label(self):
+        if self.writer is None:
+            return
+        stats = self.writer.get_stats()
+        self.stats_label.setText(f"{stats.frames_written} frames, {stats.frames_dropped} dropped")
+        self.stats_label.setToolTip(f"{self._format_stats(stats)}, {stats.queue_depth} queued")
 
     def connect_to_value_slider(self, slider):
         """Connect to a ValueSlider to capture frames on value changes.
@@ -485,6 +739,114 @@ class ScreenRecorder:
         # Automatically switch to playback mode and 60fps when connected to slider
         self._set_capture_mode("playback")
         self._set_framerate(60.0)
+        self.export_action.setEnabled(True)
+
+    def export_playback(self, filename=None, start=None, end=None, playback_rate=None, offscreen=False):
+        """Export the connected value slider playback to a video file.
+
+        Unlike playback capture mode this does not follow the slider in real
+        time.  The slider is stepped at the recorder framerate and each frame
+        is rendered and captured as fast as possible, see
+        export_slider_playback.  No frames are dropped, so every export of the
+        same range produces the same frames.
+
+        Args:
+            filename: Output filename, defaults to a new file in ~/Videos
+            start: First slider value, defaults to the slider minimum
+            end: Last slider value, defaults to the slider maximum
+            playback_rate: Slider value change per second of video, defaults
+                to the slider animation rate
+            offscreen: Render offscreen, the view does not need to be visible
+
+        Returns:
+            The number of frames exported, or None if the export did not start
+        """
+        if self.value_slider is None or self.is_recording or self.encode_job is not None:
+            return None
+
+        if playback_rate is None:
+            playback_rate = abs(self.value_slider.animationRateTarget) or 1.0
+
+        if filename is None:
+            videos_dir = Path.home() / "Videos"
+            videos_dir.mkdir(exist_ok=True)
+            datetime_str = datetime.datetime.now().strftime("%Y-%m-%d_%H%M%S")
+            filename = str(videos_dir / f"{datetime_str}_director_export.mp4")
+
+        if offscreen:
+            render_window = self.view.renderWindow()
+            original_size = render_window.GetSize()
+            width, height = [self._round_to_even(x) for x in original_size]
+            render_window.SetSize(width, height)
+            locked_by_recorder = False
+        else:
+            is_view_locked = self.view.minimumSize() == self.view.maximumSize()
+            width, height = self._lock_view_size()
+            locked_by_recorder = not is_view_locked
+
+        self.current_filename = filename
+        progress = None
+        frames_done = None
+        try:
+            self.writer = AsyncFrameWriter(self._create_writer(width, height), width, height, policy="block")
+            num_frames = len(
+                get_export_frame_values(
+                    self.value_slider.minValue if start is None else start,
+                    self.value_slider.maxValue if end is None else end,
+                    self.framerate,
+                    playback_rate,
+                )
+            )
+            progress = QtWidgets.QProgressDialog("Exporting playback...", "Cancel", 0, num_frames, self.main_window)
+            progress.setWindowModality(QtCore.Qt.WindowModal)
+            progress.setMinimumDuration(0)
+
+            def on_progress(frames_done, num_frames):
+                progress.setValue(frames_done)
+                return not progress.wasCanceled()
+
+            frames_done = export_slider_playback(
+                self.view,
+                self.value_slider,
+                self.writer,
+                start=start,
+                end=end,
+                framerate=self.framerate,
+                playback_rate=playback_rate,
+                offscreen=offscreen,
+                progress_callback=on_progress,
+            )
+            self.last_stats = self.writer.get_stats()
+            self.writer.close()
+        except Exception as e:
+            frames_done = None
+            if self.writer is not None:
+                try:
+                    self.writer.close()
+                except Exception:
+                    pass
+            error_dialog = QtWidgets.QMessageBox(self.main_window)
+            error_dialog.setIcon(QtWidgets.QMessageBox.Critical)
+            error_dialog.setWindowTitle("Export Error")
+            error_dialog.setText(f"Error exporting playback:\n{str(e)}")
+            error_dialog.exec()
+        finally:
+            if progress is not None:
+                progress.close()
+            self.writer = None
+            if offscreen:
+                render_window.SetSize(*original_size)
+            elif locked_by_recorder:
+                self._unlock_view_size()
+
+        if frames_done is not None:
+            if self.writer_mode == "spool":
+                self._start_encode_job(filename, self.last_stats)
+            else:
+                self._show_completion_dialog()
+        self.current_filename = None
+        self.last_stats = None
+        return frames_done
 
     def _on_capture_timer(self):
         if self.capture_mode == "timer":
@@ -500,10 +862,17 @@ class ScreenRecorder:
             return
 
         try:
-            # Capture screenshot
-            frame = capture_screenshot(self.view)
-            # Write frame
-            self.write_frame(frame)
+            # Capture straight into a buffer from the writer pool, the writer
+            # thread encodes it and returns it to the pool
+            buffer = self.writer.acquire_buffer()
+            if buffer is None:
+                return
+            try:
+                capture_screenshot(self.view, out=buffer)
+            except Exception:
+                self.writer.release_buffer(buffer)
+                raise
+            self.writer.submit(buffer)
         except Exception as e:
             # Stop recording on error
             self.record_button.setChecked(False)
@@ -7,6 +7,7 @@ from typing import Optional
 
 from qtpy import QtCore
 
+from director import objectmodel as om
 from director.frame_properties import FrameProperties
 from director.propertyset import PropertySet
 from director.visualization import FrameItem
@@ -73,7 +74,8 @@ def restore_object_properties(objs, settings_key, merge=True):
         return
     state_list = json.loads(serialized)
     path_to_obj = {obj.getObjectTree().getObjectPath(obj): obj for obj in objs}
-    for path, prop_state in state_list:
-        obj = path_to_obj.get(tuple(path))
-        if obj:
-            obj.properties.restore_from_state_dict(prop_state, merge=merge)
+    with om.batchUpdate(path_to_obj.values()):
+        for path, prop_state in state_list:
+            obj = path_to_obj.get(tuple(path))
+            if obj:
+                obj.properties.restore_from_state_dict(prop_state, merge=merge)
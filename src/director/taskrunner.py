@@ -1,49 +1,78 @@
-import sys
-import time
-from threading import Thread
+"""Run functions on a pool of worker threads and deliver results on the Qt main thread.
 
-from director import asynctaskqueue
-from director.timercallback import TimerCallback
+callOnThread submits a function to a bounded thread pool and returns a
+concurrent.futures.Future, which supports cancel(), result(timeout) and
+exception(timeout).  Callbacks added with addDoneCallback, and functions
+passed to callOnMain, are delivered on the main thread through a queued Qt
+signal, so no timer has to poll for finished work.
+"""
 
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from qtpy import QtCore
 
-class TaskRunner(object):
-    def __init__(self):
-        self.interval = 1 / 60.0
-        sys.setswitchinterval(self.interval)
 
-        self.taskQueue = asynctaskqueue.AsyncTaskQueue()
-        self.pendingTasks = []
-        self.threads = []
-        self.timer = TimerCallback(callback=self._onTimer, targetFps=1 / self.interval)
+class _MainThreadInvoker(QtCore.QObject):
+    """Calls functions emitted from any thread on the thread that owns this object."""
+
+    invoke = QtCore.Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.invoke.connect(self._onInvoke, QtCore.Qt.QueuedConnection)
 
-        # call timer.start here to initialize the QTimer now on the main thread
-        self.timer.start()
+    def _onInvoke(self, func):
+        try:
+            func()
+        except Exception:
+            traceback.print_exc()
 
-    def _onTimer(self):
-        # add all tasks in self.pendingTasks to the AsyncTaskQueue
-        if self.pendingTasks:
-            while True:
-                try:
-                    self.taskQueue.addTask(self.pendingTasks.pop(0))
-                except IndexError:
-                    break
 
-            # start the AsyncTaskQueue if it's not already running
-            if self.taskQueue.tasks and not self.taskQueue.isRunning:
-                self.taskQueue.start()
+class TaskRunner(object):
+    DEFAULT_MAX_WORKERS = 4
 
-        # only retain the live threads
-        self.threads = [t for t in self.threads if t.is_alive()]
+    def __init__(self, maxWorkers=None):
+        """
+        Args:
+            maxWorkers: Number of worker threads, jobs submitted while all of
+                them are busy wait in the queue (default: DEFAULT_MAX_WORKERS)
 
-        if self.threads:
-            # Give up control to other python threads that are running
-            time.sleep(self.interval)
+        The TaskRunner must be constructed on the main thread.
+        """
+        self.maxWorkers = maxWorkers or self.DEFAULT_MAX_WORKERS
+        self.executor = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix="TaskRunner")
+        self.invoker = _MainThreadInvoker()
 
     def callOnMain(self, func, *args, **kwargs):
-        self.pendingTasks.append(lambda: func(*args, **kwargs))
+        """Call func(*args, **kwargs) on the main thread, may be called from any thread."""
+        self.invoker.invoke.emit(lambda: func(*args, **kwargs))
 
     def callOnThread(self, func, *args, **kwargs):
-        t = Thread(target=lambda: func(*args, **kwargs))
-        self.threads.append(t)
-        t.start()
-        return t
+        """
+        Call func(*args, **kwargs) on a worker thread.
+
+        Returns a Future.  Exceptions raised by func are printed and stored in
+        the future.  future.cancel() only succeeds while the job is waiting
+        for a free worker.
+        """
+
+        def run():
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                traceback.print_exc()
+                raise
+
+        return self.executor.submit(run)
+
+    def addDoneCallback(self, future, callback):
+        """
+        Call callback(future) on the main thread when future finishes or is
+        cancelled.  The callback is queued even if the future is already done.
+        """
+        future.add_done_callback(lambda f: self.callOnMain(callback, f))
+
+    def shutdown(self, wait=True, cancelPending=True):
+        """Stop the worker threads, optionally cancelling jobs that have not started."""
+        self.executor.shutdown(wait=wait, cancel_futures=cancelPending)
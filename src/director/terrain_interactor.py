@@ -114,11 +114,25 @@ class TerrainInteractorStyle(vtk.vtkInteractorStyle):
         self._pan_start_focal_point = None
         self._pan_start_3d_point = None
 
+    def _any_button_pressed(self):
+        return self._left_button_pressed or self._right_button_pressed or self._middle_button_pressed
+
+    def _start_interaction(self):
+        """Invoke StartInteractionEvent when the first mouse button is pressed, like vtkInteractorStyle.StartState."""
+        if not self._any_button_pressed():
+            self.InvokeEvent(vtk.vtkCommand.StartInteractionEvent)
+
+    def _end_interaction(self):
+        """Invoke EndInteractionEvent once no mouse button is pressed."""
+        if not self._any_button_pressed():
+            self.InvokeEvent(vtk.vtkCommand.EndInteractionEvent)
+
     def _on_left_press(self, obj, event):
         """Handle left mouse button press."""
         interactor, x, y, renderer = self._get_interactor_state()
         if not interactor:
             return
+        self._start_interaction()
 
         # Initialize pan state if shift is pressed, otherwise clear it
         if interactor.GetShiftKey():
@@ -131,29 +145,37 @@ class TerrainInteractorStyle(vtk.vtkInteractorStyle):
 
     def _on_left_release(self, obj, event):
         """Handle left mouse button release."""
+        if not self._left_button_pressed:
+            return
         self._left_button_pressed = False
         self._last_pos = None
         self._clear_pan_state()
+        self._end_interaction()
 
     def _on_right_press(self, obj, event):
         """Handle right mouse button press."""
         interactor, x, y, renderer = self._get_interactor_state()
         if not interactor:
             return
+        self._start_interaction()
 
         self._right_button_pressed = True
         self._last_pos = (x, y)
 
     def _on_right_release(self, obj, event):
         """Handle right mouse button release."""
+        if not self._right_button_pressed:
+            return
         self._right_button_pressed = False
         self._last_pos = None
+        self._end_interaction()
 
     def _on_middle_press(self, obj, event):
         """Handle middle mouse button press."""
         interactor, x, y, renderer = self._get_interactor_state()
         if not interactor:
             return
+        self._start_interaction()
 
         # Initialize pan state for middle button
         self._init_pan_state(renderer, x, y)
@@ -163,9 +185,12 @@ class TerrainInteractorStyle(vtk.vtkInteractorStyle):
 
     def _on_middle_release(self, obj, event):
         """Handle middle mouse button release."""
+        if not self._middle_button_pressed:
+            return
         self._middle_button_pressed = False
         self._last_pos = None
         self._clear_pan_state()
+        self._end_interaction()
 
     def _on_mouse_move(self, obj, event):
         """Handle mouse movement."""
@@ -0,0 +1,400 @@
+"""Spool captured video frames to disk and encode them with ffmpeg as a separate job.
+
+SpoolWriter has the same write_frame/close interface as FFMpegWriter, but
+instead of piping frames to a live ffmpeg process it copies them into a
+memory-mapped raw frame file, or appends zlib compressed frames when a
+compression level is given.  Capture therefore never waits on the encoder.
+The spool metadata is written when the writer opens and again after every
+chunk of frames, so if capture is killed the spool can still be read and
+encoded up to the last finished chunk.  The metadata only holds counts, the
+sizes of compressed frames are appended to a separate file, so the cost of
+each update does not grow with the length of the recording.
+
+encode_spool later converts the spool to a video file, one segment of frames
+at a time.  Finished segments are recorded in the spool directory, so an
+encode that fails part way can be resumed without redoing them.  SpoolEncodeJob
+runs encode_spool on a background thread and reports progress.
+
+A spool is a directory with the following files:
+
+    spool.json      frame size, framerate, frame count and compression,
+                    updated every chunk_frames frames while capturing
+    frames.raw      the frames, raw rgb24 or a sequence of zlib blocks
+    blocks.bin      int64 size of each zlib block, for compressed spools
+    encode.json     encode state, written by encode_spool
+    segment_*.ext   encoded segments, removed after a successful encode
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+import zlib
+
+import numpy as np
+
+from director.ffmpeg_writer import FFMpegWriter
+
+SPOOL_VERSION = 2
+
+
+def _write_json(path, data):
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+class SpoolWriter:
+    """Writer that spools RGB frames to a directory on disk."""
+
+    def __init__(
+        self,
+        spool_dir: str,
+        width: int,
+        height: int,
+        framerate: float = 30.0,
+        compression_level: int = 0,
+        chunk_frames: int = 64,
+    ):
+        """
+        Initialize SpoolWriter.
+
+        Args:
+            spool_dir: Directory to create the spool in
+            width: Video width in pixels
+            height: Video height in pixels
+            framerate: Frame rate in fps (default: 30.0)
+            compression_level: zlib level 1-9, or 0 to store raw frames in a
+                memory-mapped file (default: 0)
+            chunk_frames: Number of frames the raw frame file grows by, and
+                the number of frames between updates of the spool metadata
+        """
+        self.spool_dir = spool_dir
+        self.width = width
+        self.height = height
+        self.framerate = framerate
+        self.compression_level = compression_level
+        self.chunk_frames = chunk_frames
+        self.frame_count = 0
+        self._closed = False
+        self._frames = None
+        self._capacity = 0
+        self._block_sizes = []
+
+        os.makedirs(spool_dir, exist_ok=True)
+        self._file = open(os.path.join(spool_dir, "frames.raw"), "w+b")
+        self._blocks_file = open(os.path.join(spool_dir, "blocks.bin"), "wb") if compression_level else None
+        self._write_metadata(complete=False)
+
+    @property
+    def frame_size(self):
+        return self.width * self.height * 3
+
+    def _get_frame_slot(self, index):
+        if index >= self._capacity:
+            # Grow the file and map it again, the new pages are sparse until written
+            self._capacity += self.chunk_frames
+            self._file.truncate(self._capacity * self.frame_size)
+            self._frames = np.memmap(
+                self._file, dtype=np.uint8, mode="r+", shape=(self._capacity, self.height, self.width, 3)
+            )
+        return self._frames[index]
+
+    def write_frame(self, frame: np.ndarray):
+        """
+        Write a single RGB frame to the spool.
+
+        Args:
+            frame: numpy array of shape (height, width, 3) with uint8 RGB data
+
+        Raises:
+            RuntimeError: If writer is closed
+            ValueError: If frame dimensions don't match
+        """
+        if self._closed:
+            raise RuntimeError("SpoolWriter is closed. Cannot write more frames.")
+
+        if frame.shape != (self.height, self.width, 3):
+            raise ValueError(f"Frame shape {frame.shape} does not match expected ({self.height}, {self.width}, 3)")
+
+        if self.compression_level:
+            frame = np.ascontiguousarray(frame, dtype=np.uint8)
+            block = zlib.compress(memoryview(frame).cast("B"), self.compression_level)
+            self._file.write(block)
+            self._block_sizes.append(len(block))
+        else:
+            np.copyto(self._get_frame_slot(self.frame_count), frame, casting="unsafe")
+        self.frame_count += 1
+        if self.frame_count % self.chunk_frames == 0:
+            self._finish_chunk()
+
+    def _finish_chunk(self):
+        # Flush the frames and block sizes before the metadata that counts them
+        if self._frames is not None:
+            self._frames.flush()
+        self._file.flush()
+        self._flush_block_sizes()
+        self._write_metadata(complete=False)
+
+    def _flush_block_sizes(self):
+        # Append the sizes of the blocks written since the last flush
+        if self._blocks_file is None:
+            return
+        self._blocks_file.write(np.array(self._block_sizes, dtype=np.int64).tobytes())
+        self._blocks_file.flush()
+        self._block_sizes = []
+
+    def _write_metadata(self, complete):
+        _write_json(
+            os.path.join(self.spool_dir, "spool.json"),
+            dict(
+                version=SPOOL_VERSION,
+                width=self.width,
+                height=self.height,
+                framerate=self.framerate,
+                frame_count=self.frame_count,
+                compression_level=self.compression_level,
+                complete=complete,
+            ),
+        )
+
+    def close(self):
+        """Flush the frames and write the spool metadata."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._frames is not None:
+            self._frames.flush()
+            self._frames = None
+        if not self.compression_level:
+            self._file.truncate(self.frame_count * self.frame_size)
+        self._file.close()
+        if self._blocks_file is not None:
+            self._flush_block_sizes()
+            self._blocks_file.close()
+        self._write_metadata(complete=True)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - ensures close is called."""
+        self.close()
+        return False
+
+
+class SpoolReader:
+    """Read frames from a spool written by SpoolWriter."""
+
+    def __init__(self, spool_dir: str):
+        self.spool_dir = spool_dir
+        with open(os.path.join(spool_dir, "spool.json")) as f:
+            self.info = json.load(f)
+        if self.info["version"] != SPOOL_VERSION:
+            raise ValueError(f"Unsupported spool version {self.info['version']} in {spool_dir}")
+        self.width = self.info["width"]
+        self.height = self.info["height"]
+        self.framerate = self.info["framerate"]
+        self.compression_level = self.info["compression_level"]
+        # False if the writer was not closed, the frames up to the last finished chunk are readable
+        self.complete = self.info.get("complete", True)
+        frames_file = os.path.join(spool_dir, "frames.raw")
+        self._frames = None
+
+        if self.compression_level:
+            # blocks.bin may list blocks written after the metadata was last updated
+            block_sizes = np.fromfile(os.path.join(spool_dir, "blocks.bin"), dtype=np.int64)[: len(self)]
+            self._offsets = np.concatenate([[0], np.cumsum(block_sizes)])
+            self._file = open(frames_file, "rb")
+        elif len(self):
+            self._frames = np.memmap(
+                frames_file, dtype=np.uint8, mode="r", shape=(len(self), self.height, self.width, 3)
+            )
+
+    def __len__(self):
+        return self.info["frame_count"]
+
+    def get_frame(self, index):
+        """Return frame index as a (height, width, 3) uint8 array, a view into the memory map for raw spools."""
+        if self._frames is not None:
+            return self._frames[index]
+        self._file.seek(self._offsets[index])
+        block = self._file.read(self._offsets[index + 1] - self._offsets[index])
+        return np.frombuffer(zlib.decompress(block), dtype=np.uint8).reshape(self.height, self.width, 3)
+
+    def close(self):
+        self._frames = None
+        if self.compression_level:
+            self._file.close()
+
+
+def _concat_segments(segment_files, filename, list_file):
+    with open(list_file, "w") as f:
+        for segment_file in segment_files:
+            f.write(f"file '{os.path.abspath(segment_file)}'\n")
+    cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", filename]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not found. Please install ffmpeg to encode spooled video.")
+    if result.returncode != 0:
+        stderr_output = result.stderr.decode("utf-8", errors="ignore")
+        raise RuntimeError(f"FFMpeg concat exited with code {result.returncode}. Error output: {stderr_output}")
+
+
+def encode_spool(
+    spool_dir: str,
+    filename: str,
+    segment_frames: int = 900,
+    progress_callback=None,
+    resume: bool = True,
+    remove_spool: bool = False,
+    cancel_event=None,
+    **ffmpeg_options,
+):
+    """
+    Encode a spool to a video file with ffmpeg.
+
+    Frames are piped to ffmpeg straight from the spool memory map, one
+    segment of segment_frames frames per ffmpeg process, and the segments
+    are joined at the end without re-encoding.
+
+    Args:
+        spool_dir: Spool directory written by SpoolWriter
+        filename: Output video filename (e.g., 'output.mp4')
+        segment_frames: Number of frames per encoded segment
+        progress_callback: Called as progress_callback(frames_done, frame_count)
+        resume: Keep the segments finished by an earlier encode of the same
+            spool to filename with the same options
+        remove_spool: Remove the spool directory after a successful encode
+        cancel_event: Optional threading.Event, the encode stops with a
+            RuntimeError after the current frame when it is set
+        **ffmpeg_options: Passed to FFMpegWriter, e.g. vcodec, preset, crf
+
+    Returns:
+        str: filename
+    """
+    reader = SpoolReader(spool_dir)
+    frame_count = len(reader)
+    if not frame_count:
+        reader.close()
+        raise RuntimeError(f"Spool {spool_dir} has no frames to encode.")
+
+    extension = os.path.splitext(filename)[1] or ".mp4"
+    state_file = os.path.join(spool_dir, "encode.json")
+    settings = dict(filename=os.path.abspath(filename), segment_frames=segment_frames, options=ffmpeg_options)
+    state = dict(settings, finished_segments=[])
+    if resume and os.path.exists(state_file):
+        with open(state_file) as f:
+            previous_state = json.load(f)
+        if all(previous_state.get(key) == value for key, value in settings.items()):
+            state = previous_state
+
+    num_segments = (frame_count + segment_frames - 1) // segment_frames
+    segment_files = [os.path.join(spool_dir, f"segment_{k:05d}{extension}") for k in range(num_segments)]
+    finished = {k for k in state["finished_segments"] if os.path.exists(segment_files[k])}
+    frames_done = sum(min(segment_frames, frame_count - k * segment_frames) for k in finished)
+    if progress_callback:
+        progress_callback(frames_done, frame_count)
+
+    try:
+        for k, segment_file in enumerate(segment_files):
+            if k in finished:
+                continue
+            partial_file = os.path.join(spool_dir, f"segment_{k:05d}.partial{extension}")
+            with FFMpegWriter(partial_file, reader.width, reader.height, reader.framerate, **ffmpeg_options) as writer:
+                for index in range(k * segment_frames, min((k + 1) * segment_frames, frame_count)):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise RuntimeError("Encode cancelled.")
+                    writer.write_frame(reader.get_frame(index))
+                    frames_done += 1
+                    if progress_callback:
+                        progress_callback(frames_done, frame_count)
+            os.replace(partial_file, segment_file)
+            finished.add(k)
+            state["finished_segments"] = sorted(finished)
+            _write_json(state_file, state)
+    finally:
+        reader.close()
+
+    list_file = os.path.join(spool_dir, "segments.txt")
+    if num_segments == 1:
+        shutil.copyfile(segment_files[0], filename)
+    else:
+        _concat_segments(segment_files, filename, list_file)
+
+    if remove_spool:
+        shutil.rmtree(spool_dir)
+    else:
+        for path in segment_files + [state_file, list_file]:
+            if os.path.exists(path):
+                os.remove(path)
+    return filename
+
+
+class SpoolEncodeJob:
+    """
+    Run encode_spool on a background thread.
+
+    progress holds (frames_done, frame_count), and error holds the exception
+    if the encode failed.  A failed job can be started again, and it resumes
+    from the last finished segment.
+    """
+
+    def __init__(self, spool_dir: str, filename: str, **encode_options):
+        self.spool_dir = spool_dir
+        self.filename = filename
+        self.encode_options = encode_options
+        self.progress = (0, 0)
+        self.error = None
+        self._thread = None
+        self._cancel_event = threading.Event()
+
+    def start(self):
+        """Start encoding on the background thread."""
+        if self.is_running():
+            return
+        self.error = None
+        self._cancel_event.clear()
+        self._thread = threading.Thread(target=self._run, name="SpoolEncodeJob", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Stop the encode after the current frame, the finished segments are kept."""
+        self._cancel_event.set()
+
+    def wait(self, timeout=None):
+        """Wait for the job to finish, returns True if it is no longer running."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_done(self):
+        """Return True if the encode finished successfully."""
+        return self._thread is not None and not self.is_running() and self.error is None
+
+    def get_fraction_done(self):
+        frames_done, frame_count = self.progress
+        return frames_done / frame_count if frame_count else 0.0
+
+    def _on_progress(self, frames_done, frame_count):
+        self.progress = (frames_done, frame_count)
+
+    def _run(self):
+        try:
+            encode_spool(
+                self.spool_dir,
+                self.filename,
+                progress_callback=self._on_progress,
+                cancel_event=self._cancel_event,
+                **self.encode_options,
+            )
+        except Exception as e:
+            self.error = e
+            print(f"Error: Encoding {self.spool_dir} failed: {e}")
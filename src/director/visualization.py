@@ -2,11 +2,14 @@
 Visualization classes and utilities for displaying VTK objects in Director.
 """
 
+import functools
+
 import numpy as np
 
 import director.applogic as app
 import director.objectmodel as om
 import director.vtkAll as vtk
+import director.vtkNumpy as vnp
 from director import callbacks, filterUtils
 from director.debugVis import DebugData
 from director.fieldcontainer import FieldContainer
@@ -29,17 +32,27 @@ assert MATPLOTLIB_AVAILABLE, "matplotlib is not available"
 
 
 class MatplotlibColormaps:
-    """Utility class for working with matplotlib colormaps in VTK."""
+    """Utility class for working with matplotlib colormaps in VTK.
+
+    Colormap names and lookup tables are cached for the life of the process.
+    """
 
     @staticmethod
     def getColormapNames():
         """Get list of all available matplotlib colormap names.
 
+        The registry is only walked on the first call.
+
         Returns:
             List of colormap name strings
         """
+        return list(MatplotlibColormaps._getColormapNames())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _getColormapNames():
         if not MATPLOTLIB_AVAILABLE:
-            return []
+            return ()
         # Get all registered colormaps
         colormaps = []
         # Built-in colormaps - try different methods for different matplotlib versions
@@ -73,7 +86,7 @@ class MatplotlibColormaps:
                 "winter",
             ]
         # Remove duplicates and sort
-        return sorted(set(colormaps))
+        return tuple(sorted(set(colormaps)))
 
     @staticmethod
     def getColormapArray(name, numColors=256):
@@ -113,6 +126,9 @@ class MatplotlibColormaps:
     def getColormapAsVTK(name, scalarRange=None, numColors=256, reverse=False):
         """Get colormap as a VTK lookup table.
 
+        Lookup tables are memoized by their arguments, so the returned table
+        may be shared with other callers and should not be modified.
+
         Args:
             name: Name of the matplotlib colormap
             scalarRange: Optional tuple (min, max) for scalar range. If None, uses (0, 1)
@@ -122,12 +138,18 @@ class MatplotlibColormaps:
         Returns:
             vtkLookupTable instance
         """
+        scalarRange = (float(scalarRange[0]), float(scalarRange[1])) if scalarRange else (0.0, 1.0)
+        return MatplotlibColormaps._buildColormapLUT(name, scalarRange, int(numColors), bool(reverse))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _buildColormapLUT(name, scalarRange, numColors, reverse):
+        lut = vtk.vtkLookupTable()
+        lut.SetNumberOfColors(numColors)
+        lut.SetRange(scalarRange)
+
         if not MATPLOTLIB_AVAILABLE:
             # Fallback to default VTK lookup table
-            lut = vtk.vtkLookupTable()
-            lut.SetNumberOfColors(numColors)
-            if scalarRange:
-                lut.SetRange(scalarRange)
             lut.Build()
             return lut
 
@@ -138,23 +160,21 @@ class MatplotlibColormaps:
         if reverse:
             colors = colors[::-1]
 
-        # Create VTK lookup table
-        lut = vtk.vtkLookupTable()
-        lut.SetNumberOfColors(numColors)
-
-        # Set scalar range
-        if scalarRange:
-            lut.SetRange(scalarRange)
-        else:
-            lut.SetRange(0.0, 1.0)
-
-        # Set colors
-        for i in range(numColors):
-            lut.SetTableValue(i, colors[i][0], colors[i][1], colors[i][2], 1.0)
+        # Set all colors in one call, rounding the same way SetTableValue does
+        table = np.empty((numColors, 4), dtype=np.uint8)
+        table[:, :3] = np.floor(colors * 255.0 + 0.5)
+        table[:, 3] = 255
+        lut.SetTable(vnp.getVtkFromNumpy(table))
 
         lut.Build()
         return lut
 
+    @staticmethod
+    def clearCache():
+        """Forget cached colormap names and lookup tables."""
+        MatplotlibColormaps._getColormapNames.cache_clear()
+        MatplotlibColormaps._buildColormapLUT.cache_clear()
+
 
 class PolyDataItem(om.ObjectModelItem):
     defaultScalarRangeMap = {
@@ -227,6 +247,8 @@ class PolyDataItem(om.ObjectModelItem):
             self.addToView(view)
 
     def _renderAllViews(self):
+        if self._deferRender():
+            return
         for view in self.views:
             if hasattr(view, "render"):
                 view.render()
@@ -239,9 +261,16 @@ class PolyDataItem(om.ObjectModelItem):
     def hasActor(self, actor):
         return actor == self.actor
 
+    def getDataSets(self):
+        return [self.polyData]
+
+    def getActors(self):
+        return [self.actor]
+
     def setPolyData(self, polyData):
         self.polyData = polyData
         self.mapper.SetInputData(polyData)
+        self._updateObjectIndex()
 
         self._updateSurfaceProperty()
         self._updateColorByProperty()
@@ -443,7 +472,7 @@ class PolyDataItem(om.ObjectModelItem):
             array = self.polyData.GetPointData().GetArray(arrayName)
             if array:
                 name = array.GetName() if array.GetName() else ""
-                scalarRange = self.rangeMap.get(name, array.GetRange())
+                scalarRange = self.rangeMap.get(name, self._getArrayRange(array))
                 rangeMin, rangeMax = scalarRange
 
                 # Add or update properties
@@ -520,6 +549,10 @@ class PolyDataItem(om.ObjectModelItem):
         f.Build()
         return f
 
+    def _getArrayRange(self, array):
+        """Return the default scalar range for coloring by array."""
+        return array.GetRange()
+
     def _getDefaultColorMap(self, array, scalarRange=None, hueRange=None):
         name = array.GetName() if array.GetName() else ""
 
@@ -529,7 +562,7 @@ class PolyDataItem(om.ObjectModelItem):
             colormapNames = MatplotlibColormaps.getColormapNames()
             if colormapNames and colormapName != "Default" and colormapName in colormapNames:
                 # Use matplotlib colormap
-                scalarRange = scalarRange or self.rangeMap.get(name, array.GetRange())
+                scalarRange = scalarRange or self.rangeMap.get(name, self._getArrayRange(array))
                 reverse = self.getProperty("Color Map Reverse") if self.hasProperty("Color Map Reverse") else False
                 return MatplotlibColormaps.getColormapAsVTK(colormapName, scalarRange, numColors=256, reverse=reverse)
 
@@ -539,7 +572,7 @@ class PolyDataItem(om.ObjectModelItem):
 
         hueMap = {"Axes": redtoBlue}
 
-        scalarRange = scalarRange or self.rangeMap.get(name, array.GetRange())
+        scalarRange = scalarRange or self.rangeMap.get(name, self._getArrayRange(array))
         hueRange = hueRange or hueMap.get(name, blueToRed)
 
         lut = vtk.vtkLookupTable()
@@ -582,6 +615,169 @@ class PolyDataItem(om.ObjectModelItem):
             view.vtk_widget.render()
 
 
+class StreamingPolyDataItem(PolyDataItem):
+    """Point cloud item backed by fixed-capacity, preallocated buffers.
+
+    Points and point data arrays are allocated once and wrapped by VTK
+    without copying.  Each push() writes new values into those buffers in
+    place and marks the arrays Modified, so the mapper input, the Color By
+    options and the lookup table range are left untouched between updates.
+
+    In "overwrite" mode each push replaces the displayed points.  In "append"
+    mode points accumulate in a ring buffer, and once the capacity is reached
+    the oldest points are overwritten.
+    """
+
+    MODES = ("overwrite", "append")
+
+    def __init__(self, name, capacity, view, arrays=None, mode="overwrite"):
+        """
+        Args:
+            name: Name for the object model item
+            capacity: Maximum number of points held by the item
+            view: VTKWidget view instance
+            arrays: Optional dict mapping point data array names to a numpy
+                dtype, or to a (dtype, numberOfComponents) tuple
+            mode: "overwrite" or "append"
+        """
+        if mode not in self.MODES:
+            raise ValueError("Unknown mode: %s" % mode)
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = int(capacity)
+        self.mode = mode
+        self._head = 0
+        self._count = 0
+
+        self._points = np.zeros((self.capacity, 3), dtype=np.float32)
+        self._arrays = {}
+        for arrayName, arraySpec in (arrays or {}).items():
+            dtype, numberOfComponents = arraySpec if isinstance(arraySpec, tuple) else (arraySpec, 1)
+            shape = (self.capacity,) if numberOfComponents == 1 else (self.capacity, numberOfComponents)
+            self._arrays[arrayName] = np.zeros(shape, dtype=dtype)
+
+        ids = np.arange(self.capacity + 1)
+        self._cellOffsets = ids
+        self._cellConnectivity = ids[:-1]
+
+        polyData = vnp.numpyToPolyData(self._points, pointData=self._arrays, createVertexCells=False)
+        PolyDataItem.__init__(self, name, polyData, view)
+        self._updateVertexCells()
+
+    def getNumberOfPoints(self):
+        """Return the number of valid points currently held."""
+        return self._count
+
+    def getPoints(self):
+        """Return a copy of the valid points, oldest first."""
+        return self._ordered(self._points)
+
+    def getArray(self, arrayName):
+        """Return a copy of the valid values of a point data array, oldest first."""
+        return self._ordered(self._arrays[arrayName])
+
+    def clear(self):
+        """Remove all points without releasing the buffers."""
+        self._head = 0
+        self._count = 0
+        self._updateVertexCells()
+        self._markModified()
+
+    def push(self, points, **arrays):
+        """Write points and matching point data arrays into the buffers.
+
+        Args:
+            points: (N, 3) array of points.  If N exceeds the capacity only
+                the last capacity points are kept.
+            **arrays: Values for the point data arrays declared at
+                construction, each with N rows.  Declared arrays that are
+                omitted are filled with zeros for the pushed points.
+        """
+        points = np.asarray(points).reshape(-1, 3)
+        numberOfPoints = len(points)
+        for arrayName, values in arrays.items():
+            if arrayName not in self._arrays:
+                raise KeyError("Unknown array: %s" % arrayName)
+            if len(values) != numberOfPoints:
+                raise ValueError("Array %s has %d values for %d points" % (arrayName, len(values), numberOfPoints))
+
+        start = 0 if self.mode == "overwrite" else self._head
+        self._writeRing(self._points, start, points)
+        for arrayName, buffer in self._arrays.items():
+            if arrayName in arrays:
+                self._writeRing(buffer, start, np.asarray(arrays[arrayName]))
+            else:
+                self._zeroRing(buffer, start, min(numberOfPoints, self.capacity))
+
+        previousCount = self._count
+        numberWritten = min(numberOfPoints, self.capacity)
+        if self.mode == "overwrite":
+            self._head = numberWritten % self.capacity
+            self._count = numberWritten
+        else:
+            self._head = (self._head + numberWritten) % self.capacity
+            self._count = min(self._count + numberWritten, self.capacity)
+
+        if self._count != previousCount:
+            self._updateVertexCells()
+        self._markModified()
+
+        if self.getProperty("Visible"):
+            self._renderAllViews()
+
+    def _writeRing(self, buffer, start, values):
+        values = values[-self.capacity :]
+        end = start + len(values)
+        if end <= self.capacity:
+            buffer[start:end] = values
+        else:
+            split = self.capacity - start
+            buffer[start:] = values[:split]
+            buffer[: end - self.capacity] = values[split:]
+
+    def _zeroRing(self, buffer, start, count):
+        end = start + count
+        if end <= self.capacity:
+            buffer[start:end] = 0
+        else:
+            buffer[start:] = 0
+            buffer[: end - self.capacity] = 0
+
+    def _getArrayRange(self, array):
+        # The buffers hold capacity points, only the first _count are valid
+        buffer = self._arrays.get(array.GetName())
+        if buffer is None:
+            return array.GetRange()
+        if not self._count:
+            return (0.0, 0.0)
+        values = buffer[: self._count]
+        if values.ndim == 2:
+            values = values[:, 0]
+        return (float(values.min()), float(values.max()))
+
+    def _ordered(self, buffer):
+        if self._count < self.capacity:
+            return buffer[: self._count].copy()
+        return np.concatenate([buffer[self._head :], buffer[: self._head]])
+
+    def _updateVertexCells(self):
+        # The valid points always occupy the first _count slots of the ring
+        vnp.setPolyDataCells(
+            self.polyData,
+            "verts",
+            offsets=self._cellOffsets[: self._count + 1],
+            connectivity=self._cellConnectivity[: self._count],
+        )
+
+    def _markModified(self):
+        self.polyData.GetPoints().GetData().Modified()
+        self.polyData.GetPoints().Modified()
+        pointData = self.polyData.GetPointData()
+        for arrayName in self._arrays:
+            pointData.GetArray(arrayName).Modified()
+
+
 class Image2DItem(om.ObjectModelItem):
     """2D image overlay item for displaying images in the viewport."""
 
@@ -636,6 +832,8 @@ class Image2DItem(om.ObjectModelItem):
 
     def _renderAllViews(self):
         """Render all views containing this item."""
+        if self._deferRender():
+            return
         for view in self.views:
             view.render()
 
@@ -647,6 +845,12 @@ class Image2DItem(om.ObjectModelItem):
         """Check if this item uses the given actor."""
         return actor == self.actor
 
+    def getDataSets(self):
+        return [self.image]
+
+    def getActors(self):
+        return [self.actor]
+
     def setImage(self, image):
         """Update the image displayed by this item.
 
@@ -655,6 +859,7 @@ class Image2DItem(om.ObjectModelItem):
         """
         self.image = image
         self.actor.SetImage(image)
+        self._updateObjectIndex()
 
         # Also set the image on the texture, otherwise
         # the texture input won't update until the next
@@ -939,6 +1144,8 @@ def createAxesPolyData(scale, useTube, tubeWidth=0.002):
 class FrameItem(PolyDataItem):
     """FrameItem with interactive frame widget support."""
 
+    _traceProperties = ("Trace Max Points", "Trace Min Distance", "Trace Min Angle", "Trace Fade Time")
+
     def __init__(self, name, transform, view):
         PolyDataItem.__init__(self, name, vtk.vtkPolyData(), view)
 
@@ -958,6 +1165,26 @@ class FrameItem(PolyDataItem):
         )
         self.addProperty("Edit", False)
         self.addProperty("Trace", False)
+        self.addProperty(
+            "Trace Max Points",
+            10000,
+            attributes=om.PropertyAttributes(minimum=2, maximum=1000000, singleStep=1000, hidden=True),
+        )
+        self.addProperty(
+            "Trace Min Distance",
+            0.0,
+            attributes=om.PropertyAttributes(decimals=3, minimum=0.0, maximum=1.0, singleStep=0.005, hidden=True),
+        )
+        self.addProperty(
+            "Trace Min Angle",
+            0.0,
+            attributes=om.PropertyAttributes(decimals=1, minimum=0.0, maximum=90.0, singleStep=1.0, hidden=True),
+        )
+        self.addProperty(
+            "Trace Fade Time",
+            0.0,
+            attributes=om.PropertyAttributes(decimals=1, minimum=0.0, maximum=600.0, singleStep=1.0, hidden=True),
+        )
         self.addProperty("Tube", False)
         self.addProperty(
             "Tube Width",
@@ -987,15 +1214,24 @@ class FrameItem(PolyDataItem):
         if not self._blockSignals:
             self.callbacks.process("FrameModified", self)
 
-    def copyFrame(self, transform):
+    def copyFrame(self, transform, render=True):
+        """Copy the matrix of transform into this frame.
+
+        Pass render=False to skip the render request, for callers that update
+        many frames and render the views once themselves.
+        """
         self._blockSignals = True
         self.transform.SetMatrix(transform.GetMatrix())
         self._blockSignals = False
         self.transform.Modified()
-        parent = self.parent()
-        if (parent and parent.getProperty("Visible")) or self.getProperty("Visible"):
+        if render and self.isShown():
             self._renderAllViews()
 
+    def isShown(self):
+        """Return True if this frame or its parent is visible."""
+        parent = self.parent()
+        return bool((parent and parent.getProperty("Visible")) or self.getProperty("Visible"))
+
     def _updateAxesGeometry(self):
         scale = self.getProperty("Scale")
         self.setPolyData(createAxesPolyData(scale, self.getProperty("Tube"), self.getProperty("Tube Width")))
@@ -1021,11 +1257,25 @@ class FrameItem(PolyDataItem):
             self._updateAxesGeometry()
         elif propertyName == "Trace":
             trace = self.getProperty(propertyName)
+            for traceProperty in self._traceProperties:
+                self.properties.setPropertyAttribute(traceProperty, "hidden", not trace)
             if trace and not self._frameTrace:
-                self._frameTrace = FrameTraceVisualizer(self)
+                self._frameTrace = FrameTraceVisualizer(
+                    self,
+                    max_points=self.getProperty("Trace Max Points"),
+                    min_distance=self.getProperty("Trace Min Distance"),
+                    min_angle=self.getProperty("Trace Min Angle"),
+                    fade_time=self.getProperty("Trace Fade Time"),
+                )
             elif not trace and self._frameTrace:
                 self._frameTrace.remove()
                 self._frameTrace = None
+        elif self._frameTrace and propertyName == "Trace Max Points":
+            self._frameTrace.set_max_points(self.getProperty(propertyName))
+        elif self._frameTrace and propertyName in ("Trace Min Distance", "Trace Min Angle"):
+            self._frameTrace.set_decimation(self.getProperty("Trace Min Distance"), self.getProperty("Trace Min Angle"))
+        elif self._frameTrace and propertyName == "Trace Fade Time":
+            self._frameTrace.set_fade_time(self.getProperty(propertyName))
 
     def _updateFrameWidget(self):
         """Create or destroy frame widget based on Edit property."""
@@ -1047,6 +1297,7 @@ class FrameItem(PolyDataItem):
                 scale = self.getProperty("Scale")
                 # Set callback to trigger FrameModified signal when transform changes
                 self.frameWidget = FrameWidget(view, self.transform, scale=scale)
+                self._updateObjectIndex()
             # Ensure widget is enabled and visible (regardless of whether it was just created)
             self.frameWidget.setEnabled(True)
             self.frameWidget.view.render()
@@ -1076,6 +1327,15 @@ class FrameItem(PolyDataItem):
             has_actor = actor in self.frameWidget.getActors()
         return has_actor or PolyDataItem.hasActor(self, actor)
 
+    def getDataSets(self):
+        return [self.transform]
+
+    def getActors(self):
+        actors = PolyDataItem.getActors(self)
+        if self.frameWidget:
+            actors += self.frameWidget.getActors()
+        return actors
+
     def addToView(self, view):
         """Add frame item to a view."""
         PolyDataItem.addToView(self, view)
@@ -1087,6 +1347,7 @@ class FrameItem(PolyDataItem):
         if self.frameWidget:
             self.frameWidget.cleanup()
             self.frameWidget = None
+            self._updateObjectIndex()
         PolyDataItem.removeFromView(self, view)
 
     def onRemoveFromObjectModel(self):
@@ -1094,6 +1355,130 @@ class FrameItem(PolyDataItem):
         self.transform.RemoveObserver(self.observerTag)
 
 
+class FrameSetItem(PolyDataItem):
+    """Draw many coordinate frames with a single actor.
+
+    The axes geometry is tiled once per frame into one polydata, and
+    setPoses() rewrites all of its points in place from an (N, 4, 4) pose
+    array.  Point i of the polydata belongs to frame getFrameIndex(i).
+    """
+
+    _cellTypes = (("verts", "GetVerts"), ("lines", "GetLines"), ("polys", "GetPolys"), ("strips", "GetStrips"))
+
+    def __init__(self, name, poses, view):
+        PolyDataItem.__init__(self, name, vtk.vtkPolyData(), view)
+
+        self._poses = np.zeros((0, 4, 4))
+        self._points = np.zeros((0, 3))
+        self._normals = None
+
+        self.addProperty(
+            "Scale",
+            1.0,
+            attributes=om.PropertyAttributes(decimals=2, minimum=0.01, maximum=3.0, singleStep=0.05, hidden=False),
+        )
+        self.addProperty("Tube", False)
+        self.addProperty(
+            "Tube Width",
+            0.002,
+            attributes=om.PropertyAttributes(decimals=3, minimum=0.001, maximum=0.3, singleStep=0.005, hidden=True),
+        )
+
+        self._updateTemplate()
+        self.setPoses(poses)
+        self.setProperty("Color By", "Axes")
+        self.setProperty("Icon", om.Icons.Axes)
+
+    def getNumberOfFrames(self):
+        return len(self._poses)
+
+    def getPoses(self):
+        return self._poses.copy()
+
+    def getFrameIndex(self, pointId):
+        """Return the index of the frame that owns the given point id."""
+        return pointId // len(self._templatePoints)
+
+    def setPoses(self, poses):
+        """Update all frames from an (N, 4, 4) array of homogeneous transforms.
+
+        The geometry is only rebuilt when the number of frames changes.
+        """
+        poses = np.asarray(poses, dtype=np.float64).reshape(-1, 4, 4)
+        if len(poses) == len(self._poses):
+            self._poses[:] = poses
+            self._updatePoints()
+            if self.getProperty("Visible"):
+                self._renderAllViews()
+        else:
+            self._poses = poses.copy()
+            self._rebuildPolyData()
+
+    def _updateTemplate(self):
+        template = createAxesPolyData(
+            self.getProperty("Scale"), self.getProperty("Tube"), self.getProperty("Tube Width")
+        )
+        self._templatePoints = vnp.getNumpyFromVtk(template, "Points").astype(np.float64)
+        self._templateAxes = vnp.getNumpyFromVtk(template, "Axes").copy()
+        normals = template.GetPointData().GetNormals()
+        self._templateNormals = None
+        if normals:
+            self._templateNormals = vnp.getNumpyFromVtk(template, normals.GetName()).astype(np.float64)
+        self._templateCells = []
+        for cellType, getter in self._cellTypes:
+            cellArray = getattr(template, getter)()
+            if cellArray.GetNumberOfCells():
+                offsets, connectivity = vnp.getNumpyFromVtkCellArray(cellArray)
+                self._templateCells.append((cellType, offsets.copy(), connectivity.copy()))
+
+    def _rebuildPolyData(self):
+        numberOfFrames = len(self._poses)
+        pointsPerFrame = len(self._templatePoints)
+        self._points = np.zeros((numberOfFrames * pointsPerFrame, 3))
+        axes = np.tile(self._templateAxes, numberOfFrames)
+        polyData = vnp.numpyToPolyData(self._points, {"Axes": axes}, createVertexCells=False)
+        for cellType, offsets, connectivity in self._templateCells:
+            offsets, connectivity = vnp.tileCells(offsets, connectivity, numberOfFrames, pointsPerFrame)
+            vnp.setPolyDataCells(polyData, cellType, offsets=offsets, connectivity=connectivity)
+
+        self._normals = None
+        if self._templateNormals is not None:
+            self._normals = np.zeros_like(self._points)
+            normals = vnp.getVtkFromNumpy(self._normals)
+            normals.SetName("Normals")
+            polyData.GetPointData().SetNormals(normals)
+
+        self._updatePoints(polyData)
+        self.setPolyData(polyData)
+
+    def _updatePoints(self, polyData=None):
+        if polyData is None:
+            polyData = self.polyData
+        numberOfFrames = len(self._poses)
+        rotations = self._poses[:, :3, :3]
+        points = self._points.reshape(numberOfFrames, -1, 3)
+        np.einsum("nij,pj->npi", rotations, self._templatePoints, out=points)
+        points += self._poses[:, None, :3, 3]
+        polyData.GetPoints().GetData().Modified()
+        polyData.GetPoints().Modified()
+
+        if self._normals is not None:
+            normals = self._normals.reshape(numberOfFrames, -1, 3)
+            np.einsum("nij,pj->npi", rotations, self._templateNormals, out=normals)
+            polyData.GetPointData().GetNormals().Modified()
+
+        polyData.Modified()
+
+    def _onPropertyChanged(self, propertySet, propertyName):
+        PolyDataItem._onPropertyChanged(self, propertySet, propertyName)
+
+        if propertyName == "Tube":
+            self.properties.setPropertyAttribute("Tube Width", "hidden", not self.getProperty(propertyName))
+        if propertyName in ("Scale", "Tube", "Tube Width"):
+            self._updateTemplate()
+            self._rebuildPolyData()
+
+
 def getParentObj(parent):
     """Get parent object from name or object."""
     if parent is None:
@@ -1152,6 +1537,48 @@ def showPolyData(
     return item
 
 
+def showStreamingPolyData(
+    name,
+    capacity,
+    arrays=None,
+    mode="overwrite",
+    color=None,
+    colorByName=None,
+    colorByRange=None,
+    alpha=1.0,
+    visible=True,
+    view=None,
+    parent="data",
+):
+    """Show a StreamingPolyDataItem and optionally add it to the object model if initialized.
+
+    New data is displayed by calling push() on the returned item.
+    """
+    view = view or app.getCurrentRenderView()
+    if view is None:
+        raise ValueError("view must be provided or applogic.getCurrentRenderView() must return a valid view")
+    if colorByName and colorByName not in (arrays or {}):
+        raise KeyError("Unknown array: %s" % colorByName)
+
+    item = StreamingPolyDataItem(name, capacity, view, arrays=arrays, mode=mode)
+
+    if om.isInitialized():
+        om.addToObjectModel(item, getParentObj(parent))
+
+    item.setProperty("Visible", visible)
+    item.setProperty("Alpha", alpha)
+
+    if colorByName:
+        item.setProperty("Color By", colorByName)
+        item.colorBy(colorByName, colorByRange)
+    else:
+        color = [1.0, 1.0, 1.0] if color is None else color
+        item.setProperty("Color", [float(c) for c in color])
+        item.colorBy(None)
+
+    return item
+
+
 def addChildFrame(obj, initialTransform=None):
     """
     Adds a child frame to the given PolyDataItem.  If initialTransform is given,
@@ -1234,6 +1661,26 @@ def showFrame(frame, name, view=None, parent="data", scale=0.35, visible=True, a
     return item
 
 
+def showFrameSet(poses, name, view=None, parent="data", scale=0.35, visible=True, alpha=1.0, line_width=1):
+    """Show coordinate frames from an (N, 4, 4) pose array as one FrameSetItem."""
+    if view is None:
+        try:
+            view = app.getCurrentRenderView()
+        except:
+            raise ValueError("view must be provided or applogic.getCurrentRenderView() must return a valid view")
+
+    assert view
+
+    item = FrameSetItem(name, poses, view)
+    item.setProperty("Visible", visible)
+    item.setProperty("Alpha", alpha)
+    item.setProperty("Scale", scale)
+    item.setProperty("Line Width", line_width)
+    if om.isInitialized():
+        om.addToObjectModel(item, getParentObj(parent))
+    return item
+
+
 def pickProp(displayPoint, view):
     """Pick a prop at the given display point."""
     for tolerance in (0.0, 0.005, 0.01):
@@ -1359,20 +1806,14 @@ def getObjectByDataSet(dataSet):
     """Find an object that has the given dataset."""
     if not dataSet:
         return None
-    for obj in om.getObjects():
-        if obj.hasDataSet(dataSet):
-            return obj
-    return None
+    return om.findObjectByDataSet(dataSet)
 
 
 def getObjectByProp(prop):
     """Find an object that has the given prop (actor)."""
     if not prop:
         return None
-    for obj in om.getObjects():
-        if obj.hasActor(prop):
-            return obj
-    return None
+    return om.findObjectByActor(prop)
 
 
 def findPickedObject(displayPoint, view):
@@ -1808,6 +2249,8 @@ class TextItem(om.ObjectModelItem):
         view.render()
 
     def _renderAllViews(self):
+        if self._deferRender():
+            return
         for view in self.views:
             view.render()
 
@@ -4,27 +4,122 @@ import numpy as np
 from vtk.util import numpy_support
 
 import director.vtkAll as vtk
-from director.shallowCopy import shallowCopy
 
 
-def numpyToPolyData(pts, pointData=None, createVertexCells=True):
-    """Convert numpy points to VTK PolyData."""
+def numpyToPolyData(pts, pointData=None, createVertexCells=True, copy=False):
+    """Convert numpy points to VTK PolyData.
+
+    By default the points and pointData arrays are wrapped without copying
+    when they are already contiguous, so the returned polydata shares memory
+    with the input arrays and keeps them alive, and later writes to the
+    arrays change the polydata.  Pass copy=True when the input arrays are
+    buffers that the caller or another library may still modify.
+    """
     pd = vtk.vtkPolyData()
-    pd.SetPoints(getVtkPointsFromNumpy(pts.copy()))
+    pd.SetPoints(getVtkPointsFromNumpy(_asContiguous(pts, copy)))
 
     if pointData is not None:
         for key, value in list(pointData.items()):
-            addNumpyToVtk(pd, value.copy(), key)
+            addNumpyToVtk(pd, _asContiguous(value, copy), key)
 
     if createVertexCells:
-        f = vtk.vtkVertexGlyphFilter()
-        f.SetInputData(pd)
-        f.Update()
-        pd = shallowCopy(f.GetOutput())
+        pd.SetVerts(_createVertexCells(pd.GetNumberOfPoints()))
 
     return pd
 
 
+def _asContiguous(numpyArray, copy=False):
+    """Return a C-contiguous array, copying only when required or requested."""
+    if copy:
+        return np.array(numpyArray, order="C", copy=True)
+    return np.ascontiguousarray(numpyArray)
+
+
+def _createVertexCells(numberOfPoints):
+    """Create a vtkCellArray with one vertex cell per point."""
+    ids = np.arange(numberOfPoints + 1, dtype=_idTypeDtype())
+    return getVtkCellArrayFromNumpy(offsets=ids, connectivity=ids[:-1])
+
+
+def getVtkCellArrayFromNumpy(cells=None, offsets=None, connectivity=None):
+    """Build a vtkCellArray from numpy point ids in a single vectorized call.
+
+    Cells are given either as an (N, k) array of point ids, one row per cell,
+    or as a flat connectivity array of point ids together with an offsets
+    array of length N+1 where cell i uses connectivity[offsets[i]:offsets[i+1]].
+    """
+    if cells is not None:
+        if offsets is not None or connectivity is not None:
+            raise ValueError("Pass either cells or offsets and connectivity, not both")
+        cells = np.asarray(cells)
+        if cells.ndim != 2:
+            raise ValueError("cells must be an (N, k) array, got shape %s" % (cells.shape,))
+        numberOfCells, cellSize = cells.shape
+        offsets = np.arange(0, (numberOfCells + 1) * cellSize, cellSize)
+        connectivity = cells.ravel()
+    elif offsets is None or connectivity is None:
+        raise ValueError("Both offsets and connectivity are required")
+
+    idType = _idTypeDtype()
+    offsets = np.ascontiguousarray(offsets, dtype=idType)
+    connectivity = np.ascontiguousarray(connectivity, dtype=idType)
+    if offsets.ndim != 1 or connectivity.ndim != 1 or not len(offsets) or offsets[-1] != len(connectivity):
+        raise ValueError("offsets must be 1-D and end at len(connectivity)")
+
+    cellArray = vtk.vtkCellArray()
+    cellArray.SetData(getVtkFromNumpy(offsets, vtk.VTK_ID_TYPE), getVtkFromNumpy(connectivity, vtk.VTK_ID_TYPE))
+    return cellArray
+
+
+def setPolyDataCells(polyData, cellType, cells=None, offsets=None, connectivity=None):
+    """Assign numpy cells to a vtkPolyData.
+
+    cellType is one of 'verts', 'lines', 'polylines', 'polys' or 'strips'.  Lines and
+    polylines are both stored as line cells; see getVtkCellArrayFromNumpy()
+    for the cells, offsets and connectivity arguments.
+    """
+    setters = {
+        "verts": polyData.SetVerts,
+        "lines": polyData.SetLines,
+        "polylines": polyData.SetLines,
+        "polys": polyData.SetPolys,
+        "strips": polyData.SetStrips,
+    }
+    if cellType not in setters:
+        raise ValueError("Unknown cellType: %s" % cellType)
+    cellArray = getVtkCellArrayFromNumpy(cells, offsets, connectivity)
+    setters[cellType](cellArray)
+    return cellArray
+
+
+def tileCells(offsets, connectivity, numberOfCopies, pointsPerCopy):
+    """Repeat template cells for numberOfCopies copies of a pointsPerCopy point template.
+
+    Copy i references points [i * pointsPerCopy, (i + 1) * pointsPerCopy).
+    Returns the offsets and connectivity arrays of all copies, in the form
+    accepted by getVtkCellArrayFromNumpy().
+    """
+    offsets = np.asarray(offsets)
+    connectivity = np.asarray(connectivity)
+    copyIds = np.arange(numberOfCopies)[:, None]
+    allConnectivity = connectivity[None, :] + copyIds * pointsPerCopy
+    allOffsets = offsets[None, :-1] + copyIds * len(connectivity)
+    allOffsets = np.append(allOffsets.ravel(), numberOfCopies * len(connectivity))
+    return allOffsets, allConnectivity.ravel()
+
+
+def getNumpyFromVtkCellArray(cellArray):
+    """Return the (offsets, connectivity) numpy arrays of a vtkCellArray."""
+    offsets = numpy_support.vtk_to_numpy(cellArray.GetOffsetsArray())
+    connectivity = numpy_support.vtk_to_numpy(cellArray.GetConnectivityArray())
+    return offsets, connectivity
+
+
+def _idTypeDtype():
+    """Return the numpy dtype matching vtkIdType."""
+    return numpy_support.get_vtk_to_numpy_typemap()[vtk.VTK_ID_TYPE]
+
+
 def numpyToImageData(img, flip=True, vtktype=None):
     """Convert numpy image to VTK ImageData."""
     if flip:
@@ -86,8 +181,12 @@ def getVtkPolyDataFromNumpyPoints(points):
     return numpyToPolyData(points)
 
 
-def getVtkFromNumpy(numpyArray):
-    """Convert numpy array to VTK array."""
+def getVtkFromNumpy(numpyArray, arrayType=None):
+    """Convert numpy array to VTK array.
+
+    The VTK array references the numpy memory directly and keeps the numpy
+    array alive for as long as the VTK array exists.
+    """
 
     def MakeCallback(numpyArray):
         def Closure(caller, event):
@@ -95,7 +194,7 @@ def getVtkFromNumpy(numpyArray):
 
         return Closure
 
-    vtkArray = numpy_support.numpy_to_vtk(numpyArray)
+    vtkArray = numpy_support.numpy_to_vtk(numpyArray, array_type=arrayType)
     vtkArray.AddObserver("DeleteEvent", MakeCallback(numpyArray))
     return vtkArray
 
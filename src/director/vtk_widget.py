@@ -7,6 +7,21 @@ import vtk
 from qtpy.QtCore import QTimer
 from qtpy.QtWidgets import QVBoxLayout, QWidget
 
+from director.render_scheduler import get_render_scheduler
+
+_headlessEnabled = False
+
+
+def setHeadlessEnabled(enabled):
+    """Set whether new VTKWidget instances render offscreen by default, see VTKWidget."""
+    global _headlessEnabled
+    _headlessEnabled = bool(enabled)
+
+
+def isHeadlessEnabled():
+    """Return whether new VTKWidget instances render offscreen by default."""
+    return _headlessEnabled
+
 
 class FPSCounter:
     """Exponential moving average FPS counter."""
@@ -45,39 +60,33 @@ class FPSCounter:
 
 
 class VTKWidget(QWidget):
-    """VTK widget that provides Director-compatible API."""
+    """VTK widget that provides Director-compatible API.
+
+    In headless mode the widget is backed by an offscreen vtkRenderWindow
+    instead of a QVTKRenderWindowInteractor, so it renders without a display.
+    VTK chooses the offscreen backend (EGL or OSMesa), which can be forced
+    with the VTK_DEFAULT_OPENGL_WINDOW environment variable.  The render
+    window follows the widget size and the rest of the API is unchanged.
+    """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, headless=None):
         super().__init__(parent)
 
         # Create layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Create VTK render window interactor widget
-        try:
-            from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
-        except ImportError:
-            from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
-
-        # Add a workaround for a strange bug that only seems to happen when
-        # closing this widget in pytest.  It's a unlimited recursion bug that
-        # is trigger when calling __getattr__ during Finalize.
-        def patched_finalize(self):
-            if "_RenderWindow" in self.__dict__:
-                self._RenderWindow.Finalize()
-
-        QVTKRenderWindowInteractor.Finalize = patched_finalize
-
-        self._vtk_widget = QVTKRenderWindowInteractor(self)
+        self._headless = isHeadlessEnabled() if headless is None else headless
+        if self._headless:
+            self._init_offscreen_render_window()
+        else:
+            self._init_qvtk_render_window()
 
         layout.addWidget(self._vtk_widget)
 
-        # Get render window
-        self._render_window = self._vtk_widget.GetRenderWindow()
-
-        # Configure render window
-        self._render_window.SetMultiSamples(8)  # Anti-aliasing
+        # Configure render window, multisampling is expensive on the software
+        # renderers typically used for headless rendering
+        self._render_window.SetMultiSamples(0 if self._headless else 8)  # Anti-aliasing
         self._render_window.SetSize(self.width(), self.height())
 
         # Create renderer
@@ -102,6 +111,10 @@ class VTKWidget(QWidget):
         # Custom bounds for camera reset
         self._custom_bounds = []
 
+        # Render requests are coalesced across views by the global render
+        # scheduler, the render timer is used when the scheduler is disabled
+        self._render_scheduler = get_render_scheduler()
+
         # Render pending flag
         self._render_pending = False
 
@@ -131,6 +144,47 @@ class VTKWidget(QWidget):
         self._view_behaviors = None
         self._renderer.ResetCamera()
 
+    def _init_qvtk_render_window(self):
+        """Create the VTK render window interactor widget."""
+        try:
+            from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+        except ImportError:
+            from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+
+        # Add a workaround for a strange bug that only seems to happen when
+        # closing this widget in pytest.  It's a unlimited recursion bug that
+        # is trigger when calling __getattr__ during Finalize.
+        def patched_finalize(self):
+            if "_RenderWindow" in self.__dict__:
+                self._RenderWindow.Finalize()
+
+        QVTKRenderWindowInteractor.Finalize = patched_finalize
+
+        self._vtk_widget = QVTKRenderWindowInteractor(self)
+
+        # Get render window
+        self._render_window = self._vtk_widget.GetRenderWindow()
+
+    def _init_offscreen_render_window(self):
+        """Create an offscreen render window with a non-GUI interactor."""
+        # Placeholder widget so that code installing Qt event filters on
+        # vtkWidget() keeps working, it never receives input events
+        self._vtk_widget = QWidget(self)
+        self._render_window = vtk.vtkRenderWindow()
+        self._render_window.SetOffScreenRendering(True)
+        self._interactor = vtk.vtkGenericRenderWindowInteractor()
+        self._interactor.SetRenderWindow(self._render_window)
+
+    def _sync_offscreen_size(self):
+        """Resize the offscreen render window to the widget size."""
+        size = (max(self.width(), 1), max(self.height(), 1))
+        if tuple(self._render_window.GetSize()) != size:
+            self._render_window.SetSize(*size)
+
+    def isHeadless(self):
+        """Return True if the view renders to an offscreen render window."""
+        return self._headless
+
     def initializeViewBehaviors(self):
         """Initialize the view behaviors."""
         if self._view_behaviors is None:
@@ -240,6 +294,9 @@ class VTKWidget(QWidget):
 
     def render(self):
         """Request a render (queued, will render on next timer tick)."""
+        if self._render_scheduler is not None:
+            self._render_scheduler.request_render(self)
+            return
         if not self._render_pending:
             self._render_pending = True
             self._render_timer.start()
@@ -248,9 +305,25 @@ class VTKWidget(QWidget):
         """Force an immediate render."""
         self._render_pending = False
         self._render_timer.stop()
+        if self._render_scheduler is not None:
+            self._render_scheduler.begin_render(self)
+        if self._headless:
+            # Hidden widgets get no resize events, so sync the size here
+            self._sync_offscreen_size()
         self._renderer.ResetCameraClippingRange()
         self._render_window.Render()
 
+    def renderScheduler(self):
+        """Return the RenderScheduler that handles render(), or None."""
+        return self._render_scheduler
+
+    def setRenderScheduler(self, scheduler):
+        """Set the RenderScheduler that handles render(), None renders each view from its own timer."""
+        if self._render_scheduler is not None:
+            self._render_scheduler.discard(self)
+            self._render_scheduler.set_view_interacting(self, False)
+        self._render_scheduler = scheduler
+
     def addQuitShortcut(self, key_sequence="Ctrl+Q"):
         """Add a keyboard shortcut to quit the application.
 
@@ -279,6 +352,7 @@ class VTKWidget(QWidget):
             from director.terrain_interactor import setTerrainInteractor
 
             setTerrainInteractor(self, allow_inversion=allow_inversion)
+            self._observeInteraction()
             # Ensure view up is Z-axis for terrain mode
             camera = self._renderer.GetActiveCamera()
             if camera:
@@ -290,8 +364,24 @@ class VTKWidget(QWidget):
         interactor = self._render_window.GetInteractor()
         if interactor:
             interactor.SetInteractorStyle(vtk.vtkInteractorStyleTrackballCamera())
+            self._observeInteraction()
             self.render()
 
+    def _observeInteraction(self):
+        """Render with interactive priority while the interactor style is interacting."""
+        style = self._render_window.GetInteractor().GetInteractorStyle()
+        if style is not None:
+            style.AddObserver(vtk.vtkCommand.StartInteractionEvent, self._on_start_interaction)
+            style.AddObserver(vtk.vtkCommand.EndInteractionEvent, self._on_end_interaction)
+
+    def _on_start_interaction(self, obj, event):
+        if self._render_scheduler is not None:
+            self._render_scheduler.set_view_interacting(self, True)
+
+    def _on_end_interaction(self, obj, event):
+        if self._render_scheduler is not None:
+            self._render_scheduler.set_view_interacting(self, False)
+
     def isTerrainInteractor(self):
         """Check if terrain interactor is currently active.
 
@@ -441,6 +531,8 @@ class VTKWidget(QWidget):
         """Handle widget close event with proper cleanup."""
         # Stop render timer first
         print("VTKWidget.closeEvent", id(self))
+        if getattr(self, "_render_scheduler", None) is not None:
+            self._render_scheduler.discard(self)
         if hasattr(self, "_render_timer"):
             self._render_timer.stop()
             try:
@@ -0,0 +1,36 @@
+"""Tests for the MatplotlibColormaps cache."""
+
+import numpy as np
+
+from director.visualization import MatplotlibColormaps
+
+
+def test_colormap_names_cached():
+    """Test that colormap names are computed once and returned as copies."""
+    MatplotlibColormaps.clearCache()
+    names = MatplotlibColormaps.getColormapNames()
+    assert "viridis" in names
+
+    names.append("not_a_colormap")
+    assert "not_a_colormap" not in MatplotlibColormaps.getColormapNames()
+    assert MatplotlibColormaps._getColormapNames.cache_info().misses == 1
+
+
+def test_colormap_lut_memoized():
+    """Test that lookup tables are shared for equal arguments."""
+    lut = MatplotlibColormaps.getColormapAsVTK("viridis", (0, 2))
+    assert MatplotlibColormaps.getColormapAsVTK("viridis", [0.0, 2.0]) is lut
+    assert MatplotlibColormaps.getColormapAsVTK("viridis", (0, 2), reverse=True) is not lut
+    assert MatplotlibColormaps.getColormapAsVTK("viridis", (0, 3)) is not lut
+    assert lut.GetRange() == (0.0, 2.0)
+
+
+def test_colormap_lut_values():
+    """Test that the vectorized table matches the colormap samples."""
+    colors = MatplotlibColormaps.getColormapArray("plasma", 16)
+    lut = MatplotlibColormaps.getColormapAsVTK("plasma", numColors=16, reverse=True)
+
+    assert lut.GetNumberOfTableValues() == 16
+    table = np.array([lut.GetTableValue(i) for i in range(16)])
+    np.testing.assert_allclose(table[:, :3], colors[::-1], atol=0.5 / 255)
+    np.testing.assert_array_equal(table[:, 3], 1.0)
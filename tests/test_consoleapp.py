@@ -63,3 +63,17 @@ def test_consoleapp_exit_code(qapp):
 
     # Reset for other tests
     consoleapp.ConsoleApp._exitCode = 0
+
+
+def test_consoleapp_headless(qapp):
+    """Test that views created in headless mode render offscreen."""
+    from director import vtk_widget
+
+    try:
+        app = consoleapp.ConsoleApp(headless=True)
+        assert app.isHeadless()
+        view = app.createView(useGrid=False)
+        assert view.isHeadless()
+        assert view.renderWindow().GetOffScreenRendering()
+    finally:
+        vtk_widget.setHeadlessEnabled(False)
@@ -0,0 +1,103 @@
+"""Tests for the batched DebugData primitives."""
+
+import numpy as np
+import pytest
+
+from director import transformUtils
+from director import vtkNumpy as vnp
+from director.debugVis import DebugData
+
+
+def _bounds(d):
+    return np.array(d.getPolyData().GetBounds())
+
+
+def test_add_spheres_matches_add_sphere():
+    centers = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
+    radii = [0.1, 0.5]
+
+    single = DebugData()
+    for center, radius in zip(centers, radii):
+        single.addSphere(center, radius=radius, color=[1, 0, 0])
+
+    batched = DebugData()
+    batched.addSpheres(centers, radii=radii, colors=[1, 0, 0])
+
+    singlePolyData = single.getPolyData()
+    polyData = batched.getPolyData()
+    assert polyData.GetNumberOfPoints() == singlePolyData.GetNumberOfPoints()
+    assert polyData.GetNumberOfPolys() == singlePolyData.GetNumberOfPolys()
+    np.testing.assert_allclose(_bounds(batched), _bounds(single), atol=1e-6)
+    np.testing.assert_array_equal(vnp.getNumpyFromVtk(polyData, "RGB255")[0], [255, 0, 0])
+    assert polyData.GetPointData().GetNormals() is not None
+
+
+def test_add_lines_with_per_line_colors():
+    d = DebugData()
+    p1s = np.zeros((3, 3))
+    p2s = np.eye(3)
+    d.addLines(p1s, p2s, colors=np.eye(3))
+
+    polyData = d.getPolyData()
+    assert polyData.GetNumberOfLines() == 3
+    assert polyData.GetNumberOfPoints() == 6
+    colors = vnp.getNumpyFromVtk(polyData, "RGB255")
+    np.testing.assert_array_equal(colors[::2], np.eye(3) * 255)
+
+    with pytest.raises(ValueError):
+        d.addLines(p1s, p2s[:2])
+
+    tubes = DebugData()
+    tubes.addLines(p1s, p2s, radius=0.01)
+    assert tubes.getPolyData().GetNumberOfStrips() > 0
+
+
+def test_add_arrows_matches_add_arrow():
+    starts = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+    ends = np.array([[0.0, 0.0, 1.0], [2.0, 1.0, 1.0]])
+
+    single = DebugData()
+    for start, end in zip(starts, ends):
+        single.addArrow(start, end, headRadius=0.1, startHead=True)
+
+    batched = DebugData()
+    batched.addArrows(starts, ends, headRadius=0.1, startHead=True)
+
+    assert batched.getPolyData().GetNumberOfPoints() == single.getPolyData().GetNumberOfPoints()
+    np.testing.assert_allclose(_bounds(batched), _bounds(single), atol=1e-6)
+
+    # Zero length arrows are skipped along with their colors
+    withZeroLength = DebugData()
+    withZeroLength.addArrows(
+        np.vstack([starts, [[5.0, 5.0, 5.0]]]),
+        np.vstack([ends, [[5.0, 5.0, 5.0]]]),
+        headRadius=0.1,
+        startHead=True,
+        colors=[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+    )
+    points = vnp.getNumpyFromVtk(withZeroLength.getPolyData())
+    assert np.isfinite(points).all()
+    assert len(points) == single.getPolyData().GetNumberOfPoints()
+    single.addArrow([5.0, 5.0, 5.0], [5.0, 5.0, 5.0])
+    assert single.getPolyData().GetNumberOfPoints() == len(points)
+
+
+def test_add_frames_matches_add_frame():
+    frames = [
+        transformUtils.frameFromPositionAndRPY([0, 0, 0], [0, 0, 0]),
+        transformUtils.frameFromPositionAndRPY([1, 2, 3], [10, 20, 30]),
+    ]
+
+    single = DebugData()
+    for frame in frames:
+        single.addFrame(frame, scale=0.5)
+
+    batched = DebugData()
+    batched.addFrames(np.array([transformUtils.getNumpyFromTransform(f) for f in frames]), scale=0.5)
+
+    np.testing.assert_allclose(
+        vnp.getNumpyFromVtk(batched.getPolyData()), vnp.getNumpyFromVtk(single.getPolyData()), atol=1e-6
+    )
+    np.testing.assert_array_equal(
+        vnp.getNumpyFromVtk(batched.getPolyData(), "RGB255"), vnp.getNumpyFromVtk(single.getPolyData(), "RGB255")
+    )
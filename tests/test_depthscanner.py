@@ -0,0 +1,129 @@
+"""Tests for depthscanner module."""
+
+import numpy as np
+import vtk
+
+from director import depthscanner
+from director import vtkNumpy as vnp
+from director.depthscanner import DepthRayGrid, DepthScanner, depth_buffer_to_depth_image
+
+
+def _reference_depth_image(depth_data, projection_matrix):
+    """Direct inverse projection of every pixel, as in vtkDepthImageUtils."""
+    height, width = depth_data.shape
+    xx, yy = np.meshgrid(np.arange(width), np.arange(height))
+    z = depth_data.ravel().astype(np.float64)
+    pts_ndc = np.stack([2.0 * xx.ravel() / width - 1.0, 2.0 * yy.ravel() / height - 1.0, z, np.ones_like(z)])
+    pts = np.linalg.inv(projection_matrix) @ pts_ndc
+    pts = pts[:3] / pts[3]
+    valid = z != 1.0
+    depth = -pts[2]
+    depth[~valid] = np.nan
+    return depth.reshape(height, width), pts[:, valid].T
+
+
+def _make_buffers(width, height, seed=0):
+    rng = np.random.default_rng(seed)
+    depth = rng.uniform(0.2, 0.99, size=(height, width)).astype(np.float32)
+    depth[0, :] = 1.0
+    color = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+    depth_buffer = vnp.numpyToImageData(depth, flip=False, vtktype=vtk.VTK_FLOAT)
+    color_buffer = vnp.numpyToImageData(color, flip=False, vtktype=vtk.VTK_UNSIGNED_CHAR)
+    return depth, color, depth_buffer, color_buffer
+
+
+def _make_camera(parallel=False):
+    camera = vtk.vtkCamera()
+    camera.SetViewAngle(40)
+    camera.SetClippingRange(0.1, 20.0)
+    camera.SetWindowCenter(0.1, -0.05)
+    camera.SetParallelProjection(parallel)
+    return camera
+
+
+def test_depth_buffer_to_depth_image_matches_inverse_projection():
+    for parallel in [False, True]:
+        depth, color, depth_buffer, color_buffer = _make_buffers(32, 24)
+        camera = _make_camera(parallel)
+        projection = depthscanner.get_depth_projection_matrix(camera, 32, 24)
+        expected_depth, expected_points = _reference_depth_image(depth, projection)
+
+        depth_image, points, colors = depth_buffer_to_depth_image(depth_buffer, color_buffer, camera, DepthRayGrid())
+
+        assert depth_image.shape == (24, 32)
+        np.testing.assert_array_equal(np.isnan(depth_image), np.isnan(expected_depth))
+        np.testing.assert_allclose(depth_image, expected_depth, rtol=1e-5)
+        np.testing.assert_allclose(points, expected_points, rtol=1e-5, atol=1e-6)
+        np.testing.assert_array_equal(colors, color[1:].reshape(-1, 3))
+
+
+def test_ray_grid_cache():
+    _, _, depth_buffer, color_buffer = _make_buffers(16, 12)
+    camera = _make_camera()
+    grid = DepthRayGrid()
+
+    depth_buffer_to_depth_image(depth_buffer, color_buffer, camera, grid)
+    depth_buffer_to_depth_image(depth_buffer, color_buffer, camera, grid)
+    assert grid.build_count == 1
+
+    # Clipping range is not part of the ray directions
+    camera.SetClippingRange(0.5, 5.0)
+    depth_buffer_to_depth_image(depth_buffer, color_buffer, camera, grid)
+    assert grid.build_count == 1
+
+    camera.SetViewAngle(60)
+    depth_buffer_to_depth_image(depth_buffer, color_buffer, camera, grid)
+    assert grid.build_count == 2
+
+    _, _, depth_buffer, color_buffer = _make_buffers(20, 12)
+    depth_buffer_to_depth_image(depth_buffer, color_buffer, camera, grid)
+    assert grid.build_count == 3
+
+
+def test_depth_scanner_worker_thread(qapp):
+    from director.vtk_widget import VTKWidget
+
+    view = VTKWidget()
+    view.resize(64, 48)
+    source = vtk.vtkSphereSource()
+    source.Update()
+    actor = vtk.vtkActor()
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(source.GetOutput())
+    actor.SetMapper(mapper)
+    view.renderer().AddActor(actor)
+    view.show()
+    view.resetCamera()
+    view.forceRender()
+
+    scanner = DepthScanner(view)
+    scanner.updateOnRender = False
+    scanner.pointCloudView.show()
+
+    scanner.update()
+    assert scanner.pointCloudObj is None
+    scanner.waitForConversion()
+    assert scanner.pointCloudObj is not None
+    assert scanner.pointCloudObj.polyData.GetNumberOfPoints() > 0
+
+    # The worker result matches the synchronous conversion of the same buffers
+    request = scanner._captureBuffers()
+    scanner._submitConversion(request)
+    scanner.waitForConversion()
+    _, expected = depthscanner.depthImageAndPointCloudToVtk(*scanner._convertBuffers(*request))
+    polyData = scanner.pointCloudObj.polyData
+    np.testing.assert_array_equal(vnp.getNumpyFromVtk(polyData, "Points"), vnp.getNumpyFromVtk(expected, "Points"))
+    np.testing.assert_array_equal(vnp.getNumpyFromVtk(polyData, "rgb"), vnp.getNumpyFromVtk(expected, "rgb"))
+
+    scanner.useWorkerThread = False
+    scanner.update()
+    assert scanner.pointCloudObj.polyData.GetNumberOfPoints() > 0
+    assert scanner.rayGrid.build_count == 1
+
+    scanner.useWorkerThread = True
+    scanner.update()
+    executor = scanner._executor
+    scanner.shutdown()
+    assert scanner._executor is None
+    assert executor._shutdown
+    assert not scanner.resultTimer.isActive()
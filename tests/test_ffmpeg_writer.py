@@ -0,0 +1,89 @@
+"""Tests for ffmpeg_writer module."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from director.ffmpeg_writer import AsyncFrameWriter
+
+
+class ListWriter:
+    """Writer that keeps copies of the frames, optionally waiting on an event per frame."""
+
+    framerate = 30.0
+
+    def __init__(self, gate=None, fail_after=None):
+        self.frames = []
+        self.gate = gate
+        self.fail_after = fail_after
+        self.closed = False
+
+    def write_frame(self, frame):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.fail_after is not None and len(self.frames) >= self.fail_after:
+            raise OSError("pipe closed")
+        self.frames.append(frame.copy())
+
+    def close(self):
+        self.closed = True
+
+
+def _frame(value, width=8, height=6):
+    return np.full((height, width, 3), value, dtype=np.uint8)
+
+
+def test_async_frame_writer_block():
+    sink = ListWriter()
+    with AsyncFrameWriter(sink, 8, 6, queue_size=2, policy="block") as writer:
+        for i in range(20):
+            assert writer.write_frame(_frame(i))
+
+        buffer = writer.acquire_buffer()
+        buffer[:] = 100
+        writer.submit(buffer)
+
+    assert sink.closed
+    assert [int(f[0, 0, 0]) for f in sink.frames] == list(range(20)) + [100]
+    stats = writer.get_stats()
+    assert stats.frames_submitted == stats.frames_written == 21
+    assert stats.frames_dropped == 0
+    assert stats.max_latency >= stats.mean_latency > 0
+
+    with pytest.raises(ValueError):
+        AsyncFrameWriter(sink, 8, 6, policy="bogus")
+
+
+def test_async_frame_writer_drop():
+    for policy in ["drop", "adaptive"]:
+        gate = threading.Event()
+        sink = ListWriter(gate=gate)
+        writer = AsyncFrameWriter(sink, 8, 6, queue_size=2, policy=policy, adaptive_timeout=0.01)
+
+        # The writer thread holds one buffer while blocked, the other is queued
+        results = [writer.write_frame(_frame(i)) for i in range(5)]
+        assert results[:2] == [True, True]
+        assert not any(results[2:])
+        assert writer.get_stats().frames_dropped == 3
+
+        gate.set()
+        writer.close()
+        assert [int(f[0, 0, 0]) for f in sink.frames] == [0, 1]
+        assert writer.get_stats().frames_written == 2
+
+
+def test_async_frame_writer_error():
+    sink = ListWriter(fail_after=1)
+    writer = AsyncFrameWriter(sink, 8, 6, queue_size=2, policy="block")
+    writer.write_frame(_frame(0))
+    writer.write_frame(_frame(1))
+    writer._thread.join(0.1)
+
+    with pytest.raises(RuntimeError, match="pipe closed"):
+        for i in range(10):
+            writer.write_frame(_frame(i))
+    with pytest.raises(RuntimeError, match="pipe closed"):
+        writer.close()
+    assert sink.closed
+    assert len(sink.frames) == 1
@@ -0,0 +1,75 @@
+"""Tests for FrameSetItem."""
+
+import numpy as np
+
+import director.objectmodel as om
+from director import transformUtils
+from director import vtkNumpy as vnp
+from director.debugVis import DebugData
+from director.visualization import FrameSetItem, showFrameSet
+from director.vtk_widget import VTKWidget
+
+
+def _random_poses(count, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = [transformUtils.frameFromPositionAndRPY(rng.random(3), rng.random(3) * 180) for _ in range(count)]
+    return np.array([transformUtils.getNumpyFromTransform(frame) for frame in frames])
+
+
+def test_frame_set_matches_debug_frames(qapp):
+    """Test that the frame set geometry matches one axes triad per pose."""
+    widget = VTKWidget()
+    poses = _random_poses(4)
+    item = FrameSetItem("frames", poses, widget)
+
+    d = DebugData()
+    d.addFrames(poses, scale=1.0)
+    np.testing.assert_allclose(vnp.getNumpyFromVtk(item.polyData), vnp.getNumpyFromVtk(d.getPolyData()), atol=1e-9)
+    assert item.polyData.GetNumberOfLines() == 12
+    assert item.getNumberOfFrames() == 4
+    assert item.getFrameIndex(7) == 1
+    assert item.getPropertyEnumValue("Color By") == "Axes"
+
+
+def test_frame_set_update_in_place(qapp):
+    """Test that setPoses reuses the polydata when the count is unchanged."""
+    widget = VTKWidget()
+    item = FrameSetItem("frames", _random_poses(3), widget)
+    polyData = item.polyData
+    mtime = polyData.GetMTime()
+
+    poses = _random_poses(3, seed=1)
+    item.setPoses(poses)
+    assert item.polyData is polyData
+    assert polyData.GetMTime() > mtime
+    np.testing.assert_allclose(vnp.getNumpyFromVtk(polyData)[0], poses[0, :3, 3])
+    np.testing.assert_array_equal(item.getPoses(), poses)
+
+    item.setPoses(_random_poses(5))
+    assert item.getNumberOfFrames() == 5
+    assert item.polyData.GetNumberOfLines() == 15
+
+
+def test_frame_set_tube(qapp):
+    """Test that tube geometry is tiled with rotated normals."""
+    widget = VTKWidget()
+    poses = _random_poses(2)
+    item = FrameSetItem("frames", poses, widget)
+    item.setProperty("Tube", True)
+
+    polyData = item.polyData
+    assert polyData.GetNumberOfStrips() > 0
+    normals = vnp.getNumpyFromVtk(polyData, "Normals")
+    np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0, atol=1e-6)
+
+    item.setPoses(np.array([np.eye(4), np.eye(4)]))
+    np.testing.assert_allclose(polyData.GetBounds(), item.polyData.GetBounds())
+
+
+def test_show_frame_set(qapp):
+    widget = VTKWidget()
+    om.init()
+    item = showFrameSet(_random_poses(3), "frame set", view=widget, scale=0.2)
+    assert om.findObjectByName("frame set") is item
+    assert om.findObjectByActor(item.actor) is item
+    assert np.abs(vnp.getNumpyFromVtk(item.polyData)).max() < 2.0
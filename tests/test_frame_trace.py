@@ -0,0 +1,99 @@
+"""Tests for FrameTraceVisualizer."""
+
+import numpy as np
+
+import director.objectmodel as om
+from director import transformUtils
+from director import visualization as vis
+from director.vtk_widget import VTKWidget
+
+
+def _show_frame(name):
+    widget = VTKWidget()
+    om.init()
+    return vis.showFrame(transformUtils.frameFromPositionAndRPY([0, 0, 0], [0, 0, 0]), name, view=widget)
+
+
+def _move(frame, position):
+    frame.copyFrame(transformUtils.frameFromPositionAndRPY(position, [0, 0, 0]))
+    frame.transform.Modified()
+
+
+def test_frame_trace_ring_buffer(qapp):
+    """Test that the trace keeps only the most recent points."""
+    frame = _show_frame("trace_ring")
+    frame.setProperty("Trace Max Points", 5)
+    frame.setProperty("Trace", True)
+    trace = frame._frameTrace
+
+    for i in range(1, 9):
+        _move(frame, [i, 0, 0])
+
+    item = frame.findChild("trace_ring trace")
+    assert item is not None
+    assert trace.get_number_of_points() == 5
+    np.testing.assert_array_equal(trace.get_points()[:, 0], [4, 5, 6, 7, 8])
+
+    cells = item.polyData.GetLines()
+    assert cells.GetNumberOfCells() == 1
+    ids = [cells.GetConnectivityArray().GetValue(i) for i in range(5)]
+    assert [item.polyData.GetPoint(i)[0] for i in ids] == [4, 5, 6, 7, 8]
+
+    frame.setProperty("Trace Max Points", 3)
+    np.testing.assert_array_equal(trace.get_points()[:, 0], [6, 7, 8])
+    assert item.polyData is trace.polyData
+    _move(frame, [9, 0, 0])
+    np.testing.assert_array_equal(trace.get_points()[:, 0], [7, 8, 9])
+
+    frame.setProperty("Trace", False)
+    assert frame.findChild("trace_ring trace") is None
+
+
+def test_frame_trace_decimation(qapp):
+    """Test distance and angle based decimation."""
+    frame = _show_frame("trace_decimation")
+    frame.setProperty("Trace Min Distance", 0.5)
+    frame.setProperty("Trace Min Angle", 5.0)
+    frame.setProperty("Trace", True)
+    trace = frame._frameTrace
+
+    # Closer than the minimum distance to the last point, skipped
+    _move(frame, [0.1, 0, 0])
+    _move(frame, [1, 0, 0])
+    assert trace.get_number_of_points() == 2
+
+    # Collinear with the last segment, merged into the last point
+    _move(frame, [2, 0, 0])
+    _move(frame, [3, 0.01, 0])
+    assert trace.get_number_of_points() == 2
+    np.testing.assert_allclose(trace.get_points()[-1], [3, 0.01, 0])
+
+    # A turn adds a new point
+    _move(frame, [3, 1, 0])
+    assert trace.get_number_of_points() == 3
+
+
+def test_frame_trace_fade(qapp):
+    """Test that fading colors the trace by time and drops expired points."""
+    frame = _show_frame("trace_fade")
+    frame.setProperty("Trace Fade Time", 10.0)
+    frame.setProperty("Trace", True)
+    trace = frame._frameTrace
+
+    for i in range(1, 4):
+        _move(frame, [i, 0, 0])
+
+    item = frame.findChild("trace_fade trace")
+    assert item.mapper.GetScalarVisibility()
+    assert item.mapper.GetLookupTable() is trace._fade_lut
+    assert trace._fade_lut.GetTableValue(0)[3] == 0.0
+    assert trace._fade_lut.GetTableValue(255)[3] == 1.0
+
+    # Age every point past the fade time
+    trace._times[:] -= 20.0
+    trace._on_fade_tick()
+    assert trace.get_number_of_points() == 1
+
+    frame.setProperty("Trace Fade Time", 0.0)
+    assert not item.mapper.GetScalarVisibility()
+    assert not trace._fade_timer.isActive()
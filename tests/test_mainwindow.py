@@ -11,3 +11,15 @@ def test_mainwindowapp(qapp):
     assert fields.view is not None
     assert fields.mainWindow is not None
     assert isinstance(fields.view, VTKWidget)
+
+
+def test_mainwindowapp_headless(qapp):
+    """Test that a headless MainWindowApp renders its view offscreen."""
+    from director import vtk_widget
+
+    try:
+        fields = mainwindowapp.construct(headless=True)
+        assert fields.view.isHeadless()
+        fields.view.forceRender()
+    finally:
+        vtk_widget.setHeadlessEnabled(False)
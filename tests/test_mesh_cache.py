@@ -0,0 +1,120 @@
+"""Tests for the mesh file loader and disk cache."""
+
+import os
+
+import numpy as np
+import pytest
+
+from director import mesh_cache
+from director import vtkAll as vtk
+from director import vtkNumpy as vnp
+
+
+def _write_stl(path, radius):
+    source = vtk.vtkSphereSource()
+    source.SetRadius(radius)
+    writer = vtk.vtkSTLWriter()
+    writer.SetFileName(str(path))
+    writer.SetInputConnection(source.GetOutputPort())
+    writer.Write()
+    return str(path)
+
+
+def test_mesh_cache_roundtrip(tmp_path, monkeypatch):
+    """Test that a decoded mesh is written to the cache and read back without decoding."""
+    mesh_file = _write_stl(tmp_path / "sphere.stl", 1.0)
+    cache_dir = tmp_path / "cache"
+
+    polyData = mesh_cache.load_mesh_files([mesh_file], cache_dir=str(cache_dir), num_workers=0)[mesh_file]
+    assert polyData.GetNumberOfPolys() > 0
+    assert polyData.GetPointData().GetNormals() is not None
+    assert os.listdir(cache_dir) == [mesh_cache.hash_mesh_file(mesh_file) + ".npz"]
+
+    def fail(path):
+        raise AssertionError("mesh should be loaded from the cache")
+
+    monkeypatch.setattr(mesh_cache, "decode_mesh_file", fail)
+    cached = mesh_cache.load_mesh_files([mesh_file], cache_dir=str(cache_dir))[mesh_file]
+    np.testing.assert_array_equal(vnp.getNumpyFromVtk(cached, "Points"), vnp.getNumpyFromVtk(polyData, "Points"))
+    assert cached.GetNumberOfPolys() == polyData.GetNumberOfPolys()
+    np.testing.assert_array_equal(
+        vnp.getNumpyFromVtkCellArray(cached.GetPolys())[1], vnp.getNumpyFromVtkCellArray(polyData.GetPolys())[1]
+    )
+    assert cached.GetPointData().GetNormals().GetName() == "Normals"
+
+
+def test_mesh_cache_point_data_roundtrip():
+    """Test that every point data array and its attribute role survives the cache arrays."""
+    source = vtk.vtkSphereSource()
+    source.Update()
+    polyData = vtk.vtkPolyData()
+    polyData.DeepCopy(source.GetOutput())
+    numPoints = polyData.GetNumberOfPoints()
+    tcoords = vnp.getVtkFromNumpy(np.random.rand(numPoints, 2).astype(np.float32))
+    tcoords.SetName("TextureCoordinates")
+    polyData.GetPointData().SetTCoords(tcoords)
+    vnp.addNumpyToVtk(polyData, np.arange(numPoints, dtype=np.int32), "vertex_id")
+
+    restored = mesh_cache.arrays_to_polydata(mesh_cache.polydata_to_arrays(polyData))
+    pointData = restored.GetPointData()
+    assert pointData.GetNormals().GetName() == "Normals"
+    assert pointData.GetTCoords().GetName() == "TextureCoordinates"
+    for name in ("Normals", "TextureCoordinates", "vertex_id"):
+        np.testing.assert_array_equal(vnp.getNumpyFromVtk(restored, name), vnp.getNumpyFromVtk(polyData, name))
+
+
+def test_default_workers_decode_small_batches_in_process(tmp_path, monkeypatch):
+    """Test that a small batch of cache misses does not start worker processes."""
+    mesh_files = [_write_stl(tmp_path / f"sphere_{i}.stl", 1.0) for i in range(2)]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("small batches should not start worker processes")
+
+    monkeypatch.setattr(mesh_cache, "ProcessPoolExecutor", fail)
+    polyDatas = mesh_cache.load_mesh_files(mesh_files, use_disk_cache=False)
+    assert all(polyDatas[f].GetNumberOfPolys() > 0 for f in mesh_files)
+
+
+def test_mesh_cache_parallel_and_invalidation(tmp_path):
+    """Test parallel decoding and that changed file contents miss the cache."""
+    mesh_files = [_write_stl(tmp_path / f"sphere_{i}.stl", 1.0 + i) for i in range(3)]
+    cache_dir = str(tmp_path / "cache")
+
+    serial = mesh_cache.load_mesh_files(mesh_files, cache_dir=cache_dir, use_disk_cache=False, num_workers=0)
+    parallel = mesh_cache.load_mesh_files(mesh_files, cache_dir=cache_dir, num_workers=2)
+    assert len(os.listdir(cache_dir)) == 3
+    for mesh_file in mesh_files:
+        np.testing.assert_array_equal(
+            vnp.getNumpyFromVtk(serial[mesh_file], "Points"), vnp.getNumpyFromVtk(parallel[mesh_file], "Points")
+        )
+
+    key = mesh_cache.hash_mesh_file(mesh_files[0])
+    _write_stl(mesh_files[0], 5.0)
+    assert mesh_cache.hash_mesh_file(mesh_files[0]) != key
+    polyData = mesh_cache.load_mesh_files(mesh_files[:1], cache_dir=cache_dir)[mesh_files[0]]
+    np.testing.assert_allclose(np.linalg.norm(vnp.getNumpyFromVtk(polyData, "Points"), axis=1), 5.0, rtol=1e-5)
+
+
+def test_mesh_file_key_fast_path_and_failed_write(tmp_path, monkeypatch):
+    """Test that file hashes are reused until the file changes and failed writes leave no temp files."""
+    mesh_file = _write_stl(tmp_path / "sphere.stl", 1.0)
+    hashed = []
+    hash_mesh_file = mesh_cache.hash_mesh_file
+    monkeypatch.setattr(mesh_cache, "hash_mesh_file", lambda path: hashed.append(path) or hash_mesh_file(path))
+
+    key = mesh_cache.get_mesh_file_key(mesh_file)
+    assert mesh_cache.get_mesh_file_key(mesh_file) == key
+    assert len(hashed) == 1
+    stat = os.stat(mesh_file)
+    os.utime(mesh_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert mesh_cache.get_mesh_file_key(mesh_file) == key
+    assert len(hashed) == 2
+
+    def fail(f, **arrays):
+        raise ValueError("cannot write")
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(np, "savez", fail)
+    with pytest.raises(ValueError):
+        mesh_cache._write_cache_file(str(cache_dir / "mesh.npz"), {"points": np.zeros((1, 3))})
+    assert os.listdir(cache_dir) == []
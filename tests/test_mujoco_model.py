@@ -1,6 +1,8 @@
 """Tests for mujoco_model module using the new MujocoRobotModel API."""
 
+import gc
 import os
+import weakref
 
 import numpy as np
 import pytest
@@ -183,3 +185,357 @@ class TestMujocoRobotModel:
         expected_joints = ["joint1", "joint2", "joint3", "joint4"]
         for expected_name in expected_joints:
             assert expected_name in joint_names, f"Expected joint '{expected_name}' not found"
+
+
+def test_mj_mesh_to_vtk_polydata(tmp_path):
+    """Test converting a MuJoCo mesh to vtkPolyData with triangle cells."""
+    import mujoco
+
+    from director.mujoco_model import mj_mesh_to_vtk_polydata
+
+    xml = """
+    <mujoco>
+      <asset>
+        <mesh name="tet" vertex="0 0 0  1 0 0  0 1 0  0 0 1"/>
+      </asset>
+      <worldbody>
+        <geom type="mesh" mesh="tet"/>
+      </worldbody>
+    </mujoco>
+    """
+    model = mujoco.MjModel.from_xml_string(xml)
+
+    polyData = mj_mesh_to_vtk_polydata(model, 0)
+
+    assert polyData.GetNumberOfPoints() == model.mesh_vertnum[0]
+    assert polyData.GetNumberOfPolys() == model.mesh_facenum[0]
+    assert polyData.GetNumberOfVerts() == 0
+    assert mj_mesh_to_vtk_polydata(model, 1) is None
+
+
+def test_compute_pose_arrays(test_model_path):
+    """Test the vectorized pose arrays and the dict views built on them."""
+    import mujoco
+
+    from director.mujoco_model import (
+        compute_body_pose_array,
+        compute_body_poses,
+        compute_site_pose_array,
+        compute_site_poses,
+        get_body_name_table,
+    )
+
+    model = mujoco.MjModel.from_xml_path(test_model_path)
+    data = mujoco.MjData(model)
+    data.qpos[:] = np.linspace(0.1, 0.4, model.nq)
+    mujoco.mj_forward(model, data)
+
+    names = get_body_name_table(model)
+    assert names[0] == "world"
+    assert names[1] == "base"
+    assert get_body_name_table(model) is names
+
+    poses = compute_body_pose_array(model, data)
+    assert poses.shape == (model.nbody, 4, 4)
+    for body_id in range(model.nbody):
+        np.testing.assert_allclose(poses[body_id, :3, :3], data.xmat[body_id].reshape(3, 3))
+        np.testing.assert_allclose(poses[body_id, :3, 3], data.xpos[body_id])
+        np.testing.assert_array_equal(poses[body_id, 3], [0, 0, 0, 1])
+
+    out = np.zeros((model.nbody, 4, 4))
+    assert compute_body_pose_array(model, data, out=out) is out
+    np.testing.assert_array_equal(out, poses)
+
+    body_poses = compute_body_poses(model, data)
+    assert list(body_poses) == list(names)
+    np.testing.assert_array_equal(body_poses["link4"], poses[names.index("link4")])
+
+    assert compute_site_pose_array(model, data).shape == (model.nsite, 4, 4)
+    assert len(compute_site_poses(model, data)) == model.nsite
+
+
+def test_kinematics_plan(test_model_path):
+    """Test that the kinematics plan matches mj_forward and applies the base transform."""
+    import mujoco
+
+    from director.mujoco_model import KinematicsPlan, forward_kinematics
+
+    model = mujoco.MjModel.from_xml_path(test_model_path)
+    plan = KinematicsPlan(model, mujoco.MjData(model))
+    assert len(plan.scalar_joint_names) == model.nq
+
+    values = np.linspace(0.1, 0.4, model.nq)
+    q_dict = dict(zip(plan.scalar_joint_names, values))
+    qpos = plan.qpos_from_dict(q_dict)
+    np.testing.assert_array_equal(qpos, plan.qpos_from_values(values))
+
+    expected_bodies, expected_sites = forward_kinematics(model, mujoco.MjData(model), qpos)
+    body_poses, site_poses = plan.compute(qpos)
+    for body_id, pose in enumerate(expected_bodies.values()):
+        np.testing.assert_allclose(body_poses[body_id], pose)
+    assert len(site_poses) == len(expected_sites)
+
+    world_T_base = np.eye(4)
+    world_T_base[:3, 3] = [1, 2, 3]
+    moved_poses, _ = plan.compute(qpos, world_T_base)
+    np.testing.assert_allclose(moved_poses[:, :3, 3], body_poses[:, :3, 3] + [1, 2, 3])
+
+    with pytest.raises(ValueError):
+        KinematicsPlan(model, mujoco.MjData(model), joint_names=["bogus"])
+
+
+def test_trajectory_pose_cache(test_model_path, qapp):
+    """Test batch trajectory kinematics and the slider pose cache."""
+    from director import applogic
+    from director import objectmodel as om
+    from director.mujoco_model import MujocoRobotModel
+    from director.timestamp_slider import TimestampSlider
+    from director.vtk_widget import VTKWidget
+
+    om.init()
+    applogic.setCurrentRenderView(VTKWidget())
+    robot = MujocoRobotModel(test_model_path, default_folder_name="pose_cache")
+    nq = robot.model.nq
+    trajectory = np.linspace(0, 1, 50 * nq).reshape(50, nq)
+    world_T_base = np.eye(4)
+    world_T_base[:3, 3] = [0, 0, 1]
+
+    body_poses, site_poses = robot.compute_trajectory_poses(trajectory, world_T_base, chunk_size=8)
+    threaded_body_poses, _ = robot.compute_trajectory_poses(trajectory, world_T_base, chunk_size=8, num_workers=3)
+    assert body_poses.shape == (50, robot.model.nbody, 4, 4)
+    assert site_poses.shape == (50, robot.model.nsite, 4, 4)
+    np.testing.assert_array_equal(body_poses, threaded_body_poses)
+    expected, _ = robot.kinematics_plan.compute(trajectory[17], world_T_base)
+    np.testing.assert_allclose(body_poses[17], expected)
+
+    cache = robot.create_pose_cache(trajectory, world_T_base, max_size=20)
+    cache.precompute(num_workers=2)
+    assert len(cache) == 20
+    assert cache.fk_count == 20
+    np.testing.assert_allclose(cache.get(49)[0], body_poses[49])
+    assert cache.fk_count == 20
+    # Cached samples own their memory instead of viewing the precomputed block
+    assert cache.get(49)[0].base is None
+
+    np.testing.assert_allclose(cache.get(3)[0], body_poses[3])
+    assert cache.fk_count == 21
+    assert 3 in cache and 30 not in cache
+
+    slider = TimestampSlider(0.0, 4.9)
+    cache.connect_time_slider(slider, np.arange(50) * 0.1)
+    slider.set_time(0.35)
+    assert cache.fk_count == 21
+    folder = robot.get_model_folder()
+    np.testing.assert_allclose(folder.body_poses["link4"], body_poses[3][robot.get_body_names().index("link4")])
+
+
+def test_merged_body_geoms(tmp_path, qapp):
+    """Test that merge_body_geoms shows one item per body with per-geom cell arrays."""
+    from director import applogic
+    from director import objectmodel as om
+    from director.mujoco_model import MergedGeomsItem, MujocoRobotModel
+    from director.vtk_widget import VTKWidget
+
+    xml_path = tmp_path / "two_geoms.xml"
+    xml_path.write_text(
+        """
+        <mujoco>
+          <worldbody>
+            <body name="arm">
+              <joint name="hinge" type="hinge"/>
+              <geom name="upper" type="box" size="0.1 0.1 0.1" rgba="1 0 0 1"/>
+              <geom name="lower" type="sphere" size="0.1" pos="0 0 0.5" rgba="0 0 1 0.5"/>
+            </body>
+          </worldbody>
+        </mujoco>
+        """
+    )
+    om.init()
+    applogic.setCurrentRenderView(VTKWidget())
+    robot = MujocoRobotModel(str(xml_path))
+    show_options = robot.get_default_show_options()
+    show_options.merge_body_geoms = True
+    robot.set_show_options("merged", show_options)
+    robot.show_forward_kinematics({"hinge": 0.5}, name_or_folder="merged")
+    model_folder = robot.get_model_folder("merged")
+
+    upper, lower = robot.model.geom("upper").id, robot.model.geom("lower").id
+    item = model_folder.geom_items[upper]
+    assert isinstance(item, MergedGeomsItem)
+    assert model_folder.geom_items[lower] is item
+    assert item.get_geom_ids() == [upper, lower]
+    assert item.getProperty("Name") == "arm"
+    np.testing.assert_allclose(item.get_geom_color(lower), [0, 0, 1, 128 / 255.0])
+    assert item.mapper.GetScalarVisibility()
+
+    lower_cells = np.flatnonzero(
+        np.array([item.get_geom_id(i) for i in range(item.polyData.GetNumberOfCells())]) == lower
+    )
+    assert len(lower_cells) > 0
+    item.set_geom_visible(lower, False)
+    assert not item.get_geom_visible(lower) and item.get_geom_visible(upper)
+    assert item.polyData.GetCellGhostArray().GetValue(int(lower_cells[0])) != 0
+    item.set_geom_visible(lower, True)
+    assert item.get_geom_visible(lower)
+
+    # Geoms can be toggled from the properties panel
+    assert item.getProperty("Show Geom upper") and item.getProperty("Show Geom lower")
+    item.setProperty("Show Geom lower", False)
+    assert not item.get_geom_visible(lower)
+    item.set_geom_visible(lower, True)
+    assert item.getProperty("Show Geom lower") and item.get_geom_visible(lower)
+
+    item.set_geom_color(upper, [0, 1, 0, 1])
+    np.testing.assert_allclose(item.get_geom_color(upper), [0, 1, 0, 1])
+
+    frame = item.getChildFrame()
+    np.testing.assert_allclose(frame.transform.GetMatrix().GetElement(0, 0), np.cos(0.5), atol=1e-6)
+
+
+def test_body_frame_updates(test_model_path, qapp):
+    """Test that body frame updates reuse transforms and request one render per view."""
+    from director import applogic, transformUtils
+    from director import objectmodel as om
+    from director.mujoco_model import MujocoRobotModel
+    from director.vtk_widget import VTKWidget
+
+    om.init()
+    view = VTKWidget()
+    applogic.setCurrentRenderView(view)
+    robot = MujocoRobotModel(test_model_path, default_folder_name="frame_updates")
+    robot.show_model()
+    model_folder = robot.get_model_folder()
+    targets = model_folder.body_frame_targets
+    transforms = model_folder.body_transforms
+    link4 = robot.get_body_names().index("link4")
+    link4_frame = model_folder.findChild("Body Frames").findChild("link4")
+    assert (link4, link4_frame) in targets
+
+    render_requests = []
+    view.render = lambda: render_requests.append(True)
+    body_poses, _ = robot.show_forward_kinematics({"joint4": 0.3})
+    assert len(render_requests) == 1
+    assert model_folder.body_frame_targets is targets
+    assert model_folder.body_transforms is transforms
+    np.testing.assert_allclose(transformUtils.getNumpyFromTransform(link4_frame.transform), body_poses["link4"])
+
+    # Unchanged poses do not touch the frames or request a render
+    mtime = link4_frame.transform.GetMTime()
+    robot.show_forward_kinematics({"joint4": 0.3})
+    assert len(render_requests) == 1
+    assert link4_frame.transform.GetMTime() == mtime
+
+    # Removing an item rebuilds the cached targets
+    om.removeFromObjectModel(link4_frame)
+    robot.show_forward_kinematics({"joint4": 0.4})
+    assert all(frame is not link4_frame for _, frame in model_folder.body_frame_targets)
+
+
+def test_xml_parse_cache(tmp_path, monkeypatch):
+    """Test that MJCF files are parsed once and re-parsed only when they change."""
+    import xml.etree.ElementTree as ET
+
+    from director.mujoco_model import MuJoCoMeshResolver
+
+    (tmp_path / "assets.xml").write_text(
+        '<mujoco><asset><mesh name="part" file="part.stl"/><material name="red" rgba="1 0 0 1"/></asset></mujoco>'
+    )
+    (tmp_path / "robot.xml").write_text('<mujoco><include file="assets.xml"/><worldbody/></mujoco>')
+    (tmp_path / "scene.xml").write_text(
+        '<mujoco><include file="robot.xml"/><include file="assets.xml"/>'
+        '<worldbody><geom name="floor" type="plane"/></worldbody></mujoco>'
+    )
+
+    parsed = []
+    parse = ET.parse
+    monkeypatch.setattr(ET, "parse", lambda path: parsed.append(os.path.basename(path)) or parse(path))
+
+    resolver = MuJoCoMeshResolver()
+    resolver.add_xml_path(str(tmp_path / "scene.xml"))
+    assert sorted(parsed) == ["assets.xml", "robot.xml", "scene.xml"]
+    assert resolver.resolve_mesh_file("part") == str(tmp_path / "part.stl")
+    assert resolver.get_material_rgba("red") == [1, 0, 0, 1]
+    assert "floor" in resolver.geom_name_to_element
+    assert [os.path.basename(p) for p in resolver.find_all_xml_includes(str(tmp_path / "scene.xml"))] == [
+        "scene.xml",
+        "robot.xml",
+        "assets.xml",
+    ]
+
+    # A reload parses nothing, and an edited file is parsed again
+    parsed.clear()
+    MuJoCoMeshResolver().add_xml_path(str(tmp_path / "scene.xml"))
+    assert parsed == []
+
+    (tmp_path / "assets.xml").write_text('<mujoco><asset><mesh name="part" file="part_v2.stl"/></asset></mujoco>')
+    resolver = MuJoCoMeshResolver()
+    resolver.add_xml_path(str(tmp_path / "scene.xml"))
+    assert parsed == ["assets.xml"]
+    assert resolver.resolve_mesh_file("part") == str(tmp_path / "part_v2.stl")
+
+
+def test_shared_geometry_across_instances(test_model_path, tmp_path, qapp):
+    """Test that model instances share geom polydata but not mappers or actors."""
+    from director import applogic
+    from director import objectmodel as om
+    from director.mujoco_model import GeomItem, MujocoRobotModel, _geom_polydata_cache
+    from director.vtk_widget import VTKWidget
+
+    om.init()
+    applogic.setCurrentRenderView(VTKWidget())
+    first = MujocoRobotModel(test_model_path)
+    second = MujocoRobotModel(test_model_path)
+    first.show_model("instance_a")
+    second.show_model("instance_b")
+    first.show_model("instance_c")
+
+    geom_id = first.model.geom("link2_geom").id
+    items = [
+        robot.get_model_folder(name).geom_items[geom_id]
+        for robot, name in [(first, "instance_a"), (second, "instance_b"), (first, "instance_c")]
+    ]
+    assert all(isinstance(item, GeomItem) for item in items)
+    assert items[0].polyData is items[1].polyData is items[2].polyData
+    assert items[0].mapper is not items[1].mapper
+    assert items[0].actor is not items[1].actor
+
+    # Per instance color and opacity live on the actor
+    items[0].setProperty("Color", [0.0, 1.0, 0.0])
+    items[0].setProperty("Alpha", 0.5)
+    assert items[1].actor.GetProperty().GetColor() == (0.0, 0.0, 1.0)
+    assert items[1].actor.GetProperty().GetOpacity() == 1.0
+
+    # Coloring by an array only changes the item's own mapper
+    arrayName = items[0].getArrayNames()[0]
+    items[0].colorBy(arrayName)
+    assert items[0].mapper.GetScalarVisibility()
+    assert items[0].mapper.GetArrayName() == arrayName
+    assert not items[1].mapper.GetScalarVisibility()
+    assert items[0].polyData is items[1].polyData
+    assert items[0].polyData.GetPointData().GetScalars() is None
+    items[0].colorBy(None)
+    assert not items[0].mapper.GetScalarVisibility()
+
+    # Shared geometry is released once the models showing it are removed
+    xml_path = tmp_path / "released.xml"
+    xml_path.write_text(
+        """
+        <mujoco>
+          <worldbody>
+            <body name="released">
+              <geom name="released_box" type="box" size="0.123 0.2 0.3"/>
+            </body>
+          </worldbody>
+        </mujoco>
+        """
+    )
+    released = MujocoRobotModel(str(xml_path))
+    released.show_model("released_a")
+    released.show_model("released_b")
+    geom_id = released.model.geom("released_box").id
+    shared_polydata = weakref.ref(released.get_model_folder("released_a").geom_items[geom_id].polyData)
+    assert shared_polydata() in _geom_polydata_cache.values()
+    for name in ["released_a", "released_b"]:
+        om.removeFromObjectModel(om.findObjectByName(name))
+    gc.collect()
+    assert shared_polydata() is None
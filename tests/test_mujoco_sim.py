@@ -0,0 +1,92 @@
+"""Tests for the threaded MuJoCo simulation runner."""
+
+import os
+import time
+
+import mujoco
+import numpy as np
+import pytest
+
+from director.mujoco_sim import MujocoSimRunner
+
+
+@pytest.fixture
+def test_model_path():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_simple_mujoco_model.xml")
+
+
+def _wait_for(condition, timeout=5.0):
+    start = time.monotonic()
+    while not condition():
+        assert time.monotonic() - start < timeout
+        time.sleep(0.005)
+
+
+def test_sim_runner_publishes_snapshots(test_model_path):
+    """Test that the runner steps in the background and publishes consistent snapshots."""
+    model = mujoco.MjModel.from_xml_path(test_model_path)
+    controls = []
+    runner = MujocoSimRunner(model, real_time_factor=None, control_callback=lambda m, d: controls.append(d.time))
+    assert runner.get_latest_snapshot() is None
+
+    runner.start()
+    _wait_for(lambda: runner.get_step_count() > 200)
+    first = runner.get_latest_snapshot()
+    _wait_for(lambda: runner.get_latest_snapshot(newer_than=first.sequence) is not None)
+    runner.stop()
+    assert not runner.is_running()
+    assert runner.error is None
+    assert len(controls) == runner.get_step_count()
+
+    latest = runner.get_latest_snapshot()
+    assert latest.sequence > first.sequence
+    assert latest.sequence == runner.get_step_count()
+    np.testing.assert_array_equal(latest.qpos, runner.data.qpos)
+    np.testing.assert_array_equal(latest.xpos, runner.data.xpos)
+    assert latest.body_pose_array().shape == (model.nbody, 4, 4)
+    np.testing.assert_array_equal(latest.body_pose_array()[:, :3, 3], runner.data.xpos)
+
+    # Snapshots are copies, independent of the buffers
+    latest.qpos[:] = 123.0
+    assert not np.any(runner.get_latest_snapshot().qpos == 123.0)
+    assert runner.get_latest_snapshot(newer_than=latest.sequence) is None
+
+
+def test_sim_runner_real_time_factor(test_model_path):
+    """Test that simulation time follows wall clock time scaled by the real-time factor."""
+    model = mujoco.MjModel.from_xml_path(test_model_path)
+    runner = MujocoSimRunner(model, real_time_factor=2.0)
+    start = time.perf_counter()
+    runner.start()
+    time.sleep(0.25)
+    runner.stop()
+    elapsed = time.perf_counter() - start
+    assert 0.25 <= runner.data.time <= 2.0 * elapsed + model.opt.timestep
+
+
+def test_sim_runner_drives_kinematics_updater(test_model_path, qapp):
+    """Test that the viewer timer shows the latest snapshot through a KinematicsUpdater."""
+    from director import applogic
+    from director import objectmodel as om
+    from director.mujoco_model import MujocoRobotModel
+    from director.vtk_widget import VTKWidget
+
+    om.init()
+    applogic.setCurrentRenderView(VTKWidget())
+    robot = MujocoRobotModel(test_model_path, default_folder_name="sim_runner")
+    robot.show_model()
+    updater = robot.get_kinematics_cache("sim_runner")
+
+    runner = MujocoSimRunner(robot.model, real_time_factor=None)
+    runner.data.qpos[:] = 0.3
+    timer = runner.connect_kinematics_updater(updater, target_fps=60)
+    runner.start()
+    _wait_for(lambda: runner.get_step_count() > 10)
+    runner.stop()
+
+    timer.callback()
+    snapshot = runner.get_latest_snapshot()
+    folder = robot.get_model_folder()
+    names = robot.get_body_names()
+    np.testing.assert_allclose(folder.body_poses["link4"], snapshot.body_pose_array()[names.index("link4")])
+    assert updater.q_dict["joint1"] == snapshot.qpos[robot.model.joint("joint1").qposadr[0]]
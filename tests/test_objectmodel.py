@@ -104,3 +104,76 @@ def test_object_model_property_change_updates_tree_item(qapp):
     # Verify the tree item text has been updated again
     assert tree_item.text() == "another name"
     assert obj.getProperty("Name") == "another name"
+
+
+def test_object_model_actor_and_dataset_index(qapp):
+    """Test that objects can be found by actor and dataset as they change."""
+    import vtk
+
+    from director.visualization import PolyDataItem
+
+    tree = ObjectModelTree()
+    tree.init()
+
+    polyData = vtk.vtkPolyData()
+    item = PolyDataItem("indexed", polyData, None)
+    assert tree.findObjectByActor(item.actor) is None
+
+    tree.addToObjectModel(item)
+    assert tree.findObjectByActor(item.actor) is item
+    assert tree.findObjectByDataSet(polyData) is item
+    assert tree.findObjectByActor(vtk.vtkActor()) is None
+
+    # A second item sharing the dataset is found once the first is removed
+    other = PolyDataItem("shared", polyData, None)
+    tree.addToObjectModel(other)
+    assert tree.findObjectByDataSet(polyData) is item
+
+    newPolyData = vtk.vtkPolyData()
+    item.setPolyData(newPolyData)
+    assert tree.findObjectByDataSet(newPolyData) is item
+    assert tree.findObjectByDataSet(polyData) is other
+
+    tree.removeFromObjectModel(item)
+    assert tree.findObjectByActor(item.actor) is None
+    assert tree.findObjectByDataSet(newPolyData) is None
+    assert tree.findObjectByActor(other.actor) is other
+
+
+def test_object_model_batch_update_renders_once(qapp):
+    """Test that batched property changes dispatch once and render once."""
+    import vtk
+
+    from director.visualization import PolyDataItem
+
+    class CountingView:
+        def __init__(self):
+            self.renders = 0
+
+        def render(self):
+            self.renders += 1
+
+        def renderer(self):
+            return vtk.vtkRenderer()
+
+    view = CountingView()
+    tree = ObjectModelTree()
+    tree.init()
+    items = [PolyDataItem("item %d" % i, vtk.vtkPolyData(), view) for i in range(3)]
+    for item in items:
+        tree.addToObjectModel(item)
+
+    changes = []
+    items[0].connectPropertyChanged(lambda propertySet, name: changes.append(name))
+
+    view.renders = 0
+    with tree.batchUpdate():
+        for item in items:
+            item.setProperty("Alpha", 0.5)
+            item.setProperty("Point Size", 4)
+            item.setProperty("Alpha", 0.25)
+        assert view.renders == 0
+
+    assert changes == ["Alpha", "Point Size"]
+    assert view.renders == len(items)
+    assert items[0].actor.GetProperty().GetOpacity() == 0.25
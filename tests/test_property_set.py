@@ -153,3 +153,24 @@ def test_enum_properties_accept_string_and_int():
 
     with pytest.raises(ValueError):
         props.setProperty("Surface Mode", "Invalid")
+
+
+def test_batch_update_coalesces_notifications():
+    props = create_sample_property_set()
+    changes = []
+    props.connectPropertyChanged(lambda propertySet, name: changes.append((name, propertySet.getProperty(name))))
+
+    with props.batchUpdate():
+        props.setProperty("Visible", False)
+        props.setProperty("Position", [1.0, 1.0, 1.0])
+        with props.batchUpdate():
+            props.setProperty("Visible", True)
+            props.setProperty("Visible", False)
+        # Values are visible inside the batch, notifications are not
+        assert props.getProperty("Visible") is False
+        assert changes == []
+
+    assert changes == [("Visible", False), ("Position", (1.0, 1.0, 1.0))]
+
+    props.setProperty("Visible", True)
+    assert changes[-1] == ("Visible", True)
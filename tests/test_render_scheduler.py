@@ -0,0 +1,129 @@
+"""Tests for render_scheduler module."""
+
+import gc
+import time
+
+from qtpy import QtWidgets
+
+from director.render_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_NORMAL,
+    RenderScheduler,
+    get_render_scheduler,
+)
+from director.vtk_widget import VTKWidget
+
+
+class CountingView:
+    def __init__(self, scheduler, name, render_time=0.0):
+        self.scheduler = scheduler
+        self.name = name
+        self.render_time = render_time
+        self.render_count = 0
+        self.render_log = None
+
+    def forceRender(self):
+        self.scheduler.begin_render(self)
+        self.render_count += 1
+        if self.render_log is not None:
+            self.render_log.append(self.name)
+        time.sleep(self.render_time)
+
+
+def process_events_until(condition, timeout=2.0):
+    end_time = time.time() + timeout
+    while not condition() and time.time() < end_time:
+        QtWidgets.QApplication.processEvents()
+        time.sleep(0.001)
+    return condition()
+
+
+def test_render_requests_are_coalesced(qapp):
+    scheduler = RenderScheduler()
+    views = [CountingView(scheduler, "a"), CountingView(scheduler, "b")]
+    for _ in range(10):
+        for view in views:
+            scheduler.request_render(view)
+
+    assert process_events_until(lambda: not any(scheduler.is_render_pending(v) for v in views))
+    assert [view.render_count for view in views] == [1, 1]
+    stats = scheduler.get_stats()
+    assert (stats.requests, stats.renders, stats.coalesced) == (20, 2, 18)
+
+    # A forced render satisfies a pending request, which was not coalesced
+    scheduler.request_render(views[0])
+    views[0].forceRender()
+    assert not scheduler.is_render_pending(views[0])
+    assert scheduler.get_stats().coalesced == 18
+
+    # Views are held weakly
+    scheduler.request_render(CountingView(scheduler, "deleted"))
+    gc.collect()
+    assert not len(scheduler._dirty)
+
+
+def test_render_rate_cap(qapp):
+    scheduler = RenderScheduler()
+    view = CountingView(scheduler, "a")
+    scheduler.set_view_max_fps(view, 10.0)
+    assert scheduler.get_view_max_fps(view) == 10.0
+
+    view.forceRender()
+    start_time = time.time()
+    scheduler.request_render(view)
+    assert process_events_until(lambda: view.render_count == 2)
+    assert time.time() - start_time > 0.05
+    assert scheduler.get_stats().rate_limited == 1
+
+
+def test_render_priority_and_budget(qapp):
+    scheduler = RenderScheduler(frame_budget=0.0)
+    log = []
+    background = CountingView(scheduler, "background", render_time=0.002)
+    normal = CountingView(scheduler, "normal", render_time=0.002)
+    interactive = CountingView(scheduler, "interactive", render_time=0.002)
+    scheduler.set_view_priority(background, PRIORITY_BACKGROUND)
+    scheduler.set_view_priority(interactive, PRIORITY_INTERACTIVE)
+    for view in [background, normal, interactive]:
+        view.render_log = log
+        scheduler.request_render(view)
+
+    assert process_events_until(lambda: len(log) == 3)
+    assert log == ["interactive", "normal", "background"]
+    assert scheduler.get_stats().over_budget >= 1
+
+
+def test_vtk_widget_uses_render_scheduler(qapp):
+    scheduler = get_render_scheduler()
+    view = VTKWidget()
+    assert view.renderScheduler() is scheduler
+
+    view.render()
+    assert scheduler.is_render_pending(view)
+    view.forceRender()
+    assert not scheduler.is_render_pending(view)
+
+    view.setRenderScheduler(None)
+    view.render()
+    assert not scheduler.is_render_pending(view)
+    assert process_events_until(lambda: not view._render_pending)
+
+
+def test_vtk_widget_interaction_priority(qapp):
+    scheduler = get_render_scheduler()
+    for setInteractor in ["setTerrainInteractor", "setTrackballInteractor"]:
+        view = VTKWidget()
+        view.resize(100, 100)
+        getattr(view, setInteractor)()
+        interactor = view.renderWindow().GetInteractor()
+        assert scheduler.get_view_priority(view) == PRIORITY_NORMAL
+
+        interactor.SetEventInformation(50, 50)
+        interactor.InvokeEvent("LeftButtonPressEvent")
+        assert scheduler.is_view_interacting(view)
+        assert scheduler.get_view_priority(view) == PRIORITY_INTERACTIVE
+
+        interactor.InvokeEvent("LeftButtonReleaseEvent")
+        assert not scheduler.is_view_interacting(view)
+        assert scheduler.get_view_priority(view) == PRIORITY_NORMAL
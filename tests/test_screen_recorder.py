@@ -0,0 +1,106 @@
+"""Tests for screen_recorder module."""
+
+import time
+
+import numpy as np
+from qtpy import QtWidgets
+
+from director.ffmpeg_writer import AsyncFrameWriter
+from director.screen_recorder import (
+    ScreenRecorder,
+    capture_screenshot,
+    export_slider_playback,
+    get_export_frame_values,
+)
+from director.valueslider import ValueSlider
+from director.vtk_widget import VTKWidget
+
+
+def test_capture_screenshot_into_buffer(qapp):
+    view = VTKWidget()
+    view.resize(64, 48)
+    view.show()
+    view.forceRender()
+
+    image = capture_screenshot(view)
+    buffer = np.zeros_like(image)
+    assert capture_screenshot(view, out=buffer) is buffer
+    assert buffer.shape == (48, 64, 3)
+
+
+def test_screen_recorder_widget(qapp):
+    recorder = ScreenRecorder(QtWidgets.QMainWindow(), VTKWidget())
+    assert recorder.backpressure_policy == "adaptive"
+    recorder._set_writer_mode("spool")
+    assert recorder.backpressure_policy == "block"
+    assert recorder.backpressure_actions["block"].isChecked()
+    recorder._set_writer_mode("stream")
+    assert recorder.backpressure_policy == "adaptive"
+
+    # A policy chosen from the menu is kept for both writer modes
+    recorder.backpressure_actions["drop"].trigger()
+    assert recorder.backpressure_policy == "drop"
+    recorder._set_writer_mode("spool")
+    assert recorder.backpressure_policy == "drop"
+    assert recorder.get_widget().layout().indexOf(recorder.record_button) == 0
+
+
+def test_export_frame_values():
+    values = get_export_frame_values(1.0, 3.0, framerate=30.0, playback_rate=2.0)
+    assert len(values) == 31
+    assert values[0] == 1.0
+    np.testing.assert_allclose(values[-1], 3.0)
+    np.testing.assert_allclose(np.diff(values), 2.0 / 30.0)
+    np.testing.assert_array_equal(values, get_export_frame_values(1.0, 3.0, framerate=30.0, playback_rate=2.0))
+
+
+def test_export_slider_playback(qapp):
+    view = VTKWidget()
+    view.resize(64, 48)
+    width, height = view.renderWindow().GetSize()
+    original_offscreen = view.renderWindow().GetOffScreenRendering()
+
+    slider = ValueSlider(0.0, 2.0)
+    slider.setValue(0.5)
+    seen_values = []
+    slider.connectValueChanged(seen_values.append)
+
+    frames = []
+
+    class ListWriter:
+        def write_frame(self, frame):
+            time.sleep(0.005)
+            frames.append(frame.copy())
+
+        def close(self):
+            pass
+
+    # Export waits for the slow writer even under the drop policy
+    writer = AsyncFrameWriter(ListWriter(), width, height, queue_size=1, policy="drop")
+    progress = []
+    frames_done = export_slider_playback(
+        view,
+        slider,
+        writer,
+        start=0.0,
+        end=1.0,
+        framerate=10.0,
+        offscreen=True,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+    writer.close()
+
+    assert frames_done == 11
+    assert len(frames) == 11
+    assert writer.get_stats().frames_dropped == 0
+    assert frames[0].shape == (height, width, 3)
+    assert progress[-1] == (11, 11)
+    np.testing.assert_allclose(seen_values[:11], np.arange(11) / 10.0)
+    assert slider.getValue() == 0.5
+    assert view.renderWindow().GetOffScreenRendering() == original_offscreen
+
+    # Stop early from the progress callback
+    frames_done = export_slider_playback(
+        view, slider, ListWriter(), end=1.0, framerate=10.0, progress_callback=lambda done, total: done < 3
+    )
+    assert frames_done == 3
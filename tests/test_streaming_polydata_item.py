@@ -0,0 +1,125 @@
+"""Tests for StreamingPolyDataItem."""
+
+import numpy as np
+import pytest
+
+import director.objectmodel as om
+from director.visualization import StreamingPolyDataItem, showStreamingPolyData
+from director.vtk_widget import VTKWidget
+
+
+def test_streaming_item_overwrite(qapp):
+    """Test that overwrite mode replaces the displayed points in place."""
+    widget = VTKWidget()
+    item = StreamingPolyDataItem("stream", 10, widget, arrays={"intensity": np.float32})
+    polyData = item.polyData
+    pointsArray = polyData.GetPoints().GetData()
+
+    item.push(np.ones((4, 3)), intensity=np.arange(4))
+    assert item.getNumberOfPoints() == 4
+    assert polyData.GetNumberOfVerts() == 4
+
+    item.push(np.full((2, 3), 2.0), intensity=[5, 6])
+    assert item.getNumberOfPoints() == 2
+    assert polyData.GetNumberOfVerts() == 2
+    np.testing.assert_array_equal(item.getPoints(), np.full((2, 3), 2.0))
+    np.testing.assert_array_equal(item.getArray("intensity"), [5, 6])
+
+    # The polydata and its arrays are reused across pushes
+    assert item.polyData is polyData
+    assert polyData.GetPoints().GetData() is pointsArray
+    assert polyData.GetNumberOfPoints() == 10
+
+
+def test_streaming_item_append_wraparound(qapp):
+    """Test that append mode keeps the most recent points in a ring buffer."""
+    widget = VTKWidget()
+    item = StreamingPolyDataItem("stream", 5, widget, arrays={"rgb": (np.uint8, 3)}, mode="append")
+
+    for i in range(7):
+        item.push([[i, 0, 0]], rgb=[[i, i, i]])
+
+    assert item.getNumberOfPoints() == 5
+    assert item.polyData.GetNumberOfVerts() == 5
+    np.testing.assert_array_equal(item.getPoints()[:, 0], [2, 3, 4, 5, 6])
+    np.testing.assert_array_equal(item.getArray("rgb")[:, 0], [2, 3, 4, 5, 6])
+
+    item.push(np.arange(24).reshape(8, 3))
+    np.testing.assert_array_equal(item.getPoints()[:, 0], [9, 12, 15, 18, 21])
+
+    item.clear()
+    assert item.getNumberOfPoints() == 0
+    assert item.polyData.GetNumberOfVerts() == 0
+
+
+def test_streaming_item_omitted_arrays_are_zeroed(qapp):
+    """Test that arrays left out of a push do not keep values from earlier pushes."""
+    widget = VTKWidget()
+    item = StreamingPolyDataItem(
+        "stream", 4, widget, arrays={"intensity": np.float32, "rgb": (np.uint8, 3)}, mode="append"
+    )
+
+    item.push(np.ones((3, 3)), intensity=[1, 2, 3], rgb=np.full((3, 3), 255))
+    item.push(np.ones((3, 3)), intensity=[4, 5, 6])
+
+    np.testing.assert_array_equal(item.getArray("intensity"), [3, 4, 5, 6])
+    np.testing.assert_array_equal(item.getArray("rgb")[:, 0], [255, 0, 0, 0])
+
+
+def test_streaming_item_color_range_uses_valid_points(qapp):
+    """Test that the default Color By range ignores the unfilled buffer slots."""
+    widget = VTKWidget()
+    item = StreamingPolyDataItem("stream", 10, widget, arrays={"intensity": np.float32})
+    item.push(np.ones((3, 3)), intensity=[2, 3, 4])
+
+    item.setProperty("Color By", "intensity")
+    assert item.getProperty("Scalar Range Min") == 2.0
+    assert item.getProperty("Scalar Range Max") == 4.0
+    assert item.mapper.GetLookupTable().GetRange() == (2.0, 4.0)
+
+    with pytest.raises(KeyError):
+        showStreamingPolyData("stream_bad_color", 10, arrays={"intensity": np.float32}, colorByName="x", view=widget)
+
+
+def test_streaming_item_push_marks_modified(qapp):
+    """Test that push only bumps the modified time of the existing arrays."""
+    widget = VTKWidget()
+    item = StreamingPolyDataItem("stream", 8, widget, arrays={"intensity": np.float32})
+    colorByNames = item.properties.getPropertyAttribute("Color By", "enumNames")
+
+    mtime = item.polyData.GetMTime()
+    item.push(np.random.random((3, 3)), intensity=np.ones(3))
+
+    assert item.polyData.GetMTime() > mtime
+    assert item.properties.getPropertyAttribute("Color By", "enumNames") == colorByNames
+
+
+def test_streaming_item_invalid_arguments(qapp):
+    """Test argument validation."""
+    widget = VTKWidget()
+    with pytest.raises(ValueError):
+        StreamingPolyDataItem("stream", 8, widget, mode="bogus")
+
+    item = StreamingPolyDataItem("stream", 8, widget, arrays={"intensity": np.float32})
+    with pytest.raises(KeyError):
+        item.push(np.zeros((2, 3)), labels=[1, 2])
+    with pytest.raises(ValueError):
+        item.push(np.zeros((2, 3)), intensity=[1, 2, 3])
+
+
+def test_show_streaming_polydata(qapp):
+    """Test showStreamingPolyData adds the item to the object model."""
+    widget = VTKWidget()
+    om.init()
+
+    item = showStreamingPolyData(
+        "streaming_test",
+        100,
+        arrays={"intensity": np.float32},
+        colorByName="intensity",
+        colorByRange=(0.0, 1.0),
+        view=widget,
+    )
+
+    assert om.findObjectByName("streaming_test") is item
+    assert item.getPropertyEnumValue("Color By") == "intensity"
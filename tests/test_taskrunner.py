@@ -0,0 +1,70 @@
+"""Tests for taskrunner module."""
+
+import concurrent.futures
+import sys
+import threading
+import time
+
+import pytest
+from qtpy.QtCore import QCoreApplication
+
+from director.taskrunner import TaskRunner
+
+
+def _process_events_until(condition, timeout=5.0):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout, "timed out waiting for condition"
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+
+
+def test_done_callback_on_main_thread(qapp):
+    switch_interval = sys.getswitchinterval()
+    runner = TaskRunner()
+    assert sys.getswitchinterval() == switch_interval
+
+    results = []
+    future = runner.callOnThread(lambda a, b: (a + b, threading.current_thread()), 1, b=2)
+    runner.addDoneCallback(future, lambda f: results.append((f.result()[0], threading.current_thread())))
+    runner.callOnMain(lambda: results.append(("main", threading.current_thread())))
+
+    value, worker_thread = future.result(timeout=5)
+    assert value == 3
+    assert worker_thread is not threading.main_thread()
+
+    _process_events_until(lambda: len(results) == 2)
+    assert {r[0] for r in results} == {3, "main"}
+    assert all(r[1] is threading.main_thread() for r in results)
+    runner.shutdown()
+
+
+def test_bounded_workers_cancel_and_timeout(qapp):
+    runner = TaskRunner(maxWorkers=2)
+    gate = threading.Event()
+    thread_names = set()
+
+    def job(i):
+        thread_names.add(threading.current_thread().name)
+        gate.wait()
+        return i
+
+    futures = [runner.callOnThread(job, i) for i in range(10)]
+    with pytest.raises(concurrent.futures.TimeoutError):
+        futures[0].result(timeout=0.05)
+
+    # Jobs waiting for a worker can be cancelled
+    assert futures[-1].cancel()
+    cancelled = []
+    runner.addDoneCallback(futures[-1], lambda f: cancelled.append(f.cancelled()))
+
+    gate.set()
+    assert [f.result(timeout=5) for f in futures[:-1]] == list(range(9))
+    assert len(thread_names) <= 2
+    _process_events_until(lambda: cancelled)
+    assert cancelled == [True]
+
+    failed = runner.callOnThread(lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        failed.result(timeout=5)
+    runner.shutdown()
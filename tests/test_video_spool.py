@@ -0,0 +1,118 @@
+"""Tests for video_spool module."""
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from director.video_spool import SpoolEncodeJob, SpoolReader, SpoolWriter, encode_spool
+
+has_ffmpeg = shutil.which("ffmpeg") is not None
+
+
+def _frames(count, width=16, height=12):
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def _write_spool(spool_dir, frames, **kwargs):
+    height, width = frames[0].shape[:2]
+    with SpoolWriter(spool_dir, width, height, framerate=25.0, **kwargs) as writer:
+        for frame in frames:
+            writer.write_frame(frame)
+    return writer
+
+
+def test_spool_round_trip(tmp_path):
+    frames = _frames(5)
+    for compression_level in [0, 1]:
+        spool_dir = str(tmp_path / f"level{compression_level}.spool")
+        _write_spool(spool_dir, frames, compression_level=compression_level, chunk_frames=2)
+
+        reader = SpoolReader(spool_dir)
+        assert len(reader) == 5
+        assert (reader.width, reader.height, reader.framerate) == (16, 12, 25.0)
+        for i, frame in enumerate(frames):
+            np.testing.assert_array_equal(reader.get_frame(i), frame)
+        reader.close()
+
+    # The raw frame file is trimmed to the frames written, not the grown capacity
+    assert os.path.getsize(tmp_path / "level0.spool" / "frames.raw") == 5 * 16 * 12 * 3
+
+    writer = SpoolWriter(str(tmp_path / "bad.spool"), 16, 12)
+    with pytest.raises(ValueError):
+        writer.write_frame(np.zeros((10, 16, 3), dtype=np.uint8))
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.write_frame(frames[0])
+
+
+def test_spool_readable_before_close(tmp_path):
+    frames = _frames(5)
+    for compression_level in [0, 1]:
+        spool_dir = str(tmp_path / f"level{compression_level}.spool")
+        writer = SpoolWriter(spool_dir, 16, 12, compression_level=compression_level, chunk_frames=2)
+        assert len(SpoolReader(spool_dir)) == 0
+
+        # Without close, as after a crash, the frames of finished chunks are readable
+        for frame in frames:
+            writer.write_frame(frame)
+        reader = SpoolReader(spool_dir)
+        assert len(reader) == 4 and not reader.complete
+        np.testing.assert_array_equal(reader.get_frame(3), frames[3])
+        reader.close()
+
+        writer.close()
+        reader = SpoolReader(spool_dir)
+        assert len(reader) == 5 and reader.complete
+        reader.close()
+
+    # Block sizes are appended to their own file instead of rewritten in the metadata
+    assert os.path.getsize(os.path.join(spool_dir, "blocks.bin")) == 5 * 8
+
+
+@pytest.mark.skipif(has_ffmpeg, reason="checks the failure path without ffmpeg")
+def test_encode_job_keeps_spool_on_failure(tmp_path):
+    spool_dir = str(tmp_path / "video.spool")
+    _write_spool(spool_dir, _frames(3))
+
+    job = SpoolEncodeJob(spool_dir, str(tmp_path / "video.mp4"), remove_spool=True)
+    job.start()
+    assert job.wait(timeout=30)
+    assert not job.is_done()
+    assert "ffmpeg not found" in str(job.error)
+    assert len(SpoolReader(spool_dir)) == 3
+
+
+@pytest.mark.skipif(not has_ffmpeg, reason="ffmpeg not installed")
+def test_encode_spool_resume(tmp_path):
+    spool_dir = str(tmp_path / "video.spool")
+    filename = str(tmp_path / "video.mp4")
+    _write_spool(spool_dir, _frames(10))
+
+    progress = []
+    encode_spool(spool_dir, filename, segment_frames=4, progress_callback=lambda *args: progress.append(args))
+    assert os.path.getsize(filename) > 0
+    assert progress[-1] == (10, 10)
+    assert not os.path.exists(os.path.join(spool_dir, "encode.json"))
+
+    # Cancel part way, then resume from the finished segments
+    os.remove(filename)
+
+    class CancelAfter:
+        def __init__(self, count):
+            self.count = count
+
+        def is_set(self):
+            self.count -= 1
+            return self.count < 0
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        encode_spool(spool_dir, filename, segment_frames=4, cancel_event=CancelAfter(6))
+    assert os.path.exists(os.path.join(spool_dir, "encode.json"))
+
+    progress = []
+    encode_spool(spool_dir, filename, segment_frames=4, progress_callback=lambda *args: progress.append(args))
+    assert progress[0] == (4, 10)
+    assert os.path.getsize(filename) > 0
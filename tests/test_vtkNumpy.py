@@ -1,15 +1,18 @@
 """Tests for vtkNumpy module."""
 
 import numpy as np
+import pytest
 import vtk
 
 from director.vtkNumpy import (
     addNumpyToVtk,
     getNumpyFromVtk,
     getNumpyImageFromVtk,
+    getVtkCellArrayFromNumpy,
     getVtkPointsFromNumpy,
     numpyToImageData,
     numpyToPolyData,
+    setPolyDataCells,
 )
 
 
@@ -37,6 +40,46 @@ def test_numpy_to_polydata_with_point_data():
     assert polyData.GetPointData().GetArray("labels") is not None
 
 
+def test_numpy_to_polydata_zero_copy():
+    """Test that contiguous input arrays are shared with the VTK PolyData."""
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0]], dtype=np.float64)
+    labels = np.array([0, 1, 2], dtype=np.int32)
+
+    polyData = numpyToPolyData(points, pointData={"labels": labels})
+
+    assert np.shares_memory(getNumpyFromVtk(polyData, "Points"), points)
+    assert np.shares_memory(getNumpyFromVtk(polyData, "labels"), labels)
+
+    points[1] = [5, 6, 7]
+    assert polyData.GetPoint(1) == (5.0, 6.0, 7.0)
+
+
+def test_numpy_to_polydata_copy():
+    """Test that copy=True detaches the VTK PolyData from the input arrays."""
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0]], dtype=np.float64)
+
+    polyData = numpyToPolyData(points, copy=True)
+    points[1] = [5, 6, 7]
+
+    assert not np.shares_memory(getNumpyFromVtk(polyData, "Points"), points)
+    assert polyData.GetPoint(1) == (1.0, 0.0, 0.0)
+
+
+def test_numpy_to_polydata_vertex_cells():
+    """Test the vertex cells reference each point once, in order."""
+    points = np.random.random((10, 3))[::2]
+
+    polyData = numpyToPolyData(points)
+
+    assert polyData.GetNumberOfPoints() == 5
+    assert polyData.GetNumberOfVerts() == 5
+    for i in range(5):
+        cell = polyData.GetCell(i)
+        assert cell.GetNumberOfPoints() == 1
+        assert cell.GetPointId(0) == i
+    np.testing.assert_array_equal(getNumpyFromVtk(polyData, "Points"), points)
+
+
 def test_get_numpy_from_vtk_points():
     """Test getting numpy array from VTK PolyData points."""
     # Create a simple sphere
@@ -115,3 +158,51 @@ def test_get_vtk_points_from_numpy():
 
     assert vtkPoints is not None
     assert vtkPoints.GetNumberOfPoints() == 3
+
+
+def test_get_vtk_cell_array_from_index_array():
+    """Test building triangle cells from an (N, 3) index array."""
+    faces = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32)
+
+    cells = getVtkCellArrayFromNumpy(cells=faces)
+
+    assert cells.GetNumberOfCells() == 2
+    ids = vtk.vtkIdList()
+    cells.GetCellAtId(1, ids)
+    assert [ids.GetId(i) for i in range(ids.GetNumberOfIds())] == [0, 2, 3]
+
+
+def test_get_vtk_cell_array_from_offsets():
+    """Test building variable sized cells from offsets and connectivity."""
+    cells = getVtkCellArrayFromNumpy(offsets=[0, 2, 5], connectivity=[0, 1, 1, 2, 3])
+
+    assert cells.GetNumberOfCells() == 2
+    ids = vtk.vtkIdList()
+    cells.GetCellAtId(1, ids)
+    assert [ids.GetId(i) for i in range(ids.GetNumberOfIds())] == [1, 2, 3]
+
+
+def test_get_vtk_cell_array_invalid_arguments():
+    """Test that inconsistent cell arguments raise ValueError."""
+    with pytest.raises(ValueError):
+        getVtkCellArrayFromNumpy()
+    with pytest.raises(ValueError):
+        getVtkCellArrayFromNumpy(cells=[0, 1, 2])
+    with pytest.raises(ValueError):
+        getVtkCellArrayFromNumpy(offsets=[0, 4], connectivity=[0, 1, 2])
+
+
+def test_set_polydata_cells():
+    """Test assigning polys and polylines to a PolyData."""
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=np.float64)
+    polyData = numpyToPolyData(points, createVertexCells=False)
+
+    setPolyDataCells(polyData, "polys", cells=[[0, 1, 2], [0, 2, 3]])
+    setPolyDataCells(polyData, "polylines", offsets=[0, 4], connectivity=np.arange(4))
+
+    assert polyData.GetNumberOfPolys() == 2
+    assert polyData.GetNumberOfLines() == 1
+    assert polyData.GetNumberOfVerts() == 0
+
+    with pytest.raises(ValueError):
+        setPolyDataCells(polyData, "bogus", cells=[[0, 1, 2]])
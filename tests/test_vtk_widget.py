@@ -136,3 +136,33 @@ def test_vtk_widget_show_and_close(qapp):
 
     # Verify widget is visible
     assert widget.isVisible()
+
+
+def test_vtk_widget_headless(qapp):
+    """Test rendering and capturing a headless view."""
+    from director import objectmodel as om
+    from director import visualization as vis
+    from director.screen_recorder import capture_screenshot
+
+    widget = VTKWidget(headless=True)
+    assert widget.isHeadless()
+    assert widget.renderWindow().GetOffScreenRendering()
+    assert not VTKWidget().isHeadless()
+
+    om.init()
+    source = vtk.vtkSphereSource()
+    source.Update()
+    obj = vis.showPolyData(source.GetOutput(), "headless sphere", color=[1, 0, 0], view=widget, parent="headless")
+    assert om.findObjectByName("headless sphere") is obj
+
+    widget.resize(80, 60)
+    widget.camera().SetPosition(0, 0, 5)
+    widget.camera().SetFocalPoint(0, 0, 0)
+    widget.camera().SetViewUp(0, 1, 0)
+    widget.forceRender()
+    assert widget.renderWindow().GetSize() == (80, 60)
+
+    image = capture_screenshot(widget)
+    assert image.shape == (60, 80, 3)
+    center = image[30, 40].astype(int)
+    assert center[0] > center[1] + 50